@@ -1,16 +1,20 @@
 """
 Configuration module for interactive-git-versioneer.
 
-Re-exports configuration functions and the interactive config menu.
+Re-exports configuration functions and, lazily, the interactive config menu.
 """
 
 from .config import (
     get_config_path,
     get_config_value,
+    get_config_values,
     load_config,
     save_config,
     set_config_value,
+    set_config_values,
+    editing_config,
     get_ini_config_path,
+    get_ai_cache_path,
     get_prompt_template_path,
     get_prompt_tags_template_path,
     get_ini_value,
@@ -21,15 +25,29 @@ from .config import (
     load_ini_config,
     save_ini_config,
 )
-from .menu import run_config_menu
+
+
+def __getattr__(name: str):
+    # The interactive menu pulls in the terminal UI stack; import it only
+    # when it is actually requested (PEP 562).
+    if name == "run_config_menu":
+        from .menu import run_config_menu
+
+        return run_config_menu
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "get_config_path",
     "load_config",
     "save_config",
     "set_config_value",
+    "set_config_values",
+    "editing_config",
     "get_config_value",
+    "get_config_values",
     "get_ini_config_path",
+    "get_ai_cache_path",
     "get_prompt_template_path",
     "get_prompt_tags_template_path",
     "get_ini_value",
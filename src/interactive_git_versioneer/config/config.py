@@ -6,15 +6,34 @@ Supports both JSON and INI formats.
 """
 
 import configparser
+import contextlib
+import copy
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# Parsed config.json keyed by (path, st_mtime_ns, st_size) of the file it came
+# from, together with its flattened {"SECTION.KEY": value} view.
+_CACHE: Optional[Tuple[tuple, dict, Dict[str, Any]]] = None
+
+# Other files under ~/.igv that are read on every AI request (config.ini and
+# the prompt templates), keyed by path -> (stat key or None, parsed value).
+_FILE_CACHE: Dict[str, Tuple[Optional[tuple], Any]] = {}
+
+
+@functools.lru_cache(maxsize=None)
 def get_config_path() -> Path:
     """Returns the path to the configuration file.
 
+    The result is computed once per process.
+
     Returns:
         Path: The path to ~/.igv/config.json.
     """
@@ -39,50 +58,176 @@ def get_prompt_template_path() -> Path:
     return Path.home() / ".igv" / "prompt.txt"
 
 
+def get_ai_cache_path() -> Path:
+    """Returns the path to the AI response cache database.
+
+    Returns:
+        Path: The path to ~/.igv/ai_cache.sqlite.
+    """
+    return Path.home() / ".igv" / "ai_cache.sqlite"
+
+
+def _stat_key(config_path: Path) -> tuple:
+    """Builds the cache key identifying the current on-disk state of the config."""
+    st: os.stat_result = os.stat(config_path)
+    return (str(config_path), st.st_mtime_ns, st.st_size)
+
+
+def _read_cached(path: Path, parse: Callable[[Path], Any], missing: Any) -> Any:
+    """Returns parse(path), re-running it only when the file has changed.
+
+    Args:
+        path: The file to read.
+        parse: Builds the value from the file; only called when it exists.
+        missing: The value to return when the file does not exist.
+
+    Returns:
+        Any: The cached or freshly parsed value.
+    """
+    try:
+        key: Optional[tuple] = _stat_key(path)
+    except FileNotFoundError:
+        key = None
+    cached: Optional[Tuple[Optional[tuple], Any]] = _FILE_CACHE.get(str(path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    value: Any = missing if key is None else parse(path)
+    _FILE_CACHE[str(path)] = (key, value)
+    return value
+
+
+def _parse_json(data: bytes) -> dict:
+    """Parses raw config.json bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(config: dict) -> bytes:
+    """Serializes the configuration to compact JSON bytes.
+
+    Set the IGV_PRETTY environment variable to write indented JSON instead.
+    """
+    pretty: bool = bool(os.environ.get("IGV_PRETTY"))
+    if orjson is not None:
+        option: int = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(config, option=option)
+    if pretty:
+        return json.dumps(config, indent=2).encode("utf-8")
+    return json.dumps(config).encode("utf-8")
+
+
+def _flatten(config: Any, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yields (dotted_key, value) pairs for every leaf value of a nested config.
+
+    Keys that themselves contain a dot cannot be addressed with dot notation
+    and are skipped.
+    """
+    if not isinstance(config, dict):
+        return
+    for k, v in config.items():
+        if "." in k:
+            continue
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{prefix}{k}.")
+        else:
+            yield f"{prefix}{k}", v
+
+
+def _load_cached() -> dict:
+    """Returns the parsed configuration shared with the cache.
+
+    The file is only parsed again when its modification time or size
+    changes, so callers must not modify the returned dictionary.
+
+    Raises:
+        OSError: If the file exists but cannot be read (e.g. permission denied).
+    """
+    global _CACHE
+    config_path: Path = get_config_path()
+
+    # A single stat both detects a missing file and provides the cache key,
+    # so there is no separate exists() check.
+    try:
+        key: tuple = _stat_key(config_path)
+        if _CACHE is not None and _CACHE[0] == key:
+            return _CACHE[1]
+
+        config: dict = _parse_json(config_path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        # Missing or unparseable file means "no configuration"; other OS
+        # errors (e.g. permissions) are real problems and propagate.
+        return {}
+
+    _CACHE = (key, config, dict(_flatten(config)))
+    return config
+
+
 def load_config() -> dict:
     """Loads the existing configuration.
 
+    The parsed file is cached in memory and reused while its modification
+    time and size are unchanged; each call returns an independent copy.
+
     Returns:
         dict: The loaded configuration or an empty dictionary if it doesn't exist or is invalid.
+
+    Raises:
+        OSError: If the file exists but cannot be read (e.g. permission denied).
     """
-    config_path: Path = get_config_path()
+    return copy.deepcopy(_load_cached())
 
-    if not config_path.exists():
-        return {}
 
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {}
+def _load_flat() -> Dict[str, Any]:
+    """Returns the flattened view of the current configuration."""
+    config: dict = _load_cached()
+    if _CACHE is not None and _CACHE[1] is config:
+        return _CACHE[2]
+    return dict(_flatten(config))
 
 
 def save_config(config: dict) -> None:
     """Saves the given configuration to the file.
 
+    The data is written to a sibling temporary file and then renamed over
+    the target, so an interrupted write never leaves a truncated config.
+
     Args:
         config: The dictionary containing the configuration to save.
     """
+    global _CACHE
     config_path: Path = get_config_path()
 
     # Create directory if it doesn't exist
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    tmp_path: Path = config_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(_dump_json(config))
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
 
+    # Refresh the cache with what was just written to avoid a reload. It
+    # keeps its own copy, so later changes to the caller's dict cannot make
+    # it disagree with the file.
+    saved: dict = copy.deepcopy(config)
+    _CACHE = (_stat_key(config_path), saved, dict(_flatten(saved)))
 
-def set_config_value(key: str, value: str) -> None:
-    """Sets a value in the configuration.
 
-    Supports dot notation for nested keys (e.g., "OPENAI.key").
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Splits a dot-notation key into its parts, memoized for repeated lookups."""
+    return tuple(key.split("."))
 
-    Args:
-        key (str): The key to set (can use dot notation for nested keys, e.g., "SECTION.KEY").
-        value (str): The value to assign to the specified key.
-    """
-    config: dict = load_config()
-    keys: list[str] = key.split(".")
+
+def _assign_dotted(config: dict, key: str, value: str) -> None:
+    """Assigns a value in a config dict using dot notation, creating sections as needed."""
+    keys: Tuple[str, ...] = _split_key(key)
 
     # Navigate/create the nested structure
     current: Any = config
@@ -94,9 +239,55 @@ def set_config_value(key: str, value: str) -> None:
     # Set the final value
     current[keys[-1]] = value
 
+
+def set_config_value(key: str, value: str) -> None:
+    """Sets a value in the configuration.
+
+    Supports dot notation for nested keys (e.g., "OPENAI.key").
+
+    Args:
+        key (str): The key to set (can use dot notation for nested keys, e.g., "SECTION.KEY").
+        value (str): The value to assign to the specified key.
+    """
+    if _load_flat().get(key) == value:
+        return
+
+    config: dict = copy.deepcopy(_load_cached())
+    _assign_dotted(config, key, value)
     save_config(config)
 
 
+def set_config_values(items: Dict[str, str]) -> None:
+    """Sets several values in the configuration with a single load and save.
+
+    Args:
+        items (Dict[str, str]): Mapping of keys (dot notation allowed) to values.
+    """
+    current: dict = _load_cached()
+    config: dict = copy.deepcopy(current)
+    for key, value in items.items():
+        _assign_dotted(config, key, value)
+    if config != current:
+        save_config(config)
+
+
+@contextlib.contextmanager
+def editing_config() -> Iterator[dict]:
+    """Context manager yielding a mutable copy of the configuration.
+
+    The configuration is saved once when the block exits without errors,
+    and only if it was actually modified.
+
+    Yields:
+        dict: The configuration dictionary to edit in place.
+    """
+    current: dict = _load_cached()
+    config: dict = copy.deepcopy(current)
+    yield config
+    if config != current:
+        save_config(config)
+
+
 def get_config_value(key: str) -> Optional[str]:
     """Retrieves a value from the configuration.
 
@@ -108,16 +299,39 @@ def get_config_value(key: str) -> Optional[str]:
     Returns:
         Optional[str]: The found value as a string, or None if it does not exist.
     """
-    config: dict = load_config()
-    keys: list[str] = key.split(".")
+    return _load_flat().get(key)
 
-    current: Any = config
-    for k in keys:
-        if not isinstance(current, dict) or k not in current:
-            return None
-        current = current[k]
 
-    return current if not isinstance(current, dict) else None
+def get_config_values(keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Retrieves several values from the configuration with a single load.
+
+    Args:
+        keys (Iterable[str]): The keys to retrieve (dot notation allowed).
+
+    Returns:
+        Dict[str, Optional[str]]: Mapping of each key to its value, or None if it does not exist.
+    """
+    flat: Dict[str, Any] = _load_flat()
+    return {key: flat.get(key) for key in keys}
+
+
+def _parse_ini(ini_path: Path) -> configparser.ConfigParser:
+    """Parses an INI file, returning an empty parser if it is invalid."""
+    try:
+        parser = configparser.ConfigParser()
+        parser.read(ini_path, encoding="utf-8")
+        return parser
+    except configparser.Error:
+        return configparser.ConfigParser()
+
+
+def _load_ini_cached() -> configparser.ConfigParser:
+    """Returns the parsed config.ini shared between read-only lookups.
+
+    The parser is reused while the file's modification time and size are
+    unchanged, so callers must not modify it.
+    """
+    return _read_cached(get_ini_config_path(), _parse_ini, configparser.ConfigParser())
 
 
 def load_ini_config() -> configparser.ConfigParser:
@@ -131,12 +345,7 @@ def load_ini_config() -> configparser.ConfigParser:
     if not ini_path.exists():
         return configparser.ConfigParser()
 
-    try:
-        parser = configparser.ConfigParser()
-        parser.read(ini_path, encoding="utf-8")
-        return parser
-    except configparser.Error:
-        return configparser.ConfigParser()
+    return _parse_ini(ini_path)
 
 
 def get_ini_value(
@@ -152,7 +361,7 @@ def get_ini_value(
     Returns:
         Optional[str]: The found value, or fallback.
     """
-    parser: configparser.ConfigParser = load_ini_config()
+    parser: configparser.ConfigParser = _load_ini_cached()
     return parser.get(section, key, fallback=fallback)
 
 
@@ -167,7 +376,7 @@ def get_ini_bool(section: str, key: str, fallback: bool = False) -> bool:
     Returns:
         bool: The boolean value.
     """
-    parser: configparser.ConfigParser = load_ini_config()
+    parser: configparser.ConfigParser = _load_ini_cached()
     try:
         return parser.getboolean(section, key)
     except (configparser.Error, AttributeError):
@@ -188,22 +397,22 @@ def save_ini_config(parser: configparser.ConfigParser) -> None:
         parser.write(f)
 
 
+def _read_text(template_path: Path) -> Optional[str]:
+    """Reads a UTF-8 text file, returning None if it cannot be read."""
+    try:
+        with open(template_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except IOError:
+        return None
+
+
 def load_prompt_template() -> Optional[str]:
     """Loads the prompt template from prompt.txt.
 
     Returns:
         Optional[str]: The prompt template content, or None if file doesn't exist.
     """
-    template_path: Path = get_prompt_template_path()
-
-    if not template_path.exists():
-        return None
-
-    try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except IOError:
-        return None
+    return _read_cached(get_prompt_template_path(), _read_text, None)
 
 
 def get_prompt_tags_template_path() -> Path:
@@ -221,16 +430,7 @@ def load_prompt_tags_template() -> Optional[str]:
     Returns:
         Optional[str]: The prompt tags template content, or None if file doesn't exist.
     """
-    template_path: Path = get_prompt_tags_template_path()
-
-    if not template_path.exists():
-        return None
-
-    try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except IOError:
-        return None
+    return _read_cached(get_prompt_tags_template_path(), _read_text, None)
 
 
 def get_tag_detail_level() -> str:
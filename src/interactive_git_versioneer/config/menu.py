@@ -4,19 +4,74 @@ Configuration submenu for interactive-git-versioneer.
 Manages AI configuration and system alias creation.
 """
 
+import functools
+import hashlib
 import os
-import subprocess
+import shutil
 import sys
+import time
 from pathlib import Path
-from subprocess import CompletedProcess
-from typing import Any, List, Literal, Optional, Tuple
-
-from ..core.ui import Colors, Menu, clear_screen, print_header, wait_for_enter
-from .config import get_config_value, load_config, set_config_value
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from ..core.ui import (
+    Colors,
+    Menu,
+    clear_screen,
+    format_header,
+    print_header,
+    wait_for_enter,
+)
+from .config import (
+    get_config_value,
+    get_config_values,
+    load_config,
+    set_config_value,
+    set_config_values,
+)
+
+
+_IS_WINDOWS: bool = sys.platform == "win32"
+_IS_DARWIN: bool = sys.platform == "darwin"
 
 _MODEL_PAGE_SIZE: int = 10
 
+# (base URL fragment, provider name), checked in order by _detect_provider
+_PROVIDERS: Tuple[Tuple[str, str], ...] = (
+    ("groq.com", "Groq"),
+    ("openrouter.ai", "OpenRouter"),
+    ("openai.com", "OpenAI"),
+    ("localhost", "Ollama"),
+    ("127.0.0.1", "Ollama"),
+)
+_MODEL_CACHE_TTL: float = 300.0
+
+# Read size for scanning shell rc files, and how much of the end of the file
+# is searched before the rest
+_RC_READ_SIZE: int = 64 * 1024
+_RC_TAIL_SIZE: int = 16 * 1024
+
+# Model picker navigation keys; anything else is treated as a row number
+_PICKER_ACTIONS: Dict[str, str] = {
+    "": "cancel",
+    "0": "cancel",
+    "n": "next",
+    "p": "prev",
+    "m": "manual",
+    "r": "refresh",
+}
+
+# Provider model lists keyed by (baseURL, sha1 of API key) -> (fetched_at, models)
+_MODEL_CACHE: Dict[Tuple[str, str], Tuple[float, List[dict]]] = {}
+
 
 def _format_ctx(ctx: Optional[int]) -> str:
     """Format a token count as a human-readable string (e.g. 128K, 1M)."""
@@ -67,29 +122,182 @@ def _format_ollama_date(iso_date: str) -> str:
         return "-"
 
 
-def _select_model_interactive() -> Optional[str]:
-    """Show a paginated model picker populated from the provider API.
+def _paint(lines: List[str]) -> None:
+    """Write a whole screen of lines to stdout with a single write and flush.
+
+    Args:
+        lines: The lines to print, without trailing newlines.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _encode(text: str) -> bytes:
+    """Encode text for stdout's byte stream using the terminal's encoding."""
+    return text.encode(
+        getattr(sys.stdout, "encoding", None) or "utf-8", errors="replace"
+    )
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write pre-encoded output straight to stdout's byte buffer and flush.
+
+    Falls back to the text stream when stdout has no underlying buffer
+    (e.g. when it has been replaced by a StringIO).
+
+    Args:
+        data: Output already encoded with ``_encode``.
+    """
+    buffer: Any = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8", errors="replace"))
+        sys.stdout.flush()
+        return
+    # Flush pending text first so these bytes keep their place in the output
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
-    Fetches the model list using the currently configured credentials.
-    Falls back to a manual text prompt if the API call fails.
+
+def _write_status(message: str) -> None:
+    """Show a one-line cyan status message without a trailing newline.
+
+    Args:
+        message: The message to show.
+    """
+    _write_bytes(Colors.CYAN_B + _encode(message) + Colors.RESET_B)
+
+
+def _fetch_models_cached(refresh: bool = False) -> List[dict]:
+    """Return the provider model list, reusing a recent fetch when possible.
+
+    Results are kept for ``_MODEL_CACHE_TTL`` seconds per base URL and API
+    key. Failed fetches (empty lists) are not cached.
+
+    Args:
+        refresh: Ignore any cached entry and query the provider again.
 
     Returns:
-        The selected model id, or None if the user cancels.
+        The list of model dicts as returned by ``list_available_models``.
     """
     from ..core.ai import list_available_models
 
-    print(
-        f"{Colors.CYAN}Fetching available models...{Colors.RESET}", end="", flush=True
+    settings: Dict[str, Optional[str]] = get_config_values(
+        ("OPENAI.baseURL", "OPENAI.key")
+    )
+    cache_key: Tuple[str, str] = (
+        settings["OPENAI.baseURL"] or "",
+        hashlib.sha1((settings["OPENAI.key"] or "").encode()).hexdigest(),
     )
+
+    cached: Optional[Tuple[float, List[dict]]] = _MODEL_CACHE.get(cache_key)
+    if (
+        not refresh
+        and cached is not None
+        and time.monotonic() - cached[0] < _MODEL_CACHE_TTL
+    ):
+        return cached[1]
+
+    _write_status("Fetching available models...")
     models: List[dict] = list_available_models()
     print()
 
+    if models:
+        _MODEL_CACHE[cache_key] = (time.monotonic(), models)
+    else:
+        _MODEL_CACHE.pop(cache_key, None)
+    return models
+
+
+def _render_model_page(
+    page: int,
+    total_pages: int,
+    total: int,
+    page_models: List[dict],
+    current_model: Optional[str],
+) -> str:
+    """Build the full text of one model picker page (header, rows and nav).
+
+    Returns:
+        The page as a single string; its last line is blank.
+    """
+    parts: List[str] = [
+        format_header(
+            f"SELECT MODEL  (page {page + 1}/{total_pages}  —  {total} models)"
+        ),
+        "",
+    ]
+
+    # Column values are computed once per page; the row loop only formats.
+    ids: List[str] = [m["id"] for m in page_models]
+    id_lens: List[int] = [len(mid) for mid in ids]
+    id_col: int = min(max(id_lens, default=20), 45)
+    displays: List[str] = [
+        mid if n <= id_col else mid[: id_col - 2] + ".."
+        for mid, n in zip(ids, id_lens)
+    ]
+    ctx_strs: List[str] = [_format_ctx(m["context_window"]) for m in page_models]
+    owners: List[str] = [(m["owned_by"] or "")[:14] for m in page_models]
+    free_labels: Dict[Optional[bool], str] = {
+        True: f"{Colors.GREEN}Yes{Colors.RESET}",
+        False: "No ",
+        None: "-  ",
+    }
+
+    parts.append(
+        f"  {'#':>2}  {Colors.WHITE}{'Model':<{id_col}}"
+        f"  {Colors.CYAN}{'Context':>7}{Colors.RESET}"
+        f"  {'Provider':<14}  Free"
+    )
+    parts.append(f"  {'─' * (id_col + 36)}")
+
+    current_marker: str = f"{Colors.GREEN}→ {Colors.RESET}"
+    for i, (m, mid, display, ctx_str, owner) in enumerate(
+        zip(page_models, ids, displays, ctx_strs, owners), 1
+    ):
+        marker: str = current_marker if mid == current_model else "  "
+        free_str: str = free_labels.get(m.get("is_free"), "-  ")
+        parts.append(
+            f"{marker}{i:>2}  {Colors.WHITE}{display:<{id_col}}"
+            f"  {Colors.CYAN}{ctx_str:>7}{Colors.RESET}"
+            f"  {owner:<14}  {free_str}"
+        )
+
+    parts.append("")
+    nav: List[str] = []
+    if page < total_pages - 1:
+        nav.append("[n] Next")
+    if page > 0:
+        nav.append("[p] Prev")
+    nav.append("[m] Type manually")
+    nav.append("[r] Refresh")
+    nav.append("[0] Cancel")
+    parts.append(f"  {Colors.WHITE}{'  '.join(nav)}{Colors.RESET}")
+    parts.append("")
+
+    return "\n".join(parts)
+
+
+def _select_model_interactive() -> Optional[str]:
+    """Show a paginated model picker populated from the provider API.
+
+    Fetches the model list using the currently configured credentials,
+    reusing a recent result if one is cached (``r`` forces a refresh).
+    Falls back to a manual text prompt if the API call fails.
+
+    Returns:
+        The selected model id, or None if the user cancels.
+    """
+    models: List[dict] = _fetch_models_cached()
+
     if not models:
-        print(
-            f"{Colors.YELLOW}Could not fetch model list "
-            f"(check OPENAI.key and OPENAI.baseURL).{Colors.RESET}"
+        _paint(
+            [
+                f"{Colors.YELLOW}Could not fetch model list "
+                f"(check OPENAI.key and OPENAI.baseURL).{Colors.RESET}",
+                "",
+            ]
         )
-        print()
         typed: str = input(f"{Colors.WHITE}Enter model name: {Colors.RESET}").strip()
         return typed or None
 
@@ -97,81 +305,65 @@ def _select_model_interactive() -> Optional[str]:
     total: int = len(models)
     total_pages: int = (total + _MODEL_PAGE_SIZE - 1) // _MODEL_PAGE_SIZE
     page: int = 0
+    # page index -> (models on that page, encoded screen); each page is sliced,
+    # rendered and encoded only the first time it is shown.
+    page_cache: Dict[int, Tuple[List[dict], bytes]] = {}
 
     while True:
         clear_screen()
-        start: int = page * _MODEL_PAGE_SIZE
-        page_models: List[dict] = models[start : start + _MODEL_PAGE_SIZE]
-
-        print_header(
-            f"SELECT MODEL  (page {page + 1}/{total_pages}  —  {total} models)"
-        )
-        print()
-
-        id_col: int = min(max((len(m["id"]) for m in page_models), default=20), 45)
-        print(
-            f"  {'#':>2}  {Colors.WHITE}{'Model':<{id_col}}{Colors.RESET}"
-            f"  {Colors.CYAN}{'Context':>7}{Colors.RESET}"
-            f"  {'Provider':<14}  Free"
-        )
-        print(f"  {'─' * (id_col + 36)}")
-
-        for i, m in enumerate(page_models, 1):
-            mid: str = m["id"]
-            display: str = mid if len(mid) <= id_col else mid[: id_col - 2] + ".."
-            ctx_str: str = _format_ctx(m["context_window"])
-            owner: str = (m["owned_by"] or "")[:14]
-            marker: str = (
-                f"{Colors.GREEN}→ {Colors.RESET}" if mid == current_model else "  "
-            )
-            free_val: Optional[bool] = m.get("is_free")
-            if free_val is True:
-                free_str: str = f"{Colors.GREEN}Yes{Colors.RESET}"
-            elif free_val is False:
-                free_str = "No "
-            else:
-                free_str = "-  "
-            print(
-                f"{marker}{i:>2}  {Colors.WHITE}{display:<{id_col}}{Colors.RESET}"
-                f"  {Colors.CYAN}{ctx_str:>7}{Colors.RESET}"
-                f"  {owner:<14}  {free_str}"
+        if page not in page_cache:
+            start: int = page * _MODEL_PAGE_SIZE
+            sliced: List[dict] = models[start : start + _MODEL_PAGE_SIZE]
+            page_cache[page] = (
+                sliced,
+                _encode(
+                    _render_model_page(
+                        page, total_pages, total, sliced, current_model
+                    )
+                    + "\n"
+                ),
             )
-
-        print()
-        nav: List[str] = []
-        if page < total_pages - 1:
-            nav.append("[n] Next")
-        if page > 0:
-            nav.append("[p] Prev")
-        nav.append("[m] Type manually")
-        nav.append("[0] Cancel")
-        print(f"  {Colors.WHITE}{'  '.join(nav)}{Colors.RESET}")
-        print()
+        page_models: List[dict] = page_cache[page][0]
+        _write_bytes(page_cache[page][1])
 
         try:
             sel: str = input(f"{Colors.WHITE}Select: {Colors.RESET}").strip().lower()
         except KeyboardInterrupt:
             return None
 
-        if sel in ("0", ""):
+        action: str = _PICKER_ACTIONS.get(sel, "select")
+
+        if action == "cancel":
             return None
-        elif sel == "n" and page < total_pages - 1:
-            page += 1
-        elif sel == "p" and page > 0:
-            page -= 1
-        elif sel == "m":
+        elif action == "next":
+            page = min(page + 1, total_pages - 1)
+        elif action == "prev":
+            page = max(page - 1, 0)
+        elif action == "manual":
             typed = input(f"{Colors.WHITE}Enter model name: {Colors.RESET}").strip()
             return typed or None
+        elif action == "refresh":
+            refreshed: List[dict] = _fetch_models_cached(refresh=True)
+            if refreshed:
+                models = refreshed
+                total = len(models)
+                total_pages = (total + _MODEL_PAGE_SIZE - 1) // _MODEL_PAGE_SIZE
+                page = min(page, total_pages - 1)
+                page_cache.clear()
         elif sel.isdigit():
+            # Default branch: a row number on the current page
             idx: int = int(sel) - 1
             if 0 <= idx < len(page_models):
                 return page_models[idx]["id"]
             print(f"{Colors.RED}Invalid selection.{Colors.RESET}")
 
 
+@functools.lru_cache(maxsize=16)
 def _detect_provider(base_url: Optional[str]) -> str:
     """Infer the AI provider name from its base URL.
 
+    Memoized, since every status repaint asks about the same URL.
+
     Args:
         base_url: The configured OPENAI.baseURL value.
 
@@ -180,15 +372,7 @@ def _detect_provider(base_url: Optional[str]) -> str:
     """
     if not base_url:
         return "Unknown"
-    if "groq.com" in base_url:
-        return "Groq"
-    if "openrouter.ai" in base_url:
-        return "OpenRouter"
-    if "openai.com" in base_url:
-        return "OpenAI"
-    if "localhost" in base_url or "127.0.0.1" in base_url:
-        return "Ollama"
-    return "Custom"
+    return next((name for frag, name in _PROVIDERS if frag in base_url), "Custom")
 
 
 def run_config_menu() -> None:
@@ -204,19 +388,23 @@ def run_config_menu() -> None:
         This includes whether the API key is configured and the active model.
         For Ollama, also shows context length if available.
         """
-        api_key: Optional[str] = get_config_value("OPENAI.key")
-        base_url: Optional[str] = get_config_value("OPENAI.baseURL")
-        model: Optional[str] = get_config_value("OPENAI.model")
+        settings: Dict[str, Optional[str]] = get_config_values(
+            ("OPENAI.key", "OPENAI.baseURL", "OPENAI.model")
+        )
+        api_key: Optional[str] = settings["OPENAI.key"]
+        base_url: Optional[str] = settings["OPENAI.baseURL"]
+        model: Optional[str] = settings["OPENAI.model"]
+        lines: List[str] = []
 
         if api_key:
             masked_key: str = api_key[:8] + "..." if len(api_key) > 8 else "***"
             provider: str = _detect_provider(base_url)
-            print(f"{Colors.GREEN}AI: {provider} ({masked_key}){Colors.RESET}")
+            lines.append(f"{Colors.GREEN}AI: {provider} ({masked_key}){Colors.RESET}")
         else:
-            print(f"{Colors.YELLOW}AI: Not configured{Colors.RESET}")
+            lines.append(f"{Colors.YELLOW}AI: Not configured{Colors.RESET}")
 
         if model:
-            print(f"{Colors.WHITE}Model: {model}{Colors.RESET}")
+            lines.append(f"{Colors.WHITE}Model: {model}{Colors.RESET}")
 
             if provider == "Ollama" and model:
                 from ..core.ai import get_ollama_model_details
@@ -225,9 +413,13 @@ def run_config_menu() -> None:
                 if details and details.get("context_length"):
                     ctx: int = details["context_length"]
                     ctx_str: str = f"{ctx:,}" if ctx else "-"
-                    print(f"{Colors.CYAN}  Context: {ctx_str} tokens{Colors.RESET}")
+                    lines.append(
+                        f"{Colors.CYAN}  Context: {ctx_str} tokens{Colors.RESET}"
+                    )
                 else:
-                    print(f"{Colors.YELLOW}  Context: unavailable{Colors.RESET}")
+                    lines.append(f"{Colors.YELLOW}  Context: unavailable{Colors.RESET}")
+
+        _paint(lines)
 
     def action_show_config() -> Literal[False]:
         """Displays the current configuration loaded from the configuration file.
@@ -239,24 +431,26 @@ def run_config_menu() -> None:
             Literal[False]: Always returns False to keep the configuration menu open.
         """
         clear_screen()
-        print_header("CURRENT CONFIGURATION")
-        print()
+        lines: List[str] = [format_header("CURRENT CONFIGURATION"), ""]
 
         # ── AI integration summary (derived from config) ──────────────────
-        ai_key: Optional[str] = get_config_value("OPENAI.key")
-        ai_url: Optional[str] = get_config_value("OPENAI.baseURL")
-        ai_model: Optional[str] = get_config_value("OPENAI.model")
+        settings: Dict[str, Optional[str]] = get_config_values(
+            ("OPENAI.key", "OPENAI.baseURL", "OPENAI.model")
+        )
+        ai_key: Optional[str] = settings["OPENAI.key"]
+        ai_url: Optional[str] = settings["OPENAI.baseURL"]
+        ai_model: Optional[str] = settings["OPENAI.model"]
 
         provider: str = _detect_provider(ai_url)
         provider_color: str = Colors.GREEN if ai_key else Colors.YELLOW
         provider_label: str = provider if ai_key else "Not configured"
 
-        print(f"{Colors.CYAN}AI:{Colors.RESET}")
-        print(
+        lines.append(f"{Colors.CYAN}AI:{Colors.RESET}")
+        lines.append(
             f"  {Colors.WHITE}Proveedor actual:      {Colors.RESET}"
             f"{provider_color}{provider_label}{Colors.RESET}"
         )
-        print(
+        lines.append(
             f"  {Colors.WHITE}Proveedores disponibles:{Colors.RESET}"
             f" {Colors.YELLOW}Groq{Colors.RESET}"
             f" · {Colors.YELLOW}OpenRouter{Colors.RESET}"
@@ -265,20 +459,20 @@ def run_config_menu() -> None:
             f" · {Colors.YELLOW}Custom{Colors.RESET}"
         )
         if ai_model:
-            print(
+            lines.append(
                 f"  {Colors.WHITE}Modelo activo:         {Colors.RESET}"
                 f"{Colors.GREEN}{ai_model}{Colors.RESET}"
             )
-        print()
+        lines.append("")
 
         # ── Raw stored configuration ──────────────────────────────────────
         config: dict = load_config()
 
         if not config:
-            print(f"{Colors.YELLOW}No configuration saved.{Colors.RESET}")
+            lines.append(f"{Colors.YELLOW}No configuration saved.{Colors.RESET}")
         else:
             for section, values in config.items():
-                print(f"{Colors.CYAN}{section}:{Colors.RESET}")
+                lines.append(f"{Colors.CYAN}{section}:{Colors.RESET}")
                 if isinstance(values, dict):
                     for key, value in values.items():
                         # Partially hide API keys
@@ -288,14 +482,15 @@ def run_config_menu() -> None:
                             )
                         else:
                             display_value = value
-                        print(
+                        lines.append(
                             f"  {Colors.WHITE}{key}: {Colors.GREEN}{display_value}{Colors.RESET}"
                         )
                 else:
-                    print(f"  {Colors.GREEN}{values}{Colors.RESET}")
-                print()
+                    lines.append(f"  {Colors.GREEN}{values}{Colors.RESET}")
+                lines.append("")
 
-        print()
+        lines.append("")
+        _paint(lines)
         wait_for_enter()
         return False
 
@@ -309,23 +504,27 @@ def run_config_menu() -> None:
             Literal[False]: Always returns False to ensure the configuration menu remains active.
         """
         clear_screen()
-        print_header("CONFIGURE AI (Groq/OpenRouter/OpenAI/Ollama)")
-        print()
-
-        print(f"{Colors.WHITE}Current configuration:{Colors.RESET}")
-        current_key: Optional[str] = get_config_value("OPENAI.key")
-        current_url: Optional[str] = get_config_value("OPENAI.baseURL")
-        current_model: Optional[str] = get_config_value("OPENAI.model")
+        lines: List[str] = [
+            format_header("CONFIGURE AI (Groq/OpenRouter/OpenAI/Ollama)"),
+            "",
+            f"{Colors.WHITE}Current configuration:{Colors.RESET}",
+        ]
+        settings: Dict[str, Optional[str]] = get_config_values(
+            ("OPENAI.key", "OPENAI.baseURL", "OPENAI.model")
+        )
+        current_key: Optional[str] = settings["OPENAI.key"]
+        current_url: Optional[str] = settings["OPENAI.baseURL"]
+        current_model: Optional[str] = settings["OPENAI.model"]
 
         if current_key:
-            print(f"  API Key: {Colors.GREEN}{current_key[:8]}...{Colors.RESET}")
+            lines.append(f"  API Key: {Colors.GREEN}{current_key[:8]}...{Colors.RESET}")
         else:
-            print(f"  API Key: {Colors.YELLOW}Not configured{Colors.RESET}")
+            lines.append(f"  API Key: {Colors.YELLOW}Not configured{Colors.RESET}")
 
-        print(
+        lines.append(
             f"  Base URL: {Colors.CYAN}{current_url or 'Not configured'}{Colors.RESET}"
         )
-        print(
+        lines.append(
             f"  Model: {Colors.CYAN}{current_model or 'Not configured'}{Colors.RESET}"
         )
 
@@ -339,99 +538,122 @@ def run_config_menu() -> None:
             details: Optional[dict] = get_ollama_model_details(current_model)
             if details and details.get("context_length"):
                 ctx: int = details["context_length"]
-                print(f"  Context: {Colors.CYAN}{ctx:,} tokens{Colors.RESET}")
+                lines.append(f"  Context: {Colors.CYAN}{ctx:,} tokens{Colors.RESET}")
             else:
-                print(f"  Context: {Colors.YELLOW}unavailable{Colors.RESET}")
+                lines.append(f"  Context: {Colors.YELLOW}unavailable{Colors.RESET}")
+
+        lines += [
+            "",
+            f"{Colors.WHITE}What do you want to configure?{Colors.RESET}",
+            "  1. API Key",
+            "  2. Base URL",
+            "  3. Model",
+            "  4. Quick setup (Groq)",
+            "  5. Quick setup (OpenRouter)",
+            "  6. Quick setup (Ollama - local)",
+            "  0. Back",
+            "",
+        ]
+        _paint(lines)
 
-        print()
+        choice: str = input(f"{Colors.WHITE}Select option: {Colors.RESET}").strip()
 
-        print(f"{Colors.WHITE}What do you want to configure?{Colors.RESET}")
-        print(f"  1. API Key")
-        print(f"  2. Base URL")
-        print(f"  3. Model")
-        print(f"  4. Quick setup (Groq)")
-        print(f"  5. Quick setup (OpenRouter)")
-        print(f"  6. Quick setup (Ollama - local)")
-        print(f"  0. Back")
-        print()
+        handlers: Dict[str, Callable[[], None]] = {
+            "1": _set_api_key,
+            "2": _set_base_url,
+            "3": _set_model,
+            "4": _quick_setup_groq,
+            "5": _quick_setup_openrouter,
+            "6": _configure_ollama,
+        }
+        handlers.get(choice, lambda: None)()
 
-        choice: str = input(f"{Colors.WHITE}Select option: {Colors.RESET}").strip()
+        print()
+        wait_for_enter()
+        return False
 
-        if choice == "1":
-            new_key: str = input(f"{Colors.WHITE}Enter API Key: {Colors.RESET}").strip()
-            if new_key:
-                set_config_value("OPENAI.key", new_key)
-                print(f"{Colors.GREEN}✓ API Key saved{Colors.RESET}")
-
-        elif choice == "2":
-            print(f"{Colors.CYAN}Examples:{Colors.RESET}")
-            print(f"  Groq:       https://api.groq.com/openai/v1")
-            print(f"  OpenRouter: https://openrouter.ai/api/v1")
-            print(f"  OpenAI:     https://api.openai.com/v1")
-            new_url: str = input(
-                f"{Colors.WHITE}Enter Base URL: {Colors.RESET}"
-            ).strip()
-            if new_url:
-                set_config_value("OPENAI.baseURL", new_url)
-                print(f"{Colors.GREEN}✓ Base URL saved{Colors.RESET}")
-
-        elif choice == "3":
-            selected_model: Optional[str] = _select_model_interactive()
-            if selected_model:
-                set_config_value("OPENAI.model", selected_model)
-                clear_screen()
-                print_header("CONFIGURE AI (Groq/OpenRouter/OpenAI/Ollama)")
-                print()
-                print(f"{Colors.GREEN}✓ Model saved: {selected_model}{Colors.RESET}")
-
-        elif choice == "4":
-            print()
-            print(f"{Colors.CYAN}Quick setup for Groq{Colors.RESET}")
-            print(
-                f"{Colors.WHITE}Get your API key at: https://console.groq.com/keys{Colors.RESET}"
+    def _set_api_key() -> None:
+        """Prompts for and stores a new API key."""
+        new_key: str = input(f"{Colors.WHITE}Enter API Key: {Colors.RESET}").strip()
+        if new_key:
+            set_config_value("OPENAI.key", new_key)
+            print(f"{Colors.GREEN}✓ API Key saved{Colors.RESET}")
+
+    def _set_base_url() -> None:
+        """Prompts for and stores a new base URL."""
+        _paint(
+            [
+                f"{Colors.CYAN}Examples:{Colors.RESET}",
+                "  Groq:       https://api.groq.com/openai/v1",
+                "  OpenRouter: https://openrouter.ai/api/v1",
+                "  OpenAI:     https://api.openai.com/v1",
+            ]
+        )
+        new_url: str = input(f"{Colors.WHITE}Enter Base URL: {Colors.RESET}").strip()
+        if new_url:
+            set_config_value("OPENAI.baseURL", new_url)
+            print(f"{Colors.GREEN}✓ Base URL saved{Colors.RESET}")
+
+    def _set_model() -> None:
+        """Lets the user pick a model from the provider and stores it."""
+        selected_model: Optional[str] = _select_model_interactive()
+        if selected_model:
+            set_config_value("OPENAI.model", selected_model)
+            print(f"{Colors.GREEN}✓ Model saved: {selected_model}{Colors.RESET}")
+
+    def _quick_setup_groq() -> None:
+        """Configures key, base URL and default model for Groq in one step."""
+        _paint(
+            [
+                "",
+                f"{Colors.CYAN}Quick setup for Groq{Colors.RESET}",
+                f"{Colors.WHITE}Get your API key at: https://console.groq.com/keys{Colors.RESET}",
+                "",
+            ]
+        )
+        api_key_input: str = input(
+            f"{Colors.WHITE}Enter your Groq API Key: {Colors.RESET}"
+        ).strip()
+        if api_key_input:
+            set_config_values(
+                {
+                    "OPENAI.key": api_key_input,
+                    "OPENAI.baseURL": "https://api.groq.com/openai/v1",
+                    "OPENAI.model": "llama-3.3-70b-versatile",
+                }
             )
             print()
-            api_key_input: str = input(
-                f"{Colors.WHITE}Enter your Groq API Key: {Colors.RESET}"
-            ).strip()
-            if api_key_input:
-                set_config_value("OPENAI.key", api_key_input)
-                set_config_value("OPENAI.baseURL", "https://api.groq.com/openai/v1")
-                set_config_value("OPENAI.model", "llama-3.3-70b-versatile")
-                print()
-                print(f"{Colors.GREEN}✓ Groq configuration completed{Colors.RESET}")
-
-        elif choice == "5":
-            print()
-            print(f"{Colors.CYAN}Quick setup for OpenRouter{Colors.RESET}")
-            print(
-                f"{Colors.WHITE}Get your API key at: https://openrouter.ai/keys{Colors.RESET}"
+            print(f"{Colors.GREEN}✓ Groq configuration completed{Colors.RESET}")
+
+    def _quick_setup_openrouter() -> None:
+        """Configures key, base URL and default model for OpenRouter in one step."""
+        _paint(
+            [
+                "",
+                f"{Colors.CYAN}Quick setup for OpenRouter{Colors.RESET}",
+                f"{Colors.WHITE}Get your API key at: https://openrouter.ai/keys{Colors.RESET}",
+                f"{Colors.WHITE}Hundreds of models available at: https://openrouter.ai/models{Colors.RESET}",
+                "",
+            ]
+        )
+        api_key_input: str = input(
+            f"{Colors.WHITE}Enter your OpenRouter API Key: {Colors.RESET}"
+        ).strip()
+        if api_key_input:
+            set_config_values(
+                {
+                    "OPENAI.key": api_key_input,
+                    "OPENAI.baseURL": "https://openrouter.ai/api/v1",
+                    "OPENAI.model": "meta-llama/llama-3.3-70b-instruct",
+                }
             )
-            print(
-                f"{Colors.WHITE}Hundreds of models available at: https://openrouter.ai/models{Colors.RESET}"
+            _paint(
+                [
+                    "",
+                    f"{Colors.GREEN}✓ OpenRouter configuration completed{Colors.RESET}",
+                    f"{Colors.WHITE}Default model: meta-llama/llama-3.3-70b-instruct{Colors.RESET}",
+                ]
             )
-            print()
-            api_key_input = input(
-                f"{Colors.WHITE}Enter your OpenRouter API Key: {Colors.RESET}"
-            ).strip()
-            if api_key_input:
-                set_config_value("OPENAI.key", api_key_input)
-                set_config_value("OPENAI.baseURL", "https://openrouter.ai/api/v1")
-                set_config_value("OPENAI.model", "meta-llama/llama-3.3-70b-instruct")
-                print()
-                print(
-                    f"{Colors.GREEN}✓ OpenRouter configuration completed{Colors.RESET}"
-                )
-                print(
-                    f"{Colors.WHITE}Default model: meta-llama/llama-3.3-70b-instruct{Colors.RESET}"
-                )
-
-        elif choice == "6":
-            _configure_ollama()
-
-        print()
-        wait_for_enter()
-        return False
 
     def _configure_ollama() -> None:
         """Interactive Ollama configuration with model discovery."""
@@ -463,8 +685,7 @@ def run_config_menu() -> None:
         if url_input:
             base_url = url_input
 
-        set_config_value("OPENAI.baseURL", base_url)
-        set_config_value("OPENAI.key", "ollama")
+        set_config_values({"OPENAI.baseURL": base_url, "OPENAI.key": "ollama"})
         print(f"{Colors.GREEN}✓ Base URL saved: {base_url}{Colors.RESET}")
         print()
 
@@ -595,10 +816,7 @@ def run_config_menu() -> None:
         print_header("ADD 'igv' ALIAS TO SYSTEM")
         print()
 
-        # Detectar sistema operativo
-        is_windows: bool = sys.platform == "win32"
-
-        if is_windows:
+        if _IS_WINDOWS:
             _add_alias_windows()
         else:
             _add_alias_unix()
@@ -706,14 +924,12 @@ def _add_alias_windows() -> None:
     print(f"{Colors.CYAN}System detected: Windows{Colors.RESET}")
     print()
 
-    # Check if already installed as a command
-    result: subprocess.CompletedProcess = subprocess.run(
-        ["where", "igv"], capture_output=True, text=True, shell=True
-    )
+    # Check if already installed as a command (in-process PATH scan)
+    found: Optional[str] = shutil.which("igv")
 
-    if result.returncode == 0:
+    if found:
         print(f"{Colors.GREEN}✓ The 'igv' command is already available:{Colors.RESET}")
-        print(f"  {result.stdout.strip()}")
+        print(f"  {found}")
         return
 
     # Check if igv.exe exists but is not in PATH
@@ -792,42 +1008,33 @@ def _find_igv_executable() -> Optional[Path]:
     locations where Python packages and their executables are typically installed.
     These include the standard Python 'Scripts' directory, paths associated with
     Microsoft Store Python installations, and user-specific pip installation
-    directories (e.g., `%APPDATA%\\Python\\Scripts`).
+    directories (e.g., `%APPDATA%\\Python\\Scripts`). Candidates are produced
+    lazily, so the search stops at the first hit without scanning the rest.
 
     Returns:
         Optional[Path]: Returns a `Path` object pointing to 'igv.exe' if found,
                         otherwise returns `None`.
     """
-    possible_paths: list[Path] = []
-
-    # Standard Scripts path
-    standard_scripts: Path = Path(sys.executable).parent / "Scripts" / "igv.exe"
-    possible_paths.append(standard_scripts)
-
-    # Microsoft Store Python
-    local_packages: Path = Path.home() / "AppData" / "Local" / "Packages"
-    if local_packages.exists():
-        for pkg in local_packages.iterdir():
-            if pkg.name.startswith("PythonSoftwareFoundation.Python"):
-                ms_store_scripts: Path = pkg / "LocalCache" / "local-packages"
-                if ms_store_scripts.exists():
-                    for python_ver in ms_store_scripts.iterdir():
-                        igv_path: Path = python_ver / "Scripts" / "igv.exe"
-                        possible_paths.append(igv_path)
-
-    # pip --user install location
-    user_scripts: Path = Path.home() / "AppData" / "Roaming" / "Python"
-    if user_scripts.exists():
-        for python_ver in user_scripts.iterdir():
-            igv_path: Path = python_ver / "Scripts" / "igv.exe"
-            possible_paths.append(igv_path)
-
-    # Search through the paths
-    for path in possible_paths:
-        if path.exists():
-            return path
-
-    return None
+
+    def _candidates() -> Iterator[Path]:
+        # Standard Scripts path, the common case, is yielded before any
+        # directory scan happens.
+        yield Path(sys.executable).parent / "Scripts" / "igv.exe"
+
+        # Microsoft Store Python; glob lets the OS filter directory names
+        # (and yields nothing when the folder does not exist).
+        local_packages: Path = Path.home() / "AppData" / "Local" / "Packages"
+        for pkg in local_packages.glob("PythonSoftwareFoundation.Python*"):
+            ms_store_scripts: Path = pkg / "LocalCache" / "local-packages"
+            for python_ver in ms_store_scripts.glob("Python*"):
+                yield python_ver / "Scripts" / "igv.exe"
+
+        # pip --user install location
+        user_scripts: Path = Path.home() / "AppData" / "Roaming" / "Python"
+        for python_ver in user_scripts.glob("Python*"):
+            yield python_ver / "Scripts" / "igv.exe"
+
+    return next((path for path in _candidates() if path.exists()), None)
 
 
 def _add_to_path_windows(scripts_dir: Path) -> None:
@@ -842,11 +1049,14 @@ def _add_to_path_windows(scripts_dir: Path) -> None:
         scripts_dir (Path): The `Path` object representing the directory
                             to be added to the user's PATH.
     """
+    # Only this rarely used action spawns a process, so the import is deferred
+    import subprocess
+
     try:
         # Execute PowerShell to add to PATH
         ps_command: str = f'[Environment]::SetEnvironmentVariable("Path", $env:Path + ";{scripts_dir}", "User")'
 
-        result: CompletedProcess = subprocess.run(
+        result: subprocess.CompletedProcess = subprocess.run(
             ["powershell", "-Command", ps_command], capture_output=True, text=True
         )
 
@@ -955,8 +1165,10 @@ def _create_powershell_function() -> None:
 
     # Check if the function already exists
     if profile_path.exists():
-        content: str = profile_path.read_text(encoding="utf-8", errors="ignore")
-        if "function igv" in content:
+        # Stream the profile and stop at the first matching line
+        with open(profile_path, "r", encoding="utf-8", errors="ignore") as f:
+            found: bool = any("function igv" in line for line in f)
+        if found:
             print(
                 f"{Colors.GREEN}✓ The 'igv' function already exists in the profile{Colors.RESET}"
             )
@@ -985,6 +1197,65 @@ def _create_powershell_function() -> None:
         print(f"  {function_code.strip()}")
 
 
+def _rc_has_alias(rc_file: Path) -> bool:
+    """Checks whether a shell rc file already defines the 'igv' alias.
+
+    The alias is normally appended at the end of the file, so the last
+    ``_RC_TAIL_SIZE`` bytes are searched first and the rest of the file is
+    only read on a miss. The file is scanned as raw bytes, so it does not
+    need to be valid UTF-8.
+
+    Args:
+        rc_file (Path): The shell configuration file (e.g. ~/.bashrc).
+
+    Returns:
+        bool: True if the file contains an 'alias igv=' definition.
+    """
+    needle: bytes = b"alias igv="
+    try:
+        fd: int = os.open(str(rc_file), os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        size: int = os.fstat(fd).st_size
+        tail_start: int = max(0, size - _RC_TAIL_SIZE)
+        os.lseek(fd, tail_start, os.SEEK_SET)
+        tail: bytes = os.read(fd, _RC_TAIL_SIZE)
+        if tail.rfind(needle) != -1:
+            return True
+        if tail_start == 0:
+            return False
+
+        # Read the head, overlapping the tail so a match split across the
+        # boundary is still found
+        os.lseek(fd, 0, os.SEEK_SET)
+        head_size: int = tail_start + len(needle) - 1
+        chunks: List[bytes] = []
+        while head_size > 0:
+            chunk: bytes = os.read(fd, min(_RC_READ_SIZE, head_size))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            head_size -= len(chunk)
+    finally:
+        os.close(fd)
+    return needle in b"".join(chunks)
+
+
+def _append_to_rc(rc_file: Path, text: str) -> None:
+    """Appends text to a shell rc file, creating it if needed.
+
+    Args:
+        rc_file (Path): The shell configuration file.
+        text (str): The text to append.
+    """
+    fd: int = os.open(str(rc_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
 def _add_alias_unix() -> None:
     """Configures the 'igv' command alias for Unix-like operating systems (Linux/macOS).
 
@@ -996,18 +1267,16 @@ def _add_alias_unix() -> None:
     sourcing the configuration file or restarting their terminal.
     """
     print(
-        f"{Colors.CYAN}System detected: {'macOS' if sys.platform == 'darwin' else 'Linux'}{Colors.RESET}"
+        f"{Colors.CYAN}System detected: {'macOS' if _IS_DARWIN else 'Linux'}{Colors.RESET}"
     )
     print()
 
-    # Check if the command already exists
-    result: CompletedProcess = subprocess.run(
-        ["which", "igv"], capture_output=True, text=True
-    )
+    # Check if the command already exists (in-process PATH scan)
+    found: Optional[str] = shutil.which("igv")
 
-    if result.returncode == 0:
+    if found:
         print(f"{Colors.GREEN}✓ The 'igv' command is already available:{Colors.RESET}")
-        print(f"  {result.stdout.strip()}")
+        print(f"  {found}")
         return
 
     # Detect shell
@@ -1024,16 +1293,14 @@ def _add_alias_unix() -> None:
     print()
 
     # Check if alias already exists
-    if rc_file.exists():
-        content: str = rc_file.read_text()
-        if "alias igv=" in content:
-            print(
-                f"{Colors.GREEN}✓ The alias already exists in {rc_file.name}{Colors.RESET}"
-            )
-            print(
-                f"{Colors.WHITE}Run 'source {rc_file}' or restart your terminal{Colors.RESET}"
-            )
-            return
+    if _rc_has_alias(rc_file):
+        print(
+            f"{Colors.GREEN}✓ The alias already exists in {rc_file.name}{Colors.RESET}"
+        )
+        print(
+            f"{Colors.WHITE}Run 'source {rc_file}' or restart your terminal{Colors.RESET}"
+        )
+        return
 
     print(
         f"{Colors.YELLOW}The following line will be added to {rc_file.name}:{Colors.RESET}"
@@ -1047,8 +1314,9 @@ def _add_alias_unix() -> None:
 
     if choice == "y":
         try:
-            with open(rc_file, "a") as f:
-                f.write(f"\n# Interactive Git Versioneer alias\n{alias_line}\n")
+            _append_to_rc(
+                rc_file, f"\n# Interactive Git Versioneer alias\n{alias_line}\n"
+            )
             print()
             print(f"{Colors.GREEN}✓ Alias added to {rc_file.name}{Colors.RESET}")
             print()
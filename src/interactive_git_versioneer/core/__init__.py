@@ -4,14 +4,25 @@ Core module for interactive-git-versioneer.
 Re-exports shared components: AI integration, Git operations, data models, and UI utilities.
 """
 
-from .ai import determine_version_type, generate_tag_message, get_ai_service
+from .ai import (
+    determine_version_type,
+    determine_version_types_parallel,
+    generate_tag_message,
+    generate_tag_messages_batch,
+    generate_tag_messages_parallel,
+    get_ai_service,
+    get_ai_service_for,
+    reset_ai_service_cache,
+)
 from .git_ops import (
+    count_untagged_commits,
     get_commit_diff,
     get_git_repo,
     get_last_tag,
     get_last_version_number,
     get_next_version,
     get_untagged_commits,
+    iter_untagged_commits,
     parse_version,
 )
 from .logger import DebugLogger, get_logger, is_logging_enabled
@@ -21,6 +32,7 @@ from .ui import (
     Menu,
     MenuItem,
     clear_screen,
+    format_header,
     get_menu_input,
     input_multiline,
     print_header,
@@ -33,14 +45,21 @@ from .ui import (
 __all__ = [
     # AI
     "get_ai_service",
+    "get_ai_service_for",
+    "reset_ai_service_cache",
     "generate_tag_message",
+    "generate_tag_messages_batch",
+    "generate_tag_messages_parallel",
     "determine_version_type",
+    "determine_version_types_parallel",
     # Git operations
     "get_git_repo",
     "get_last_tag",
     "get_last_version_number",
     "get_next_version",
     "get_untagged_commits",
+    "iter_untagged_commits",
+    "count_untagged_commits",
     "get_commit_diff",
     "parse_version",
     # Logger
@@ -54,6 +73,7 @@ __all__ = [
     "Menu",
     "MenuItem",
     "clear_screen",
+    "format_header",
     "print_header",
     "print_subheader",
     "print_info",
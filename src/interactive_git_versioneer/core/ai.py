@@ -1,7 +1,31 @@
-from typing import Any, FrozenSet, Optional, Tuple
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import json
+import operator
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from ..config import (
+    get_ai_cache_path,
     get_config_value,
+    get_config_values,
     get_ini_value,
     get_ini_bool,
     load_prompt_template,
@@ -30,6 +54,136 @@ _GROQ_FREE_MODELS: FrozenSet[str] = frozenset(
     }
 )
 
+# Diff characters sent to the model. Slicing a str that is already short
+# enough returns the same object, so no length check is needed before it.
+_TAG_DIFF_LIMIT: int = 2000
+_VERSION_DIFF_LIMIT: int = 1500
+
+# HTTP/2 needs the optional h2 package (pip install interactive-git-versioneer[fast])
+_HTTP2: bool = importlib.util.find_spec("h2") is not None
+
+# Built-in prompts, used when no ~/.igv template overrides them. Filled with
+# str.format_map, so literal braces in the text must be doubled.
+_TAG_PROMPT_TEMPLATE: str = """Generate a comprehensive git tag message (release note) based on the following commit.
+
+Rules:
+- Maximum {max_length} characters for the subject line
+- Use imperative mood (e.g., "Add", "Fix", "Update", "Remove", "Refactor")
+- No emojis, no decorations, no special characters
+- No period at the end of the subject line
+- Be specific about what changed, not why
+- Language: {locale}
+
+Format: {version_type}
+
+Generate a {detail_level} detailed message with conventional commit format.
+
+Original commit message: {commit_message}
+
+Diff:
+```
+{diff_truncated}
+```
+
+Output only the tag message. No explanations, no alternatives, no additional text."""
+
+_CONCISE_PROMPT_TEMPLATE: str = """Generate a concise git tag message based on the following diff.
+
+Rules:
+- Maximum {max_length} characters
+- Use imperative mood (e.g., "Add", "Fix", "Update", "Remove", "Refactor")
+- No emojis, no decorations, no special characters
+- No period at the end
+- Be specific about what changed, not why
+- Language: {locale}
+- Version type context: {version_type}
+
+Original commit message: {commit_message}
+
+Diff:
+```
+{diff_truncated}
+```
+
+Output only the tag message. No explanations, no alternatives, no additional text."""
+
+_VERSION_PROMPT_TEMPLATE: str = """Classify this git commit into semantic version type.
+
+Commit message: {commit_message}
+
+Diff:
+```
+{diff_truncated}
+```
+
+Rules:
+- major: breaking changes, API changes, major restructuring
+- minor: new features, significant improvements (backwards compatible)
+- patch: bug fixes, docs, small refactoring, maintenance
+
+Output format (exactly 2 lines):
+TYPE: [major|minor|patch]
+REASON: [max 10 words in Spanish]"""
+
+# Labels of a version type response ("TYPE: minor" / "RAZÓN: ...")
+_PREFIX_MAP: Dict[str, str] = {
+    "type": "TYPE",
+    "tipo": "TYPE",
+    "reason": "REASON",
+    "razón": "REASON",
+    "razon": "REASON",
+}
+_VERSION_TYPES: FrozenSet[str] = frozenset({"major", "minor", "patch"})
+
+# Conventional Commits prefix, e.g. "feat(ui)!:"
+_CC_RE = re.compile(r"^\s*(?P<type>[a-z]+)(?:\([^)]*\))?(?P<bang>!)?:", re.IGNORECASE)
+_CC_VERSION_TYPES: Dict[str, str] = {
+    "feat": "minor",
+    "fix": "patch",
+    "docs": "patch",
+    "style": "patch",
+    "test": "patch",
+    "build": "patch",
+    "ci": "patch",
+    "chore": "patch",
+}
+
+# "<n>: <message>" lines in a batched tag message response
+_BATCH_LINE_RE = re.compile(r"^\s*(\d+)\s*[:.)-]\s*(.+?)\s*$")
+
+
+def _build_batch_prompt(
+    items: Sequence[Tuple[str, str, str]],
+    max_length: int,
+    locale: str,
+    detail_level: str,
+) -> str:
+    sections: List[str] = []
+    for i, (commit_message, commit_diff, version_type) in enumerate(items, 1):
+        diff_truncated: str = commit_diff[:_TAG_DIFF_LIMIT]
+        sections.append(
+            f"Commit {i} (version type: {version_type})\n"
+            f"Original commit message: {commit_message}\n"
+            f"Diff:\n```\n{diff_truncated}\n```"
+        )
+    joined: str = "\n\n".join(sections)
+
+    return f"""Generate one git tag message for each of the following {len(items)} commits.
+
+Rules:
+- Maximum {max_length} characters per message
+- Use imperative mood (e.g., "Add", "Fix", "Update", "Remove", "Refactor")
+- No emojis, no decorations, no special characters
+- No period at the end
+- Be specific about what changed, not why
+- Language: {locale}
+
+Generate {detail_level} detailed messages with conventional commit format.
+
+{joined}
+
+Output exactly {len(items)} lines, one per commit, formatted as "<number>: <tag message>". No explanations, no additional text."""
+
 
 def _build_prompt_from_template(
     commit_message: str,
@@ -46,7 +200,7 @@ def _build_prompt_from_template(
         template = load_prompt_template()
         detail_level = "concise"
 
-    diff_truncated: str = commit_diff[:2000] if len(commit_diff) > 2000 else commit_diff
+    diff_truncated: str = commit_diff[:_TAG_DIFF_LIMIT]
 
     if template:
         try:
@@ -63,65 +217,324 @@ def _build_prompt_from_template(
             pass
 
     if is_tag:
-        return f"""Generate a comprehensive git tag message (release note) based on the following commit.
+        return _TAG_PROMPT_TEMPLATE.format_map(
+            {
+                "max_length": max_length,
+                "locale": locale,
+                "version_type": version_type,
+                "detail_level": detail_level,
+                "commit_message": commit_message,
+                "diff_truncated": diff_truncated,
+            }
+        )
 
-Rules:
-- Maximum {max_length} characters for the subject line
-- Use imperative mood (e.g., "Add", "Fix", "Update", "Remove", "Refactor")
-- No emojis, no decorations, no special characters
-- No period at the end of the subject line
-- Be specific about what changed, not why
-- Language: {locale}
+    return _CONCISE_PROMPT_TEMPLATE.format_map(
+        {
+            "max_length": max_length,
+            "locale": locale,
+            "version_type": version_type,
+            "commit_message": commit_message,
+            "diff_truncated": diff_truncated,
+        }
+    )
 
-Format: {version_type}
 
-Generate a {detail_level} detailed message with conventional commit format.
+def _tag_message_request(
+    model: str,
+    commit_message: str,
+    commit_diff: str,
+    version_type: str,
+    max_length: int,
+    locale: str,
+) -> Dict[str, Any]:
+    prompt: str = _build_prompt_from_template(
+        commit_message=commit_message,
+        commit_diff=commit_diff,
+        version_type=version_type,
+        max_length=max_length,
+        locale=locale,
+        is_tag=True,
+    )
+    return {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a git commit message generator. Output only the message, nothing else.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        # Only the first line is kept; a 72 character subject is ~24 tokens
+        "max_tokens": 40,
+        "temperature": 0.3,
+        "stop": ["\n\n", "---", "```"],
+    }
 
-Original commit message: {commit_message}
 
-Diff:
-```
-{diff_truncated}
-```
+def _parse_tag_message(content: str) -> Optional[str]:
+    result: str = content.strip()
+    result = result.strip("\"'`")
 
-Output only the tag message. No explanations, no alternatives, no additional text."""
+    if "\n" in result:
+        result = result.partition("\n")[0].strip()
 
-    return f"""Generate a concise git tag message based on the following diff.
+    return result
 
-Rules:
-- Maximum {max_length} characters
-- Use imperative mood (e.g., "Add", "Fix", "Update", "Remove", "Refactor")
-- No emojis, no decorations, no special characters
-- No period at the end
-- Be specific about what changed, not why
-- Language: {locale}
-- Version type context: {version_type}
 
-Original commit message: {commit_message}
+def _version_type_request(
+    model: str, commit_message: str, commit_diff: str
+) -> Dict[str, Any]:
+    diff_truncated: str = commit_diff[:_VERSION_DIFF_LIMIT]
 
-Diff:
-```
-{diff_truncated}
-```
+    prompt: str = _VERSION_PROMPT_TEMPLATE.format_map(
+        {"commit_message": commit_message, "diff_truncated": diff_truncated}
+    )
 
-Output only the tag message. No explanations, no alternatives, no additional text."""
+    return {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a semantic versioning classifier. Output only TYPE and REASON lines.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": 50,
+        "temperature": 0.2,
+        "stop": ["---", "```", "\n\n\n"],
+    }
+
+
+def _classify_conventional(commit_message: str) -> Optional[Tuple[str, str]]:
+    # Conventional Commits whose version type is unambiguous; None means the
+    # model has to decide (refactor and perf can be either minor or patch).
+    match: Optional[re.Match] = _CC_RE.match(commit_message)
+    if "BREAKING CHANGE" in commit_message or (match and match.group("bang")):
+        return "major", "BREAKING CHANGE detectado"
+    if match is None:
+        return None
+    kind: str = match.group("type").lower()
+    version_type: Optional[str] = _CC_VERSION_TYPES.get(kind)
+    if version_type is None:
+        return None
+    return version_type, f"Commit convencional '{kind}'"
+
+
+def _parse_version_type(content: str) -> Tuple[str, str]:
+    version_type: Optional[str] = None
+    reason: Optional[str] = None
+
+    for line in content.splitlines():
+        head, sep, tail = line.partition(":")
+        if not sep:
+            continue
+        kind: Optional[str] = _PREFIX_MAP.get(head.strip().lower())
+        value: str = tail.strip()
+        if kind == "TYPE":
+            if version_type is None and value.lower() in _VERSION_TYPES:
+                version_type = value.lower()
+        elif kind == "REASON" and reason is None and value:
+            reason = value
+        if version_type is not None and reason is not None:
+            break
+
+    return version_type or "patch", reason or "Cambio menor"
+
+
+@functools.lru_cache(maxsize=None)
+def _openai() -> Any:
+    # Imported on first use rather than at module level: the openai package
+    # takes about a second to import and most igv commands never need it.
+    try:
+        import openai
+    except ImportError:
+        raise ImportError(
+            "The 'openai' library is not installed.\n"
+            "Install it with: pip install openai"
+        )
+    return openai
+
+
+def _http_client_kwargs(use_async: bool) -> Dict[str, Any]:
+    # Tuned httpx client for OpenAI/AsyncOpenAI. Keep-alive covers a whole
+    # parallel fan-out, and with the optional h2 package installed requests
+    # to the same provider are multiplexed over one HTTP/2 connection.
+    # Without httpx the openai defaults are left alone.
+    try:
+        import httpx
+    except ImportError:
+        return {}
+
+    # Chat completions are short; fail fast when the provider is down
+    timeout: Any = httpx.Timeout(60.0, connect=5.0)
+    client_cls: Any = httpx.AsyncClient if use_async else httpx.Client
+    return {
+        "timeout": timeout,
+        "http_client": client_cls(
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+        ),
+    }
+
+
+class _AiCache:
+    """SQLite store of AI responses keyed by a hash of the request.
+
+    Any database error is treated as a cache miss, so a read-only or
+    locked cache never prevents a request from being made.
+    """
+
+    TTL_SECONDS: int = 30 * 24 * 60 * 60
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn: sqlite3.Connection = sqlite3.connect(str(self._path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key BLOB PRIMARY KEY, value TEXT NOT NULL, created_at INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (int(time.time()) - self.TTL_SECONDS,),
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: bytes) -> Optional[str]:
+        try:
+            row: Optional[tuple] = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM responses WHERE key = ? AND created_at >= ?",
+                    (key, int(time.time()) - self.TTL_SECONDS),
+                )
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError):
+            return None
+        return row[0] if row else None
+
+    def put(self, key: bytes, value: str) -> None:
+        try:
+            conn: sqlite3.Connection = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+
+_AI_CACHE: Optional[_AiCache] = None
+
+
+def _get_ai_cache() -> _AiCache:
+    global _AI_CACHE
+    if _AI_CACHE is None:
+        _AI_CACHE = _AiCache(get_ai_cache_path())
+    return _AI_CACHE
 
 
 class OpenAiCompatibleAdapter(AiService):
+    # Upper bound on in-flight requests for the *_parallel methods
+    MAX_CONCURRENCY: int = 8
+    # Commits per request in generate_tag_messages_batch
+    BATCH_SIZE: int = 10
+
     def __init__(self, api_key: str, base_url: str, model: str) -> None:
         self._api_key = api_key
         self._base_url = base_url
         self._model = model
+        self._client: Any = None
 
     def _get_client(self) -> Any:
+        # One client per adapter so its HTTP connection pool (keep-alive,
+        # TLS session) is reused across requests.
+        if self._client is not None:
+            return self._client
+        self._client = _openai().OpenAI(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            **_http_client_kwargs(use_async=False),
+        )
+        return self._client
+
+    def _new_async_client(self) -> Any:
+        # Async clients are bound to the event loop that uses them, so one is
+        # created for each asyncio.run() rather than stored on the adapter.
+        return _openai().AsyncOpenAI(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            **_http_client_kwargs(use_async=True),
+        )
+
+    def _cache_key(self, request: Dict[str, Any]) -> bytes:
+        # The full request (prompt included) identifies the answer; the base
+        # URL keeps equally named models of different providers apart.
+        payload: str = json.dumps([self._base_url, request], sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def _complete(self, request: Dict[str, Any]) -> str:
+        key: bytes = self._cache_key(request)
+        cached: Optional[str] = _get_ai_cache().get(key)
+        if cached is not None:
+            return cached
+        response: Any = self._get_client().chat.completions.create(**request)
+        content: str = response.choices[0].message.content or ""
+        _get_ai_cache().put(key, content)
+        return content
+
+    def _complete_first_line(
+        self, request: Dict[str, Any], refresh: bool = False
+    ) -> str:
+        # Streams the completion and stops reading once the first non-blank
+        # line is complete, since _parse_tag_message discards the rest.
+        # refresh skips the cached answer (the user asked for a new one) but
+        # still stores the fresh response.
+        key: bytes = self._cache_key(request)
+        cached: Optional[str] = None if refresh else _get_ai_cache().get(key)
+        if cached is not None:
+            return cached
+        stream: Any = self._get_client().chat.completions.create(**request, stream=True)
+        parts: List[str] = []
         try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError(
-                "The 'openai' library is not installed.\n"
-                "Install it with: pip install openai"
-            )
-        return OpenAI(api_key=self._api_key, base_url=self._base_url)
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta: Optional[str] = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if "\n" in delta and "\n" in "".join(parts).lstrip():
+                        break
+        finally:
+            stream.close()
+        content: str = "".join(parts).lstrip().split("\n", 1)[0]
+        _get_ai_cache().put(key, content)
+        return content
+
+    async def _acomplete(self, client: Any, request: Dict[str, Any]) -> str:
+        key: bytes = self._cache_key(request)
+        cached: Optional[str] = _get_ai_cache().get(key)
+        if cached is not None:
+            return cached
+        response: Any = await client.chat.completions.create(**request)
+        content: str = response.choices[0].message.content or ""
+        _get_ai_cache().put(key, content)
+        return content
 
     def generate_tag_message(
         self,
@@ -130,106 +543,246 @@ class OpenAiCompatibleAdapter(AiService):
         version_type: str,
         max_length: int = 72,
         locale: str = "es",
+        refresh: bool = False,
     ) -> Optional[str]:
-        client: Any = self._get_client()
-
-        prompt: str = _build_prompt_from_template(
-            commit_message=commit_message,
-            commit_diff=commit_diff,
-            version_type=version_type,
-            max_length=max_length,
-            locale=locale,
-            is_tag=True,
+        return _parse_tag_message(
+            self._complete_first_line(
+                _tag_message_request(
+                    self._model,
+                    commit_message,
+                    commit_diff,
+                    version_type,
+                    max_length,
+                    locale,
+                ),
+                refresh=refresh,
+            )
         )
 
-        response: Any = client.chat.completions.create(
-            model=self._model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a git commit message generator. Output only the message, nothing else.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=100,
-            temperature=0.3,
-            stop=["\n\n", "---", "```"],
+    def determine_version_type(
+        self,
+        commit_message: str,
+        commit_diff: str,
+    ) -> Tuple[str, str]:
+        local: Optional[Tuple[str, str]] = _classify_conventional(commit_message)
+        if local is not None:
+            return local
+        return _parse_version_type(
+            self._complete(
+                _version_type_request(self._model, commit_message, commit_diff)
+            )
         )
 
-        result: str = response.choices[0].message.content.strip()
-        result = result.strip("\"'`")
-
-        if "\n" in result:
-            result = result.split("\n")[0].strip()
-
-        return result
+    async def agenerate_tag_message(
+        self,
+        client: Any,
+        commit_message: str,
+        commit_diff: str,
+        version_type: str,
+        max_length: int = 72,
+        locale: str = "es",
+    ) -> Optional[str]:
+        return _parse_tag_message(
+            await self._acomplete(
+                client,
+                _tag_message_request(
+                    self._model,
+                    commit_message,
+                    commit_diff,
+                    version_type,
+                    max_length,
+                    locale,
+                ),
+            )
+        )
 
-    def determine_version_type(
+    async def adetermine_version_type(
         self,
+        client: Any,
         commit_message: str,
         commit_diff: str,
     ) -> Tuple[str, str]:
-        client: Any = self._get_client()
-
-        diff_truncated: str = (
-            commit_diff[:1500] if len(commit_diff) > 1500 else commit_diff
+        local: Optional[Tuple[str, str]] = _classify_conventional(commit_message)
+        if local is not None:
+            return local
+        return _parse_version_type(
+            await self._acomplete(
+                client, _version_type_request(self._model, commit_message, commit_diff)
+            )
         )
 
-        prompt: str = f"""Classify this git commit into semantic version type.
+    def _run_parallel(
+        self, make_call: Callable[[Any, Any], Awaitable[Any]], items: Sequence[Any]
+    ) -> List[Any]:
+        async def _gather() -> List[Any]:
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+            client: Any = self._new_async_client()
 
-Commit message: {commit_message}
+            async def _bounded(item: Any) -> Any:
+                async with semaphore:
+                    return await make_call(client, item)
 
-Diff:
-```
-{diff_truncated}
-```
+            try:
+                return await asyncio.gather(
+                    *(_bounded(item) for item in items), return_exceptions=True
+                )
+            finally:
+                await client.close()
 
-Rules:
-- major: breaking changes, API changes, major restructuring
-- minor: new features, significant improvements (backwards compatible)
-- patch: bug fixes, docs, small refactoring, maintenance
+        return asyncio.run(_gather())
 
-Output format (exactly 2 lines):
-TYPE: [major|minor|patch]
-REASON: [max 10 words in Spanish]"""
+    def generate_tag_messages_parallel(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+        max_length: int = 72,
+        locale: str = "es",
+    ) -> List[Union[Optional[str], BaseException]]:
+        """Generates one tag message per item with concurrent requests.
+
+        At most ``MAX_CONCURRENCY`` requests are in flight. A failed request
+        yields its exception in the corresponding slot instead of aborting
+        the others.
+        """
+        if len(items) < 2:
+            return super().generate_tag_messages_parallel(items, max_length, locale)
+        return self._run_parallel(
+            lambda client, item: self.agenerate_tag_message(
+                client, item[0], item[1], item[2], max_length, locale
+            ),
+            items,
+        )
 
-        response: Any = client.chat.completions.create(
-            model=self._model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a semantic versioning classifier. Output only TYPE and REASON lines.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=50,
-            temperature=0.2,
-            stop=["---", "```", "\n\n\n"],
+    def determine_version_types_parallel(
+        self, items: Sequence[Tuple[str, str]]
+    ) -> List[Union[Tuple[str, str], BaseException]]:
+        """Classifies several commits with concurrent requests.
+
+        Each item is ``(commit_message, commit_diff)``. Failures are returned
+        in place, as in ``generate_tag_messages_parallel``. Conventional
+        commits are classified locally and never reach the provider.
+        """
+        results: List[Union[Tuple[str, str], BaseException, None]] = [
+            _classify_conventional(commit_message) for commit_message, _ in items
+        ]
+        pending: List[int] = [i for i, result in enumerate(results) if result is None]
+        if len(pending) < 2:
+            for i in pending:
+                results[i] = super().determine_version_types_parallel([items[i]])[0]
+            return results  # type: ignore[return-value]
+
+        answers: List[Any] = self._run_parallel(
+            lambda client, item: self.adetermine_version_type(client, item[0], item[1]),
+            [items[i] for i in pending],
         )
+        for i, answer in zip(pending, answers):
+            results[i] = answer
+        return results  # type: ignore[return-value]
+
+    def generate_tag_messages_batch(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+        max_length: int = 72,
+        locale: str = "es",
+    ) -> List[Optional[str]]:
+        """Generates tag messages for several commits with few requests.
+
+        Items are sent ``BATCH_SIZE`` at a time, so each request stays within
+        the context and rate limits of small providers. If the first request
+        fails its exception propagates; after a later failure the messages
+        obtained so far are returned and the rest are None.
+
+        Each item is ``(commit_message, commit_diff, version_type)``. Entries
+        the model leaves out or that cannot be parsed are requested again
+        individually (concurrently); those that still fail are None.
+
+        A custom prompt_tags.txt describes a single commit, so when one is
+        configured every item is requested individually with it instead.
+        """
+        if len(items) < 2:
+            return super().generate_tag_messages_batch(items, max_length, locale)
+        if load_prompt_tags_template():
+            return [
+                None if isinstance(message, BaseException) else message
+                for message in self.generate_tag_messages_parallel(
+                    items, max_length, locale
+                )
+            ]
+
+        detail_level: str = get_tag_detail_level()
+        results: List[Optional[str]] = [None] * len(items)
+        for start in range(0, len(items), self.BATCH_SIZE):
+            chunk: Sequence[Tuple[str, str, str]] = items[
+                start : start + self.BATCH_SIZE
+            ]
+            if len(chunk) < 2:
+                # A lone trailing commit goes through the individual retry
+                continue
+            try:
+                content: str = self._complete(
+                    {
+                        "model": self._model,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are a git commit message generator. Output only the numbered messages, nothing else.",
+                            },
+                            {
+                                "role": "user",
+                                "content": _build_batch_prompt(
+                                    chunk, max_length, locale, detail_level
+                                ),
+                            },
+                        ],
+                        "max_tokens": 100 * len(chunk),
+                        "temperature": 0.3,
+                    }
+                )
+            except Exception:
+                if start == 0:
+                    raise
+                # Keep what earlier requests produced; the caller generates
+                # the remaining commits one by one
+                return results
+
+            for line in content.splitlines():
+                match = _BATCH_LINE_RE.match(line)
+                if not match:
+                    continue
+                idx: int = int(match.group(1)) - 1
+                if 0 <= idx < len(chunk) and results[start + idx] is None:
+                    results[start + idx] = match.group(2).strip("\"'`").strip() or None
+
+        missing: List[int] = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            retried = self.generate_tag_messages_parallel(
+                [items[i] for i in missing], max_length, locale
+            )
+            for i, message in zip(missing, retried):
+                if not isinstance(message, BaseException):
+                    results[i] = message
+        return results
 
-        result: str = response.choices[0].message.content.strip()
 
-        version_type: str = "patch"
-        reason: str = "Cambio menor"
+def _is_local_provider(base_url: Optional[str]) -> bool:
+    if not base_url:
+        return False
+    return "localhost" in base_url or "127.0.0.1" in base_url
 
-        for line in result.split("\n"):
-            line = line.strip()
-            line_upper: str = line.upper()
-            if line_upper.startswith("TYPE:") or line_upper.startswith("TIPO:"):
-                tipo: str = line.split(":", 1)[1].strip().lower()
-                if tipo in ("major", "minor", "patch"):
-                    version_type = tipo
-            elif (
-                line_upper.startswith("REASON:")
-                or line_upper.startswith("RAZÓN:")
-                or line_upper.startswith("RAZON:")
-            ):
-                reason = line.split(":", 1)[1].strip()
 
-        return version_type, reason
+def get_ai_service() -> AiService:
+    settings: dict = get_config_values(("OPENAI.key", "OPENAI.baseURL", "OPENAI.model"))
+    return _build_ai_service(
+        settings["OPENAI.key"], settings["OPENAI.baseURL"], settings["OPENAI.model"]
+    )
 
 
-def _is_local_provider(base_url: Optional[str]) -> bool:
+@functools.lru_cache(maxsize=4)
+def _build_ai_service(
+    api_key: Optional[str], base_url: Optional[str], model: Optional[str]
+) -> AiService:
+    # Keyed by the settings themselves, so a config change yields a new
+    # adapter while repeated calls share one adapter (and its client). A few
+    # entries leave room for a fallback provider next to the configured one.
     if not base_url:
         raise ValueError(
             "Base URL not configured.\n"
@@ -245,8 +798,27 @@ def _is_local_provider(base_url: Optional[str]) -> bool:
                 "Configure it with: igv config set OPENAI.key <your-api-key>"
             )
 
-    model: str = get_config_value("OPENAI.model") or "llama3.2"
-    return OpenAiCompatibleAdapter(api_key=api_key, base_url=base_url, model=model)
+    return OpenAiCompatibleAdapter(
+        api_key=api_key, base_url=base_url, model=model or "llama3.2"
+    )
+
+
+def get_ai_service_for(
+    api_key: Optional[str], base_url: Optional[str], model: Optional[str]
+) -> AiService:
+    """Returns the shared adapter for explicit provider settings.
+
+    Used to reach a provider other than the configured one (e.g. a local
+    Ollama fallback) while still reusing its adapter and HTTP client.
+
+    Raises:
+        ValueError: If the base URL or a required API key is missing.
+    """
+    return _build_ai_service(api_key, base_url, model)
+
+
+def reset_ai_service_cache() -> None:
+    _build_ai_service.cache_clear()
 
 
 def generate_tag_message(
@@ -255,6 +827,7 @@ def generate_tag_message(
     version_type: str,
     max_length: int = 72,
     locale: str = "es",
+    refresh: bool = False,
 ) -> Optional[str]:
     return get_ai_service().generate_tag_message(
         commit_message=commit_message,
@@ -262,6 +835,17 @@ def generate_tag_message(
         version_type=version_type,
         max_length=max_length,
         locale=locale,
+        refresh=refresh,
+    )
+
+
+def generate_tag_messages_batch(
+    items: Sequence[Tuple[str, str, str]],
+    max_length: int = 72,
+    locale: str = "es",
+) -> List[Optional[str]]:
+    return get_ai_service().generate_tag_messages_batch(
+        items, max_length=max_length, locale=locale
     )
 
 
@@ -272,38 +856,64 @@ def determine_version_type(commit_message: str, commit_diff: str) -> Tuple[str,
     )
 
 
-def list_available_models() -> list:
-    api_key: Optional[str] = get_config_value("OPENAI.key")
-    base_url: Optional[str] = get_config_value("OPENAI.baseURL")
+def generate_tag_messages_parallel(
+    items: Sequence[Tuple[str, str, str]],
+    max_length: int = 72,
+    locale: str = "es",
+) -> List[Union[Optional[str], BaseException]]:
+    return get_ai_service().generate_tag_messages_parallel(
+        items, max_length=max_length, locale=locale
+    )
+
+
+def determine_version_types_parallel(
+    items: Sequence[Tuple[str, str]],
+) -> List[Union[Tuple[str, str], BaseException]]:
+    return get_ai_service().determine_version_types_parallel(items)
+
+
+def iter_models(free_only: bool = False) -> Iterator[dict]:
+    """Yields the provider's models as they are read from ``/models``.
+
+    Each item has ``id``, ``context_window``, ``owned_by`` and ``is_free``.
+    With ``free_only`` the models not known to be free are skipped before
+    their dict is built. Nothing is yielded when the provider is not
+    configured; request errors propagate to the caller.
+    """
+    settings: dict = get_config_values(("OPENAI.key", "OPENAI.baseURL"))
+    api_key: Optional[str] = settings["OPENAI.key"]
+    base_url: Optional[str] = settings["OPENAI.baseURL"]
 
     if not base_url:
-        return []
+        return
 
     if not api_key:
         if _is_local_provider(base_url):
             api_key = "ollama"
         else:
-            return []
+            return
 
-    try:
-        from openai import OpenAI
+    client = _openai().OpenAI(api_key=api_key, base_url=base_url)
+    response = client.models.list()
 
-        client = OpenAI(api_key=api_key, base_url=base_url)
-        response = client.models.list()
+    is_groq: bool = "groq.com" in base_url
 
-        is_groq: bool = "groq.com" in base_url
+    for m in response.data:
+        ctx: Optional[int] = None
+        is_free: Optional[bool]
 
-        result: list = []
-        for m in response.data:
-            ctx: Optional[int] = None
+        if is_groq:
+            # Groq publishes no pricing; the free-tier set alone decides
+            is_free = m.id in _GROQ_FREE_MODELS
+            if free_only and not is_free:
+                continue
+            val = getattr(m, "context_window", None)
+            if val is not None:
+                ctx = int(val)
+        else:
             model_extra: dict = getattr(m, "model_extra", None) or {}
-            for field in ("context_window", "context_length"):
-                val = getattr(m, field, None) or model_extra.get(field)
-                if val is not None:
-                    ctx = int(val)
-                    break
 
-            is_free: Optional[bool] = None
+            is_free = None
             pricing: dict = model_extra.get("pricing") or {}
             if pricing:
                 prompt_cost = str(pricing.get("prompt", "")).strip()
@@ -314,21 +924,27 @@ def list_available_models() -> list:
                     is_free = False
             if m.id.endswith(":free"):
                 is_free = True
-            if is_free is None and is_groq:
-                is_free = m.id in _GROQ_FREE_MODELS
-
-            result.append(
-                {
-                    "id": m.id,
-                    "context_window": ctx,
-                    "owned_by": getattr(m, "owned_by", "") or "",
-                    "is_free": is_free,
-                }
-            )
 
-        result.sort(key=lambda x: x["id"])
-        return result
+            if free_only and not is_free:
+                continue
 
+            for field in ("context_window", "context_length"):
+                val = getattr(m, field, None) or model_extra.get(field)
+                if val is not None:
+                    ctx = int(val)
+                    break
+
+        yield dict(
+            id=m.id,
+            context_window=ctx,
+            owned_by=getattr(m, "owned_by", "") or "",
+            is_free=is_free,
+        )
+
+
+def list_available_models() -> list:
+    try:
+        return sorted(iter_models(), key=operator.itemgetter("id"))
     except Exception:
         return []
 
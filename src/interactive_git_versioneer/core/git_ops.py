@@ -4,9 +4,13 @@ Pure Git operations for interactive-git-versioneer.
 Contains low-level functions for interacting with Git repositories.
 """
 
-import re
+import atexit
+import hashlib
+import os
+import subprocess
 import sys
-from typing import List, Optional, Tuple
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     import git
@@ -20,6 +24,9 @@ except ImportError:
 from .models import Commit
 from .ui import Colors
 
+# get_last_tag results keyed by common git dir -> (_tag_refs_state, tag name)
+_LAST_TAG_CACHE: Dict[str, Tuple[tuple, Optional[str]]] = {}
+
 
 def get_git_repo() -> Repo:
     """Retrieves the current Git repository.
@@ -47,34 +54,94 @@ def parse_version(tag: str) -> Tuple[int, int, int]:
         Tuple[int, int, int]: A tuple representing the major, minor, and patch
             version numbers. Returns (0, 0, 0) if parsing fails.
     """
-    version_str: str = re.sub(r"^v", "", tag)
+    version_str: str = tag[1:] if tag.startswith("v") else tag
 
-    try:
-        parts: List[str] = version_str.split(".")
-        if len(parts) >= 3:
-            return (int(parts[0]), int(parts[1]), int(parts[2]))
-    except (ValueError, IndexError):
-        pass
+    # Anything after the third component ("1.2.3.4") is ignored. Checking the
+    # digits up front avoids raising ValueError for every non-version tag.
+    parts: List[str] = version_str.split(".", 3)
+    if len(parts) >= 3:
+        major, minor, patch = parts[0], parts[1], parts[2]
+        if major.isdecimal() and minor.isdecimal() and patch.isdecimal():
+            return (int(major), int(minor), int(patch))
 
     return (0, 0, 0)
 
 
+def _tag_refs_state(repo: Repo) -> Optional[tuple]:
+    """Builds a key that changes whenever a tag is created or deleted.
+
+    Loose tags are files anywhere under refs/tags, including subdirectories
+    for hierarchical names such as release/v1.2.0. Their names are collected
+    instead of relying on directory mtimes, which miss nested directories
+    and are too coarse on some filesystems. Packed tags are covered by a
+    digest of packed-refs.
+
+    Args:
+        repo (Repo): The Git repository object.
+
+    Returns:
+        Optional[tuple]: The key, or None if the ref files cannot be inspected.
+    """
+    try:
+        common_dir: str = os.fspath(repo.common_dir)
+        tags_root: str = os.path.join(common_dir, "refs", "tags")
+        if not os.path.isdir(tags_root):
+            return None
+        loose: List[str] = []
+        for dirpath, _dirnames, filenames in os.walk(tags_root):
+            prefix: str = os.path.relpath(dirpath, tags_root)
+            loose.extend(os.path.join(prefix, name) for name in filenames)
+        try:
+            with open(os.path.join(common_dir, "packed-refs"), "rb") as f:
+                packed_key: Optional[bytes] = hashlib.blake2b(
+                    f.read(), digest_size=16
+                ).digest()
+        except FileNotFoundError:
+            packed_key = None
+    except (OSError, TypeError, AttributeError):
+        return None
+    return (common_dir, tuple(sorted(loose)), packed_key)
+
+
 def get_last_tag(repo: Repo) -> Optional[str]:
     """Retrieves the most recent tag from the repository.
 
+    The result is cached per repository and reused until a tag is created or
+    deleted, so repeated calls during a session do not re-read every tag.
+
     Args:
         repo (Repo): The Git repository object.
 
     Returns:
         Optional[str]: The name of the most recent tag, or None if no tags are found.
     """
+    state: Optional[tuple] = _tag_refs_state(repo)
+    if state is not None:
+        cached: Optional[Tuple[tuple, Optional[str]]] = _LAST_TAG_CACHE.get(state[0])
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+    last_tag: Optional[str] = _find_last_tag(repo)
+    if state is not None:
+        _LAST_TAG_CACHE[state[0]] = (state, last_tag)
+    return last_tag
+
+
+def _find_last_tag(repo: Repo) -> Optional[str]:
+    """Returns the tag with the highest version.
+
+    Tag names come from a single ``git tag --sort=-v:refname`` call, which
+    avoids loading a GitPython Tag object per tag. parse_version still picks
+    the winner, so tags git orders differently (e.g. "1.2.3" next to
+    "v1.2.0", or pre-releases) are ranked as before.
+    """
     try:
-        tags: List[git.Tag] = sorted(
-            repo.tags, key=lambda t: parse_version(t.name), reverse=True
-        )
-        return tags[0].name if tags else None
+        names: List[str] = repo.git.tag("--list", "--sort=-v:refname").splitlines()
+    except git.GitCommandError:
+        names = [t.name for t in repo.tags]
     except Exception:
         return None
+    return max(names, key=parse_version) if names else None
 
 
 def get_last_version_number(repo: Repo) -> Tuple[int, int, int]:
@@ -129,9 +196,98 @@ def get_next_version(repo: Repo, version_type: str) -> str:
     return f"v{major}.{minor}.{patch}"
 
 
+# git log format for get_untagged_commits: fields separated by US (0x1f),
+# records terminated by RS (0x1e). %B is the raw message (subject and body).
+_LOG_FORMAT = "--format=%H%x1f%an%x1f%cI%x1f%B%x1e"
+_LOG_FIELDS = 4
+_LOG_READ_SIZE = 64 * 1024
+
+
+def _iter_log_records(repo: Repo, fields: int, *args: str) -> Iterator[List[str]]:
+    """Runs git log once and yields the fields of each record as it arrives.
+
+    Args:
+        repo (Repo): The Git repository object.
+        fields (int): Number of fields per record. The last one is free text
+            (e.g. the message) and is never split further.
+        *args (str): Arguments for git log, including a --format built from
+            \x1f-separated fields and \x1e-terminated records.
+
+    Yields:
+        List[str]: The decoded fields of one record.
+
+    Raises:
+        git.GitCommandError: If git log exits with an error. When the caller
+            stops before the end, git is terminated and its status ignored.
+    """
+    proc = repo.git.log(*args, as_process=True)
+    pending: bytes = b""
+    finished: bool = False
+    try:
+        while True:
+            chunk: bytes = proc.stdout.read(_LOG_READ_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            *records, pending = pending.split(b"\x1e")
+            for record in records:
+                yield record.lstrip(b"\n").decode("utf-8", "replace").split(
+                    "\x1f", fields - 1
+                )
+        finished = True
+    finally:
+        proc.stdout.close()
+        if finished:
+            proc.wait()
+        else:
+            # The caller stopped early: git may still be writing (or already
+            # killed by SIGPIPE), so its exit status is not an error
+            proc.proc.terminate()
+            proc.proc.wait()
+
+
+def _untagged_range(repo: Repo) -> str:
+    """Returns the revision range covering the commits after the last tag."""
+    last_tag: Optional[str] = get_last_tag(repo)
+    return f"{last_tag}..HEAD" if last_tag else "HEAD"
+
+
+def iter_untagged_commits(repo: Repo) -> Iterator[Commit]:
+    """Yields the commits made after the last tag as git log produces them.
+
+    Each Commit is built only when the caller asks for it, so callers that
+    stop early never parse the remaining history.
+
+    Args:
+        repo (Repo): The Git repository object.
+
+    Yields:
+        Commit: The untagged commits, ordered from oldest to newest.
+
+    Raises:
+        git.GitCommandError: If git log exits with an error.
+    """
+    for sha, author, committed, message in _iter_log_records(
+        repo, _LOG_FIELDS, "--reverse", _untagged_range(repo), _LOG_FORMAT
+    ):
+        yield Commit(
+            hash=sha,
+            message=message.strip(),
+            author=author,
+            date=committed[:10],
+            datetime=committed,
+            version_type=None,
+            custom_message=None,
+            processed=False,
+        )
+
+
 def get_untagged_commits(repo: Repo) -> List[Commit]:
     """Retrieves commits made after the last tag.
 
+    All commits are read with a single git log call instead of loading
+    each one through GitPython, already in oldest-to-newest order.
+
     Args:
         repo (Repo): The Git repository object.
 
@@ -140,38 +296,140 @@ def get_untagged_commits(repo: Repo) -> List[Commit]:
                       ordered from oldest to newest.
     """
     commits: List[Commit] = []
-    last_tag: Optional[str] = get_last_tag(repo)
-
     try:
-        if last_tag:
-            git_commits = repo.iter_commits(f"{last_tag}..HEAD")
-        else:
-            git_commits = repo.iter_commits("HEAD")
-
-        for git_commit in git_commits:
-            commits.append(
-                Commit(
-                    hash=git_commit.hexsha[:40],
-                    message=git_commit.message.strip(),
-                    author=git_commit.author.name,
-                    date=git_commit.committed_datetime.strftime("%Y-%m-%d"),
-                    datetime=git_commit.committed_datetime.isoformat(),
-                    version_type=None,
-                    custom_message=None,
-                    processed=False,
-                )
-            )
-
-        commits.sort(key=lambda c: c.datetime)
+        commits.extend(iter_untagged_commits(repo))
     except Exception as e:
         print(f"{Colors.RED}Error getting commits: {e}{Colors.RESET}")
 
     return commits
 
 
+def count_untagged_commits(repo: Repo) -> int:
+    """Counts the commits made after the last tag without reading them.
+
+    Args:
+        repo (Repo): The Git repository object.
+
+    Returns:
+        int: The number of untagged commits, or 0 if git fails.
+    """
+    try:
+        return int(repo.git.rev_list("--count", _untagged_range(repo)))
+    except (git.GitCommandError, ValueError):
+        return 0
+
+
+class _DiffBatcher:
+    """Long-lived ``git diff-tree --stdin`` process serving commit diffs.
+
+    Each request writes ``<commit> <parent>`` followed by ``<commit>
+    <commit>``. With --always the second line prints only the commit id,
+    which marks the end of the first diff, so no process is spawned per
+    commit.
+    """
+
+    def __init__(self, repo: Repo) -> None:
+        self._proc: subprocess.Popen = subprocess.Popen(
+            [
+                repo.git.GIT_PYTHON_GIT_EXECUTABLE,
+                f"--git-dir={repo.git_dir}",
+                "diff-tree",
+                "-p",
+                "-M",
+                "--root",
+                "--always",
+                "--no-color",
+                "--stdin",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    def diff(self, commit_sha: str, parent_sha: Optional[str]) -> str:
+        """Returns the diff of a commit against its parent (or the empty tree).
+
+        Args:
+            commit_sha (str): The full hash of the commit.
+            parent_sha (Optional[str]): The full hash of the parent, or None
+                for a root commit.
+
+        Returns:
+            str: The diff, without the commit id header git prints.
+
+        Raises:
+            OSError: If the git process has exited.
+        """
+        request: str = f"{commit_sha} {parent_sha}" if parent_sha else commit_sha
+        sha: bytes = commit_sha.encode("ascii")
+        end: bytes = b"\n" + sha + b"\n"
+        with self._lock:
+            self._proc.stdin.write(f"{request}\n{commit_sha} {commit_sha}\n".encode())
+            self._proc.stdin.flush()
+
+            fd: int = self._proc.stdout.fileno()
+            out: bytes = b""
+            while not out.endswith(end):
+                chunk: bytes = os.read(fd, _LOG_READ_SIZE)
+                if not chunk:
+                    raise OSError("git diff-tree exited unexpectedly")
+                out += chunk
+
+        # Drop the "<sha>\n" header and the end marker
+        body: bytes = out[len(sha) + 1 : -len(end)]
+        return body.decode("utf-8", "replace").rstrip("\n")
+
+    def close(self) -> None:
+        """Stops the git process."""
+        for stream in (self._proc.stdin, self._proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self._proc.wait()
+
+
+# One diff-tree process per repository, started on first use
+_DIFF_BATCHERS: Dict[str, _DiffBatcher] = {}
+
+
+def close_diff_batchers() -> None:
+    """Stops the background git processes used by get_commit_diff."""
+    while _DIFF_BATCHERS:
+        _DIFF_BATCHERS.popitem()[1].close()
+
+
+atexit.register(close_diff_batchers)
+
+
+def _batched_diff(
+    repo: Repo, commit_sha: str, parent_sha: Optional[str]
+) -> Optional[str]:
+    """Returns a diff from the repository's diff-tree process, or None on failure."""
+    try:
+        key: str = os.fspath(repo.git_dir)
+        batcher: Optional[_DiffBatcher] = _DIFF_BATCHERS.get(key)
+        if batcher is None:
+            batcher = _DIFF_BATCHERS[key] = _DiffBatcher(repo)
+    except (OSError, TypeError):
+        return None
+
+    try:
+        return batcher.diff(commit_sha, parent_sha)
+    except (OSError, ValueError):
+        # The process died or its pipes are closed; start a new one next time
+        _DIFF_BATCHERS.pop(key, None)
+        batcher.close()
+        return None
+
+
 def get_commit_diff(repo: Repo, commit_hash: str) -> str:
     """Retrieves the diff of a specific commit.
 
+    Diffs are served by a persistent git diff-tree process per repository.
+    If it fails, git diff/show is run directly for this commit instead.
+
     Args:
         repo (Repo): The Git repository object.
         commit_hash (str): The hash of the commit.
@@ -181,10 +439,30 @@ def get_commit_diff(repo: Repo, commit_hash: str) -> str:
     """
     try:
         commit: git.Commit = repo.commit(commit_hash)
-        if commit.parents:
-            diff: str = repo.git.diff(commit.parents[0].hexsha, commit_hash)
-        else:
-            diff = repo.git.show(commit_hash, format="", name_only=False)
-        return diff
+        parent: Optional[str] = commit.parents[0].hexsha if commit.parents else None
     except Exception as e:
         return f"Error getting diff: {e}"
+
+    diff: Optional[str] = _batched_diff(repo, commit.hexsha, parent)
+    if diff is not None:
+        return diff
+
+    # Run git directly rather than through repo.git, which adds GitPython's
+    # pipe/thread handling around what is a single synchronous call
+    if parent:
+        args: List[str] = ["diff", parent, commit.hexsha]
+    else:
+        args = ["show", "--format=", commit.hexsha]
+    try:
+        result: subprocess.CompletedProcess = subprocess.run(
+            [repo.git.GIT_PYTHON_GIT_EXECUTABLE, f"--git-dir={repo.git_dir}", *args],
+            capture_output=True,
+            check=False,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except OSError as e:
+        return f"Error getting diff: {e}"
+    if result.returncode != 0:
+        return f"Error getting diff: {result.stderr.strip()}"
+    return result.stdout.rstrip("\n")
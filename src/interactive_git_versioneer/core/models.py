@@ -2,11 +2,16 @@
 Data models for interactive-git-versioneer.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
+# Per-instance __dict__ is dropped where dataclasses support it (3.10+); one
+# Commit is kept per untagged commit for the whole session.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Commit:
     """Represents an untagged commit.
 
@@ -8,25 +8,60 @@ import os
 import platform
 import sys
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 # Importar módulos para captura de teclas según el SO
 if platform.system() == "Windows":
     import msvcrt
 else:
+    import select
     import termios
     import tty
 
 
+# Cursor al inicio, borrar pantalla y borrar el historial de scroll
+_CLEAR_SEQUENCE = "\033[H\033[2J\033[3J"
+
+# None hasta el primer clear_screen en Windows; luego si la consola acepta ANSI
+_windows_vt_enabled: Optional[bool] = None
+
+
+def _enable_windows_vt() -> bool:
+    """Activa el procesamiento de secuencias ANSI en la consola de Windows.
+
+    Returns:
+        bool: True si la consola acepta secuencias ANSI (Windows 10+)
+    """
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
 def clear_screen() -> None:
     """Limpia la pantalla de la consola.
 
-    Funciona en Windows, Linux y macOS.
+    Escribe la secuencia ANSI directamente en lugar de lanzar "clear"/"cls"
+    en un proceso aparte. Funciona en Windows (10+), Linux y macOS; en
+    consolas de Windows sin soporte ANSI se usa "cls".
     """
+    global _windows_vt_enabled
     if platform.system() == "Windows":
-        os.system("cls")
-    else:
-        os.system("clear")
+        if _windows_vt_enabled is None:
+            _windows_vt_enabled = _enable_windows_vt()
+        if not _windows_vt_enabled:
+            os.system("cls")
+            return
+    sys.stdout.write(_CLEAR_SEQUENCE)
+    sys.stdout.flush()
 
 
 # ===========================
@@ -45,6 +80,75 @@ class Colors:
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
+    # Variantes ya codificadas para escribir directamente en sys.stdout.buffer
+    CYAN_B = CYAN.encode()
+    GREEN_B = GREEN.encode()
+    YELLOW_B = YELLOW.encode()
+    RED_B = RED.encode()
+    WHITE_B = WHITE.encode()
+    RESET_B = RESET.encode()
+    BOLD_B = BOLD.encode()
+
+    @staticmethod
+    def combine(*codes: str) -> str:
+        """Fusiona varios códigos SGR en una sola secuencia ``ESC[a;b;...m``.
+
+        Args:
+            *codes: Constantes de Colors (p. ej. ``Colors.BOLD``) o
+                parámetros SGR sueltos (p. ej. ``"97"``)
+
+        Returns:
+            str: Secuencia ANSI única equivalente a emitir los códigos seguidos
+        """
+        params = [c[2:-1] if c.startswith("\033[") else c for c in codes if c]
+        if not params:
+            # Colores desactivados: no hay nada que emitir
+            return ""
+        return "\033[" + ";".join(params) + "m"
+
+
+_ANSI_CODES = {
+    name: value
+    for name, value in vars(Colors).items()
+    if name.isupper() and isinstance(value, str)
+}
+
+
+def _colors_enabled() -> bool:
+    """Indica si la salida debe llevar códigos ANSI.
+
+    NO_COLOR los desactiva y FORCE_COLOR los fuerza; en otro caso se usan
+    solo si stdout es una terminal.
+
+    Returns:
+        bool: True si se deben emitir colores
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def set_colors_enabled(enabled: bool) -> None:
+    """Activa o desactiva los códigos ANSI de Colors.
+
+    Con los colores desactivados todas las constantes de Colors (y sus
+    variantes en bytes) quedan vacías, así que la salida redirigida a un
+    archivo o a otra herramienta no lleva secuencias de escape.
+
+    Args:
+        enabled: True para emitir colores, False para texto plano
+    """
+    for name, value in _ANSI_CODES.items():
+        code = value if enabled else ""
+        setattr(Colors, name, code)
+        setattr(Colors, f"{name}_B", code.encode())
+
+
+set_colors_enabled(_colors_enabled())
+
 
 # ===========================
 # CONFIGURACIÓN UI
@@ -57,6 +161,23 @@ MENU_WIDTH = 60  # Ancho estándar para menús y encabezados
 # ===========================
 
 
+def format_header(title: str, width: int = MENU_WIDTH) -> str:
+    """Construye el texto del encabezado que imprime print_header.
+
+    Args:
+        title: Título del encabezado
+        width: Ancho del encabezado (default: MENU_WIDTH)
+
+    Returns:
+        str: Encabezado con una línea en blanco inicial, sin salto final
+    """
+    lines: List[str] = ["", f"{Colors.CYAN}{'═' * width}{Colors.RESET}"]
+    if title:
+        lines.append(f"{Colors.CYAN}{title.center(width)}{Colors.RESET}")
+        lines.append(f"{Colors.CYAN}{'═' * width}{Colors.RESET}")
+    return "\n".join(lines)
+
+
 def print_header(title: str, width: int = MENU_WIDTH) -> None:
     """Imprime un encabezado formateado.
 
@@ -64,11 +185,7 @@ def print_header(title: str, width: int = MENU_WIDTH) -> None:
         title: Título del encabezado
         width: Ancho del encabezado (default: MENU_WIDTH)
     """
-    print()
-    print(f"{Colors.CYAN}{'═' * width}{Colors.RESET}")
-    if title:
-        print(f"{Colors.CYAN}{title.center(width)}{Colors.RESET}")
-        print(f"{Colors.CYAN}{'═' * width}{Colors.RESET}")
+    print(format_header(title, width))
 
 
 def print_subheader(title: str, width: int = MENU_WIDTH) -> None:
@@ -168,49 +285,47 @@ def wait_for_enter_or_skip(skip_hint: bool = True) -> str:
 
 
 def _wait_windows() -> str:
-    """Espera tecla en Windows."""
-    while True:
-        if msvcrt.kbhit():
-            char = msvcrt.getwch()
+    """Espera tecla en Windows.
 
-            # Enter
-            if char in ("\r", "\n"):
-                print()
-                return "continue"
+    getwch() bloquea hasta que llega una tecla, sin sondear con kbhit().
+    """
+    while True:
+        char = msvcrt.getwch()
 
-            # Ctrl+A (código 0x01) - Permitir todos
-            if char == "\x01":
-                print()
-                return "all"
+        # Enter
+        if char in ("\r", "\n"):
+            print()
+            return "continue"
 
-            # Ctrl+X (código 0x18) - Saltar resto
-            if char == "\x18":
-                print()
-                return "skip"
+        # Ctrl+A (código 0x01) - Permitir todos
+        if char == "\x01":
+            print()
+            return "all"
 
-            # q - Salir del programa
-            if char.lower() == "q":
-                print()
-                return "quit"
+        # Ctrl+X (código 0x18) - Saltar resto
+        if char == "\x18":
+            print()
+            return "skip"
 
-            # e - Editar texto
-            if char.lower() == "e":
-                print()
-                return "edit"
+        # q - Salir del programa
+        if char.lower() == "q":
+            print()
+            return "quit"
 
-            # Ctrl+C
-            if char == "\x03":
-                print()
-                return "cancel"
+        # e - Editar texto
+        if char.lower() == "e":
+            print()
+            return "edit"
 
-            # Escape - Saltar resto
-            if char == "\x1b":
-                print()
-                return "skip"
-        else:
-            import time
+        # Ctrl+C
+        if char == "\x03":
+            print()
+            return "cancel"
 
-            time.sleep(0.01)
+        # Escape - Saltar resto
+        if char == "\x1b":
+            print()
+            return "skip"
 
 
 def _wait_unix() -> str:
@@ -291,55 +406,56 @@ def get_menu_input(prompt: str = "") -> str:
 
 
 def _get_input_windows() -> str:
-    """Captura entrada en Windows con soporte para teclas especiales."""
+    """Captura entrada en Windows con soporte para teclas especiales.
+
+    getwch() bloquea hasta que llega una tecla, sin sondear con kbhit().
+    """
     chars = []
 
     while True:
-        if msvcrt.kbhit():
-            char = msvcrt.getwch()
-
-            # Tecla especial (prefijo 224 o 0)
-            if char in ("\x00", "\xe0"):
-                special = msvcrt.getwch()
-                # Delete = 83, podemos mapear otras teclas aquí
-                if special == "S":  # Delete key
-                    print()
-                    return "-back-"
-                continue
+        char = msvcrt.getwch()
 
-            # Backspace
-            if char == "\x08":
-                if chars:
-                    chars.pop()
-                    # Borrar caracter en pantalla
-                    print("\b \b", end="", flush=True)
-                else:
-                    # Backspace sin caracteres = volver atrás
-                    print()
-                    return "-back-"
-                continue
+        # Ctrl+C (getwch lo entrega como carácter, no como señal)
+        if char == "\x03":
+            raise KeyboardInterrupt
 
-            # Enter
-            if char in ("\r", "\n"):
+        # Tecla especial (prefijo 224 o 0)
+        if char in ("\x00", "\xe0"):
+            special = msvcrt.getwch()
+            # Delete = 83, podemos mapear otras teclas aquí
+            if special == "S":  # Delete key
                 print()
-                # Si solo se escribió "q", salir del programa
-                if "".join(chars).lower() == "q":
-                    return "-quit-"
-                return "".join(chars)
-
-            # Escape
-            if char == "\x1b":
+                return "-back-"
+            continue
+
+        # Backspace
+        if char == "\x08":
+            if chars:
+                chars.pop()
+                # Borrar caracter en pantalla
+                print("\b \b", end="", flush=True)
+            else:
+                # Backspace sin caracteres = volver atrás
                 print()
                 return "-back-"
+            continue
 
-            # Caracter normal
-            print(char, end="", flush=True)
-            chars.append(char)
-        else:
-            # Pequeña pausa para no consumir CPU
-            import time
+        # Enter
+        if char in ("\r", "\n"):
+            print()
+            # Si solo se escribió "q", salir del programa
+            if "".join(chars).lower() == "q":
+                return "-quit-"
+            return "".join(chars)
+
+        # Escape
+        if char == "\x1b":
+            print()
+            return "-back-"
 
-            time.sleep(0.01)
+        # Caracter normal
+        print(char, end="", flush=True)
+        chars.append(char)
 
 
 def _get_input_unix() -> str:
@@ -361,8 +477,6 @@ def _get_input_unix() -> str:
             # Escape o secuencia de escape
             if char == "\x1b":
                 # Leer más caracteres si es secuencia
-                import select
-
                 if select.select([sys.stdin], [], [], 0.1)[0]:
                     seq = sys.stdin.read(2)
                     # Delete = \x1b[3~
@@ -445,6 +559,8 @@ class Menu:
         self.items: List[MenuItem] = []
         self.show_status: Optional[Callable[[], None]] = None
         self.footer_status: Optional[Callable[[], str]] = None
+        # (título, ancho, color), encabezado y borde ya construidos
+        self._frame_cache: Optional[Tuple[Tuple[str, int, str], str, str]] = None
 
     def add_item(
         self, key: str, label: str, action: Callable[[], Optional[bool]]
@@ -486,6 +602,23 @@ class Menu:
         self.footer_status = callback
         return self
 
+    def _frame(self) -> Tuple[str, str]:
+        """Retorna el encabezado y el borde del menú, construidos una sola vez.
+
+        Se reconstruyen solo si cambian el título, el ancho o los colores.
+
+        Returns:
+            Tuple[str, str]: Encabezado (con líneas en blanco antes y
+            después) y borde de cierre
+        """
+        key = (self.title, self.width, Colors.CYAN)
+        if self._frame_cache is None or self._frame_cache[0] != key:
+            border = f"{Colors.CYAN}{'═' * self.width}{Colors.RESET}"
+            title = f"{Colors.CYAN}{self.title.center(self.width)}{Colors.RESET}"
+            header = "\n".join(("", border, title, border, "", ""))
+            self._frame_cache = (key, header, border)
+        return self._frame_cache[1], self._frame_cache[2]
+
     def show(self) -> str:
         """Muestra el menú y retorna la opción seleccionada.
 
@@ -493,32 +626,27 @@ class Menu:
             str: Tecla seleccionada por el usuario
         """
         try:
+            header, border = self._frame()
             clear_screen()
-            print()
-            print(f"{Colors.CYAN}{'═' * self.width}{Colors.RESET}")
-            print(f"{Colors.CYAN}{self.title.center(self.width)}{Colors.RESET}")
-            print(f"{Colors.CYAN}{'═' * self.width}{Colors.RESET}")
-            print()
+            print(header, end="")
 
             # Mostrar estado si hay callback
             if self.show_status:
                 self.show_status()
                 print()
 
-            # Mostrar opciones
-            for item in self.items:
-                print(f"{Colors.WHITE}{item.key}. {item.label}{Colors.RESET}")
-
-            # Mostrar ayuda de navegación
-            print()
+            # Opciones y ayuda de navegación en una sola escritura
+            lines = [
+                f"{Colors.WHITE}{item.key}. {item.label}{Colors.RESET}"
+                for item in self.items
+            ]
             footer_text = (
                 f"{Colors.CYAN}[Supr/Esc: Volver | q+Enter: Salir]{Colors.RESET}"
             )
             if self.footer_status:
                 footer_text += f"\n{self.footer_status()}"
-            print(footer_text)
-            print(f"{Colors.CYAN}{'═' * self.width}{Colors.RESET}")
-            print()
+            lines += ["", footer_text, border, "", ""]
+            print("\n".join(lines), end="")
 
             return get_menu_input(f"{Colors.WHITE}Seleccione opción: {Colors.RESET}")
         except KeyboardInterrupt:
@@ -1,23 +1,85 @@
+import functools
 import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+try:
+    import tomllib
+except ImportError:
+    # Python < 3.11
+    import tomli as tomllib
+
+from .git_ops import get_last_tag
 from .ui import Colors, clear_screen, wait_for_enter
 
+# SemVer 2.0.0 (e.g., 1.0.0, 1.2.3-alpha.1+build.2), usado con fullmatch.
+# Los identificadores están separados por puntos, así que el tiempo de
+# comprobación es lineal incluso con pre-releases muy largos.
+_SEMVER_RE = re.compile(
+    r"(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)(?:-((?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
+)
+
+# MAJOR.MINOR.PATCH al inicio de una versión, para version_tuple
+_VERSION_TUPLE_RE = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)")
+
+# Línea 'version = "..."' (o con comillas simples) de pyproject.toml
+_VERSION_LINE_RE = re.compile(
+    r"""^version\s*=\s*(?P<quote>["'])(?P<value>.*)(?P=quote)""", re.MULTILINE
+)
+
+# Tablas de pyproject.toml que pueden declarar la versión, por prioridad
+_VERSION_TABLES = ("[project]", "[tool.poetry]")
+
+# Encabezados ## [vX.X.X] o ## [X.X.X] del CHANGELOG, al inicio de línea
+_CHANGELOG_HEADING_RE = re.compile(r"##\s*\[([^\]]+)\]")
+
+
+def _strip_v(version: str) -> str:
+    """Quita un único prefijo 'v' ("v1.2.3" -> "1.2.3")."""
+    return version[1:] if version.startswith("v") else version
 
+
+@functools.lru_cache(maxsize=256)
 def version_tuple(v: str) -> tuple:
-    """Convierte string de versión a tupla de integers para comparación."""
+    """Convierte string de versión a tupla de integers para comparación.
+
+    Los sufijos de pre-release o build se ignoran ("1.2.3-alpha" -> (1, 2, 3)).
+    """
+    match = _VERSION_TUPLE_RE.match(v)
+    if match:
+        return (int(match[1]), int(match[2]), int(match[3]))
+    return (0, 0, 0)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_changelog(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Extrae las versiones de un CHANGELOG.md.
+
+    mtime_ns y size solo forman parte de la clave de caché: el archivo se
+    vuelve a leer únicamente cuando cambia en disco.
+    """
+    versions = []
     try:
-        parts = v.split(".")
-        return tuple(int(p) for p in parts[:3])
-    except:
-        return (0, 0, 0)
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                # Solo los encabezados ## [vX.X.X] o ## [X.X.X] llevan versión
+                if not line.startswith("##"):
+                    continue
+                match = _CHANGELOG_HEADING_RE.match(line)
+                # Filtrar "Unreleased" (entrada temporal para commits pendientes)
+                if match and match.group(1).casefold() != "unreleased":
+                    versions.append(match.group(1))
+    except Exception:
+        return ()
+    return tuple(versions)
 
 
 def get_changelog_versions(repo: "git.Repo") -> List[str]:
     """Obtiene las versiones registradas en el archivo CHANGELOG.md.
 
+    El resultado se reutiliza mientras el archivo no cambie.
+
     Args:
         repo: Repositorio Git
 
@@ -25,20 +87,12 @@ def get_changelog_versions(repo: "git.Repo") -> List[str]:
         List[str]: Lista de versiones encontradas en el changelog (excluyendo "Unreleased")
     """
     changelog_path = os.path.join(repo.working_dir, "CHANGELOG.md")
-    versions = []
-
-    if os.path.exists(changelog_path):
-        try:
-            with open(changelog_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            # Buscar todas las versiones en el formato ## [vX.X.X] o ## [X.X.X]
-            matches = re.findall(r"##\s*\[([^\]]+)\]", content)
-            # Filtrar "Unreleased" (entrada temporal para commits pendientes)
-            versions = [v for v in matches if v.lower() != "unreleased"]
-        except Exception:
-            pass
+    try:
+        st = os.stat(changelog_path)
+    except OSError:
+        return []
 
-    return versions
+    return list(_parse_changelog(changelog_path, st.st_mtime_ns, st.st_size))
 
 
 def get_last_changelog_version(repo: "git.Repo") -> Optional[str]:
@@ -53,23 +107,87 @@ def get_last_changelog_version(repo: "git.Repo") -> Optional[str]:
     versions = get_changelog_versions(repo)
     if versions:
         # La primera versión en el changelog es la más reciente
-        return versions[0].lstrip("v")
+        return _strip_v(versions[0])
+    return None
+
+
+def _read_toml_version(pyproject_path: Path) -> Optional[str]:
+    """Reads [project].version (or [tool.poetry].version) with a TOML parser.
+
+    Returns None if the file is not valid TOML or declares no static version.
+    """
+    try:
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+    except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+        return None
+
+    tool = data.get("tool")
+    poetry = tool.get("poetry") if isinstance(tool, dict) else None
+    for table in (data.get("project"), poetry):
+        if isinstance(table, dict) and isinstance(table.get("version"), str):
+            return table["version"]
     return None
 
 
+def _find_version_line(content: str) -> Optional[re.Match]:
+    """Busca la línea 'version = "..."' dentro de [project] o [tool.poetry].
+
+    Solo se recorre el cuerpo de esas tablas (hasta la siguiente cabecera
+    '['); si el archivo no tiene ninguna de las dos, se busca en todo él.
+    """
+    has_table = False
+    for header in _VERSION_TABLES:
+        if content.startswith(header):
+            start = 0
+        else:
+            start = content.find("\n" + header)
+            if start == -1:
+                continue
+            start += 1
+        has_table = True
+        end = content.find("\n[", start + len(header))
+        match = _VERSION_LINE_RE.search(
+            content, start, len(content) if end == -1 else end
+        )
+        if match:
+            return match
+
+    if has_table:
+        return None
+    return _VERSION_LINE_RE.search(content)
+
+
+@functools.lru_cache(maxsize=32)
+def _version_from_pyproject(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Extrae la versión de un pyproject.toml.
+
+    mtime_ns y size solo forman parte de la clave de caché: el archivo se
+    vuelve a leer únicamente cuando cambia en disco.
+    """
+    version = _read_toml_version(Path(path))
+    if version is not None:
+        return version
+
+    with open(path, "r", encoding="utf-8") as f:
+        match = _find_version_line(f.read())
+    return match.group("value") if match else None
+
+
 def get_current_version(repo_root: Path) -> Optional[str]:
-    """Reads the current version from pyproject.toml."""
+    """Reads the current version from pyproject.toml.
+
+    The file is parsed as TOML first, so any valid quoting of the version is
+    understood. If that fails, the 'version = "..."' line of the same table
+    is used. The result is reused while the file is unchanged.
+    """
     pyproject_path = repo_root / "pyproject.toml"
-    if not pyproject_path.exists():
+    try:
+        st = os.stat(pyproject_path)
+    except FileNotFoundError:
         return None
 
-    with open(pyproject_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    match = re.search(r'^version\s*=\s*"(.*)"', content, re.MULTILINE)
-    if match:
-        return match.group(1)
-    return None
+    return _version_from_pyproject(str(pyproject_path), st.st_mtime_ns, st.st_size)
 
 
 def update_version_in_pyproject(repo_root: Path, new_version: str) -> bool:
@@ -82,26 +200,62 @@ def update_version_in_pyproject(repo_root: Path, new_version: str) -> bool:
         return False
 
     with open(pyproject_path, "r", encoding="utf-8") as f:
-        content = f.readlines()
+        content = f.read()
 
-    updated = False
-    with open(pyproject_path, "w", encoding="utf-8") as f:
-        for line in content:
-            if re.match(r'^version\s*=\s*".*"', line):
-                f.write(f'version = "{new_version}"\n')
-                updated = True
-            else:
-                f.write(line)
-    return updated
+    # La misma línea que lee get_current_version
+    match = _find_version_line(content)
+    if not match:
+        return False
+    # Solo se sustituye el valor, conservando las comillas y el formato
+    content = f'{content[: match.start("value")]}{new_version}{content[match.end("value") :]}'
+
+    # Escribir en un archivo temporal y renombrarlo encima del original, para
+    # que una interrupción nunca deje pyproject.toml truncado
+    tmp_path = pyproject_path.with_name(pyproject_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, pyproject_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    # Una versión del mismo tamaño escrita en el mismo instante conservaría
+    # la clave de caché, así que se descarta explícitamente
+    _version_from_pyproject.cache_clear()
+    return True
 
 
 def is_valid_semver(version_str: str) -> bool:
     """Checks if a string is a valid semantic version."""
-    # Basic semantic versioning check (e.g., 1.0.0, 1.2.3-alpha.1+build.2)
-    semver_pattern = re.compile(
-        r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-    )
-    return bool(semver_pattern.match(version_str))
+    # Descartar sin regex lo que no empieza por un dígito
+    if not version_str[:1].isdigit():
+        return False
+    return _SEMVER_RE.fullmatch(version_str) is not None
+
+
+def _suggest_version(
+    last_changelog_ver: Optional[str], last_tag: Optional[str]
+) -> str:
+    """Sugiere la versión a partir del changelog y el tag ya obtenidos.
+
+    Args:
+        last_changelog_ver: Última versión del CHANGELOG (sin 'v'), o None
+        last_tag: Último tag de Git, o None
+
+    Returns:
+        str: Versión sugerida (ver get_suggested_version)
+    """
+    if last_changelog_ver:
+        # Sugerir la MISMA versión del changelog (sincronizar, no adelantar)
+        return last_changelog_ver
+
+    if not last_tag:
+        # Sin tags ni changelog, sugerir 0.0.1
+        return "0.0.1"
+
+    # Sugerir la versión del último tag (sincronizar)
+    return _strip_v(last_tag)
 
 
 def get_suggested_version(repo: "git.Repo", current_version: str) -> Optional[str]:
@@ -115,24 +269,13 @@ def get_suggested_version(repo: "git.Repo", current_version: str) -> Optional[st
     3. 0.0.1 (si no hay ni changelog ni tags)
     """
     try:
-        from .git_ops import get_last_tag
-
         # 1. Intentar obtener última versión del CHANGELOG (fuente de verdad principal)
         last_changelog_ver = get_last_changelog_version(repo)
 
-        if last_changelog_ver:
-            # Sugerir la MISMA versión del changelog (sincronizar, no adelantar)
-            return last_changelog_ver
-
-        # 2. Si no hay changelog, usar el último tag
-        last_tag = get_last_tag(repo)
+        # 2. Solo si no hay changelog hace falta consultar el último tag
+        last_tag = None if last_changelog_ver else get_last_tag(repo)
 
-        if not last_tag:
-            # Sin tags ni changelog, sugerir 0.0.1
-            return "0.0.1"
-
-        # Sugerir la versión del último tag (sincronizar)
-        return last_tag.lstrip("v")
+        return _suggest_version(last_changelog_ver, last_tag)
     except Exception:
         pass
 
@@ -145,117 +288,124 @@ def action_update_project_version(repo: "git.Repo") -> bool:
     Sugiere automáticamente la siguiente versión basada en el último tag.
     """
     clear_screen()
-    print(f"{Colors.CYAN}--- ACTUALIZAR VERSIÓN DEL PROYECTO ---{Colors.RESET}")
+
+    # Todo lo que se muestra antes del prompt se acumula aquí y se imprime de
+    # una vez, justo antes de pedir la versión
+    white, reset = Colors.WHITE, Colors.RESET
+    out = [f"{Colors.CYAN}--- ACTUALIZAR VERSIÓN DEL PROYECTO ---{reset}"]
 
     repo_root = Path(repo.working_dir)
     current_version = get_current_version(repo_root)
 
     # Obtener último tag y última versión del changelog para comparación
-    from .git_ops import get_last_tag
-
     last_tag = get_last_tag(repo)
-    last_tag_version = last_tag.lstrip("v") if last_tag else None
-    last_changelog_ver = get_last_changelog_version(repo)
+    last_tag_version = _strip_v(last_tag) if last_tag else None
+    changelog_versions = get_changelog_versions(repo)
+    # La primera versión en el changelog es la más reciente
+    last_changelog_ver = _strip_v(changelog_versions[0]) if changelog_versions else None
 
     if current_version:
-        print(
-            f"{Colors.WHITE}Versión actual en pyproject.toml: {Colors.YELLOW}{current_version}{Colors.RESET}"
+        out.append(
+            f"{white}Versión actual en pyproject.toml: {Colors.YELLOW}{current_version}{reset}"
         )
     else:
-        print(
-            f"{Colors.YELLOW}No se encontró la versión actual en pyproject.toml.{Colors.RESET}"
+        out.append(
+            f"{Colors.YELLOW}No se encontró la versión actual en pyproject.toml.{reset}"
         )
+        print("\n".join(out))
         wait_for_enter()
         return False
 
     # Mostrar estado del ecosistema de versiones
-    print()
-    print(f"{Colors.CYAN}Estado del versionado:{Colors.RESET}")
+    none_label = f"{Colors.YELLOW}(ninguno){reset}"
+    out += ["", f"{Colors.CYAN}Estado del versionado:{reset}"]
 
     # Mostrar último changelog
     if last_changelog_ver:
-        changelog_versions = get_changelog_versions(repo)
         num_versions = len(changelog_versions)
-        print(
-            f"{Colors.WHITE}  • Último changelog: {last_changelog_ver} ({num_versions} versiones registradas){Colors.RESET}"
+        out.append(
+            f"{white}  • Último changelog: {last_changelog_ver} ({num_versions} versiones registradas){reset}"
         )
     else:
-        print(f"{Colors.WHITE}  • Último changelog: {Colors.YELLOW}(ninguno){Colors.RESET}")
+        out.append(f"{white}  • Último changelog: {none_label}")
 
     # Mostrar último tag
     if last_tag_version:
-        print(f"{Colors.WHITE}  • Último tag: {last_tag_version}{Colors.RESET}")
+        out.append(f"{white}  • Último tag: {last_tag_version}{reset}")
     else:
-        print(f"{Colors.WHITE}  • Último tag: {Colors.YELLOW}(ninguno){Colors.RESET}")
+        out.append(f"{white}  • Último tag: {none_label}")
 
-    print(f"{Colors.WHITE}  • pyproject.toml: {current_version}{Colors.RESET}")
+    out.append(f"{white}  • pyproject.toml: {current_version}{reset}")
 
     # Advertir si hay inconsistencias
-    print()
+    out.append("")
     has_issues = False
 
+    # Tuplas de comparación, calculadas una sola vez
+    cv_t = version_tuple(current_version)
+    cl_t = version_tuple(last_changelog_ver) if last_changelog_ver else None
+    lt_t = version_tuple(last_tag_version) if last_tag_version else None
+
     # Comparar changelog con pyproject
     if last_changelog_ver:
-        if version_tuple(current_version) > version_tuple(last_changelog_ver):
-            print(
-                f"{Colors.RED}⚠ DESINCRONIZACIÓN: pyproject.toml ({current_version}) adelantado del CHANGELOG ({last_changelog_ver}){Colors.RESET}"
-            )
-            print(
-                f"{Colors.WHITE}  → ESTO NO DEBE PASAR. El CHANGELOG es la fuente de verdad.{Colors.RESET}"
-            )
-            print(
-                f"{Colors.YELLOW}  → Opciones:{Colors.RESET}"
-            )
-            print(
-                f"{Colors.WHITE}     a) Retroceder pyproject.toml a {last_changelog_ver}{Colors.RESET}"
-            )
-            print(
-                f"{Colors.WHITE}     b) Etiquetar y generar changelog para {current_version}{Colors.RESET}"
-            )
+        if cv_t > cl_t:
+            out += [
+                f"{Colors.RED}⚠ DESINCRONIZACIÓN: pyproject.toml ({current_version}) adelantado del CHANGELOG ({last_changelog_ver}){reset}",
+                f"{white}  → ESTO NO DEBE PASAR. El CHANGELOG es la fuente de verdad.{reset}",
+                f"{Colors.YELLOW}  → Opciones:{reset}",
+                f"{white}     a) Retroceder pyproject.toml a {last_changelog_ver}{reset}",
+                f"{white}     b) Etiquetar y generar changelog para {current_version}{reset}",
+            ]
             has_issues = True
-        elif version_tuple(current_version) < version_tuple(last_changelog_ver):
-            print(
-                f"{Colors.YELLOW}⚠ pyproject.toml ({current_version}) está atrasado del CHANGELOG ({last_changelog_ver}){Colors.RESET}"
-            )
-            print(
-                f"{Colors.WHITE}  → Actualiza pyproject.toml a {last_changelog_ver} (versión sugerida).{Colors.RESET}"
-            )
+        elif cv_t < cl_t:
+            out += [
+                f"{Colors.YELLOW}⚠ pyproject.toml ({current_version}) está atrasado del CHANGELOG ({last_changelog_ver}){reset}",
+                f"{white}  → Actualiza pyproject.toml a {last_changelog_ver} (versión sugerida).{reset}",
+            ]
             has_issues = True
         else:
             # Versiones iguales entre pyproject y changelog
-            print(f"{Colors.GREEN}✓ pyproject.toml sincronizado con CHANGELOG.{Colors.RESET}")
+            out.append(f"{Colors.GREEN}✓ pyproject.toml sincronizado con CHANGELOG.{reset}")
 
     # Comparar tag con changelog
     if last_tag_version and last_changelog_ver:
-        if version_tuple(last_tag_version) > version_tuple(last_changelog_ver):
-            print(
-                f"{Colors.YELLOW}⚠ Tag ({last_tag_version}) adelantado del CHANGELOG ({last_changelog_ver}){Colors.RESET}"
-            )
-            print(
-                f"{Colors.WHITE}  → Genera el changelog para el tag {last_tag}.{Colors.RESET}"
-            )
+        if lt_t > cl_t:
+            out += [
+                f"{Colors.YELLOW}⚠ Tag ({last_tag_version}) adelantado del CHANGELOG ({last_changelog_ver}){reset}",
+                f"{white}  → Genera el changelog para el tag {last_tag}.{reset}",
+            ]
             has_issues = True
-        elif version_tuple(last_tag_version) < version_tuple(last_changelog_ver):
-            print(
-                f"{Colors.YELLOW}⚠ CHANGELOG ({last_changelog_ver}) adelantado del último tag ({last_tag_version}){Colors.RESET}"
+        elif lt_t < cl_t:
+            out.append(
+                f"{Colors.YELLOW}⚠ CHANGELOG ({last_changelog_ver}) adelantado del último tag ({last_tag_version}){reset}"
             )
             has_issues = True
 
     # Obtener versión sugerida
-    suggested_version = get_suggested_version(repo, current_version)
+    # Reutilizar el tag y el changelog ya obtenidos arriba
+    suggested_version = _suggest_version(last_changelog_ver, last_tag)
     if suggested_version:
-        print(
-            f"{Colors.WHITE}Versión sugerida: {Colors.GREEN}{suggested_version}{Colors.RESET}"
+        out.append(
+            f"{white}Versión sugerida: {Colors.GREEN}{suggested_version}{reset}"
         )
 
-    print()
-
     # Advertencia importante sobre el flujo correcto
-    print(f"{Colors.CYAN}FLUJO RECOMENDADO:{Colors.RESET}")
-    print(f"{Colors.WHITE}  1. Etiquetar commits (menú Tags){Colors.RESET}")
-    print(f"{Colors.WHITE}  2. Generar changelog (menú Releases → Changelogs){Colors.RESET}")
-    print(f"{Colors.WHITE}  3. Actualizar pyproject.toml (esta opción){Colors.RESET}")
-    print()
+    out += [
+        "",
+        f"{Colors.CYAN}FLUJO RECOMENDADO:{reset}",
+        f"{white}  1. Etiquetar commits (menú Tags){reset}",
+        f"{white}  2. Generar changelog (menú Releases → Changelogs){reset}",
+        f"{white}  3. Actualizar pyproject.toml (esta opción){reset}",
+        "",
+    ]
+    print("\n".join(out))
+
+    # La sugerencia sale del CHANGELOG o del último tag: se valida una sola vez
+    suggestion_is_semver = bool(suggested_version) and is_valid_semver(
+        suggested_version
+    )
+    # Versiones del changelog sin 'v'; solo se construye si se teclea una versión
+    changelog_set = None
 
     while True:
         if suggested_version:
@@ -266,7 +416,8 @@ def action_update_project_version(repo: "git.Repo") -> bool:
         new_version = input(prompt).strip()
 
         # Si el usuario presiona Enter y hay sugerencia, usar la sugerida
-        if not new_version and suggested_version:
+        accepted_suggestion = not new_version and bool(suggested_version)
+        if accepted_suggestion:
             new_version = suggested_version
 
         if new_version.lower() == "c":
@@ -278,7 +429,11 @@ def action_update_project_version(repo: "git.Repo") -> bool:
             print(f"{Colors.RED}Error: Debes introducir una versión.{Colors.RESET}")
             continue
 
-        if not is_valid_semver(new_version):
+        if accepted_suggestion:
+            valid_semver = suggestion_is_semver
+        else:
+            valid_semver = is_valid_semver(new_version)
+        if not valid_semver:
             print(
                 f"{Colors.RED}Error: La versión introducida no es un formato SemVer válido (ej. 1.0.0, 1.2.3-alpha.1).{Colors.RESET}"
             )
@@ -291,28 +446,34 @@ def action_update_project_version(repo: "git.Repo") -> bool:
             continue
 
         # VALIDACIÓN CRÍTICA: Verificar que la versión exista en el CHANGELOG
-        if last_changelog_ver:
-            new_version_stripped = new_version.lstrip("v")
-            changelog_versions = get_changelog_versions(repo)
-            # Normalizar versiones del changelog (quitar 'v' si existe)
-            changelog_versions_normalized = [v.lstrip("v") for v in changelog_versions]
+        # (la sugerida es la última del CHANGELOG, así que no hace falta)
+        if last_changelog_ver and not accepted_suggestion:
+            new_version_stripped = _strip_v(new_version)
 
             # Verificar si la nueva versión está en el changelog
-            version_in_changelog = new_version_stripped in changelog_versions_normalized
+            if changelog_set is None:
+                changelog_set = {_strip_v(v) for v in changelog_versions}
+            version_in_changelog = new_version_stripped in changelog_set
 
             # Verificar si la nueva versión está adelantada del changelog
-            if version_tuple(new_version_stripped) > version_tuple(last_changelog_ver):
-                print()
-                print(f"{Colors.RED}⚠️  ERROR: La versión {new_version} NO está en el CHANGELOG{Colors.RESET}")
-                print(f"{Colors.WHITE}   Última versión en CHANGELOG: {last_changelog_ver}{Colors.RESET}")
-                print()
-                print(f"{Colors.YELLOW}   pyproject.toml NO debe estar adelantado del CHANGELOG.{Colors.RESET}")
-                print()
-                print(f"{Colors.WHITE}   Sigue el flujo correcto:{Colors.RESET}")
-                print(f"{Colors.WHITE}   1. Etiqueta commits: igv → Menú Tags → Etiquetar commits{Colors.RESET}")
-                print(f"{Colors.WHITE}   2. Genera changelog: igv → Menú Releases → Changelogs → Continuar changelog{Colors.RESET}")
-                print(f"{Colors.WHITE}   3. Actualiza pyproject.toml: igv → Menú Releases → Actualizar versión{Colors.RESET}")
-                print()
+            if version_tuple(new_version_stripped) > cl_t:
+                print(
+                    "\n".join(
+                        [
+                            "",
+                            f"{Colors.RED}⚠️  ERROR: La versión {new_version} NO está en el CHANGELOG{reset}",
+                            f"{white}   Última versión en CHANGELOG: {last_changelog_ver}{reset}",
+                            "",
+                            f"{Colors.YELLOW}   pyproject.toml NO debe estar adelantado del CHANGELOG.{reset}",
+                            "",
+                            f"{white}   Sigue el flujo correcto:{reset}",
+                            f"{white}   1. Etiqueta commits: igv → Menú Tags → Etiquetar commits{reset}",
+                            f"{white}   2. Genera changelog: igv → Menú Releases → Changelogs → Continuar changelog{reset}",
+                            f"{white}   3. Actualiza pyproject.toml: igv → Menú Releases → Actualizar versión{reset}",
+                            "",
+                        ]
+                    )
+                )
 
                 try:
                     override = input(
@@ -330,10 +491,10 @@ def action_update_project_version(repo: "git.Repo") -> bool:
                     return False
             elif not version_in_changelog and new_version_stripped != last_changelog_ver:
                 # La versión no está en el changelog pero no está adelantada (versión antigua)
-                print()
-                print(f"{Colors.YELLOW}⚠️  Advertencia: La versión {new_version} no está en el CHANGELOG{Colors.RESET}")
-                print(f"{Colors.WHITE}   ¿Estás seguro de retroceder a una versión no documentada?{Colors.RESET}")
-                print()
+                print(
+                    f"\n{Colors.YELLOW}⚠️  Advertencia: La versión {new_version} no está en el CHANGELOG{reset}\n"
+                    f"{white}   ¿Estás seguro de retroceder a una versión no documentada?{reset}\n"
+                )
 
                 try:
                     confirm = input(
@@ -353,11 +514,10 @@ def action_update_project_version(repo: "git.Repo") -> bool:
         break
 
     if update_version_in_pyproject(repo_root, new_version):
-        print()
         print(
-            f"{Colors.GREEN}✓ Versión actualizada a {new_version} en pyproject.toml.{Colors.RESET}"
+            f"\n{Colors.GREEN}✓ Versión actualizada a {new_version} en pyproject.toml.{reset}\n"
+            f"{Colors.YELLOW}Recuerda hacer commit de este cambio.{reset}"
         )
-        print(f"{Colors.YELLOW}Recuerda hacer commit de este cambio.{Colors.RESET}")
     else:
         print(f"{Colors.RED}No se pudo actualizar la versión.{Colors.RESET}")
 
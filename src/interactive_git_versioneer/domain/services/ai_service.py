@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 
 
 class AiService(ABC):
@@ -11,6 +11,7 @@ class AiService(ABC):
         version_type: str,
         max_length: int = 72,
         locale: str = "es",
+        refresh: bool = False,
     ) -> Optional[str]:
         pass
 
@@ -21,3 +22,57 @@ class AiService(ABC):
         commit_diff: str,
     ) -> Tuple[str, str]:
         pass
+
+    def generate_tag_messages_batch(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+        max_length: int = 72,
+        locale: str = "es",
+    ) -> List[Optional[str]]:
+        return [
+            self.generate_tag_message(
+                commit_message=commit_message,
+                commit_diff=commit_diff,
+                version_type=version_type,
+                max_length=max_length,
+                locale=locale,
+            )
+            for commit_message, commit_diff, version_type in items
+        ]
+
+    def generate_tag_messages_parallel(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+        max_length: int = 72,
+        locale: str = "es",
+    ) -> List[Union[Optional[str], BaseException]]:
+        results: List[Union[Optional[str], BaseException]] = []
+        for commit_message, commit_diff, version_type in items:
+            try:
+                results.append(
+                    self.generate_tag_message(
+                        commit_message=commit_message,
+                        commit_diff=commit_diff,
+                        version_type=version_type,
+                        max_length=max_length,
+                        locale=locale,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def determine_version_types_parallel(
+        self, items: Sequence[Tuple[str, str]]
+    ) -> List[Union[Tuple[str, str], BaseException]]:
+        results: List[Union[Tuple[str, str], BaseException]] = []
+        for commit_message, commit_diff in items:
+            try:
+                results.append(
+                    self.determine_version_type(
+                        commit_message=commit_message, commit_diff=commit_diff
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
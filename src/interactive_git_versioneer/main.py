@@ -9,8 +9,6 @@ import json
 import sys
 from typing import Optional
 
-from git import Repo
-
 from . import __app_name__, __version__
 from .config import (
     get_config_path,
@@ -18,8 +16,9 @@ from .config import (
     load_config,
     set_config_value,
 )
-from .core.git_ops import get_last_tag
-from .tags import clean_all_tags, get_git_repo
+
+# GitPython and the tagging modules are imported inside the commands that use
+# them, so --help, -v and the config commands start without loading them.
 
 
 def cmd_config_set(args: argparse.Namespace) -> int:
@@ -121,6 +120,10 @@ def cmd_clean_tags(args: argparse.Namespace) -> int:
     Returns:
         int: An exit code (0 for success, 1 for failure).
     """
+    from git import Repo
+
+    from .tags import clean_all_tags, get_git_repo
+
     repo: Repo = get_git_repo()
     success: bool = clean_all_tags(repo, include_remote=not args.local_only)
 
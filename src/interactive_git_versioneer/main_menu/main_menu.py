@@ -9,7 +9,7 @@ import re
 
 from .. import __version__
 from ..config import run_config_menu
-from ..core.git_ops import get_last_tag, get_untagged_commits
+from ..core.git_ops import count_untagged_commits, get_last_tag, get_untagged_commits
 from ..core.ui import (
     Colors,
     Menu,
@@ -41,7 +41,7 @@ def run_main_menu(repo, dry_run=False, push=False) -> bool:
 
     def show_main_status():
         """Muestra el estado actual del repositorio con dashboard avanzado."""
-        current_untagged = get_untagged_commits(repo)
+        num_untagged = count_untagged_commits(repo)
 
         print(
             f"{Colors.CYAN}────────────────────────────────────────────────────────────{Colors.RESET}"
@@ -51,13 +51,13 @@ def run_main_menu(repo, dry_run=False, push=False) -> bool:
             f"{Colors.CYAN}────────────────────────────────────────────────────────────{Colors.RESET}"
         )
 
-        if len(current_untagged) == 0:
+        if num_untagged == 0:
             print(
                 f"  {Colors.GREEN}✓{Colors.RESET} {Colors.WHITE}Commits:{Colors.RESET} {Colors.GREEN}Sin pendientes{Colors.RESET}"
             )
         else:
             print(
-                f"  {Colors.YELLOW}●{Colors.RESET} {Colors.WHITE}Commits:{Colors.RESET} {Colors.YELLOW}{len(current_untagged)} pendiente(s) por etiquetar{Colors.RESET}"
+                f"  {Colors.YELLOW}●{Colors.RESET} {Colors.WHITE}Commits:{Colors.RESET} {Colors.YELLOW}{num_untagged} pendiente(s) por etiquetar{Colors.RESET}"
             )
 
         last_tag = get_last_tag(repo)
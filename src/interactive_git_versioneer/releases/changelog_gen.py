@@ -178,7 +178,7 @@ def generate_changelog(
         other: List[str] = []
 
         for commit in commits:
-            msg: str = commit.message.split("\n")[0]
+            msg: str = commit.summary
 
             if msg.startswith("feat"):
                 features.append(msg)
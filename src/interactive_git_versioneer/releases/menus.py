@@ -15,7 +15,7 @@ try:
 except ImportError:
     parse_version = None
 
-from ..core.git_ops import get_last_tag, get_untagged_commits
+from ..core.git_ops import count_untagged_commits, get_last_tag
 from ..core.ui import Colors, Menu, wait_for_enter
 from ..core.version_ops import action_update_project_version
 from .changelog_actions import (
@@ -80,8 +80,7 @@ def run_changelog_submenu(repo: git.Repo) -> bool:
         total_tags = len([t for t in repo.tags if t.name != "Unreleased"])
 
         # Contar commits sin etiquetar
-        untagged_commits = get_untagged_commits(repo)
-        num_untagged = len(untagged_commits)
+        num_untagged = count_untagged_commits(repo)
 
         # Obtener último changelog en el archivo CHANGELOG.md
         repo_root = repo.working_dir
@@ -37,6 +37,7 @@ from .actions import (
 from .ai import (
     auto_generate_all_with_ai,
     generate_ai_message,
+    generate_ai_messages_batch,
     generate_ai_tags_one_by_one,
 )
 
@@ -94,6 +95,7 @@ __all__ = [
     "sync_tags_from_remote",
     # IA
     "generate_ai_message",
+    "generate_ai_messages_batch",
     "auto_generate_all_with_ai",
     "generate_ai_tags_one_by_one",
     # Menús
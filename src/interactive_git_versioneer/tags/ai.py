@@ -4,7 +4,7 @@ Integración con IA para interactive-git-versioneer.
 Contiene funciones para generar mensajes y determinar tipos de versión usando IA.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import git
 
@@ -21,18 +21,19 @@ def _generate_with_provider(
     commit_message: str,
     commit_diff: str,
     version_type: str,
+    refresh: bool = False,
 ) -> Optional[str]:
     """Intenta generar mensaje con un proveedor específico."""
-    from ..core.ai import OpenAiCompatibleAdapter
+    from ..core.ai import get_ai_service_for
 
     try:
-        adapter = OpenAiCompatibleAdapter(
-            api_key=api_key, base_url=base_url, model=model
-        )
+        # Adaptador compartido por proveedor: reutiliza el cliente HTTP
+        adapter = get_ai_service_for(api_key, base_url, model)
         return adapter.generate_tag_message(
             commit_message=commit_message,
             commit_diff=commit_diff,
             version_type=version_type,
+            refresh=refresh,
         )
     except Exception as e:
         print(f"{Colors.RED}Error: {e}{Colors.RESET}")
@@ -102,7 +103,9 @@ def _editar_tag_manual(repo, commit, current_message) -> str:
     return current_message
 
 
-def generate_ai_message(repo: git.Repo, commit: Commit) -> Optional[str]:
+def generate_ai_message(
+    repo: git.Repo, commit: Commit, refresh: bool = False
+) -> Optional[str]:
     """Genera un mensaje usando IA para un commit.
 
     Intenta primero con el proveedor configurado, y si falla por rate limit,
@@ -111,16 +114,19 @@ def generate_ai_message(repo: git.Repo, commit: Commit) -> Optional[str]:
     Args:
         repo: Repositorio Git
         commit: Commit para el cual generar mensaje
+        refresh: Ignorar la respuesta guardada en caché y pedir una nueva
+            (para regenerar un mensaje ya mostrado)
 
     Returns:
         str o None: Mensaje generado o None si hay error
     """
-    from ..config import get_config_value
+    from ..config import get_config_values
     from ..core.ai import _is_local_provider, generate_tag_message
 
-    api_key = get_config_value("OPENAI.key")
-    base_url = get_config_value("OPENAI.baseURL")
-    model = get_config_value("OPENAI.model") or "llama3.2"
+    settings = get_config_values(("OPENAI.key", "OPENAI.baseURL", "OPENAI.model"))
+    api_key = settings["OPENAI.key"]
+    base_url = settings["OPENAI.baseURL"]
+    model = settings["OPENAI.model"] or "llama3.2"
 
     if not api_key and not _is_local_provider(base_url or ""):
         print(f"{Colors.RED}Error: API key no configurada.{Colors.RESET}")
@@ -148,7 +154,7 @@ def generate_ai_message(repo: git.Repo, commit: Commit) -> Optional[str]:
         current_api_key = "ollama"
 
     message = _generate_with_provider(
-        current_api_key, base_url, model, commit.message, diff, version_type
+        current_api_key, base_url, model, commit.message, diff, version_type, refresh
     )
 
     if message:
@@ -162,7 +168,13 @@ def generate_ai_message(repo: git.Repo, commit: Commit) -> Optional[str]:
         )
 
         message = _generate_with_provider(
-            "ollama", ollama_url, ollama_model, commit.message, diff, version_type
+            "ollama",
+            ollama_url,
+            ollama_model,
+            commit.message,
+            diff,
+            version_type,
+            refresh,
         )
         if message:
             print(f"{Colors.GREEN}✓ Mensaje generado con Ollama{Colors.RESET}")
@@ -171,6 +183,40 @@ def generate_ai_message(repo: git.Repo, commit: Commit) -> Optional[str]:
     return None
 
 
+def generate_ai_messages_batch(
+    repo: git.Repo, commits: List[Commit], diffs: Optional[Dict[str, str]] = None
+) -> List[Optional[str]]:
+    """Genera los mensajes de varios commits con una sola petición a la IA.
+
+    Args:
+        repo: Repositorio Git
+        commits: Commits para los que generar mensaje
+        diffs: Diffs ya obtenidos, indexados por hash (opcional)
+
+    Returns:
+        List[Optional[str]]: Un mensaje por commit, en el mismo orden; None
+        donde no se pudo generar (o para todos si la petición falla)
+    """
+    from ..core.ai import generate_tag_messages_batch
+
+    diffs = diffs or {}
+    items = [
+        (
+            commit.message,
+            diffs.get(commit.hash) or get_commit_diff(repo, commit.hash),
+            commit.version_type or "patch",
+        )
+        for commit in commits
+    ]
+    try:
+        return generate_tag_messages_batch(items)
+    except Exception as e:
+        print(
+            f"{Colors.YELLOW}No se pudo generar en lote ({e}). Se generarán uno a uno.{Colors.RESET}"
+        )
+        return [None] * len(commits)
+
+
 def auto_generate_all_with_ai(repo: git.Repo, commits: List[Commit]) -> None:
     """Genera automáticamente mensajes con IA para todos los commits.
 
@@ -179,7 +225,7 @@ def auto_generate_all_with_ai(repo: git.Repo, commits: List[Commit]) -> None:
         commits: Lista de commits a procesar
     """
     from ..config import get_config_value
-    from ..core.ai import determine_version_type
+    from ..core.ai import determine_version_types_parallel
 
     clear_screen()
     print_header("GENERAR TAGS")
@@ -244,21 +290,41 @@ def auto_generate_all_with_ai(repo: git.Repo, commits: List[Commit]) -> None:
     error_count = 0
     skipped_count = 0
 
+    # Primero se determina el tipo de cada commit y después se generan todos
+    # los mensajes con una sola petición a la IA.
+    pending: List[Commit] = []
+    diffs: Dict[str, str] = {}
+
+    type_results: list = []
+    if ai_decides:
+        print(f"{Colors.CYAN}Analizando tipos de versión...{Colors.RESET}")
+        print()
+        for commit in commits:
+            diffs[commit.hash] = get_commit_diff(repo, commit.hash)
+        # Las clasificaciones se piden en paralelo; cada posición contiene el
+        # resultado o la excepción de ese commit.
+        try:
+            type_results = determine_version_types_parallel(
+                [(commit.message, diffs[commit.hash]) for commit in commits]
+            )
+        except Exception as e:
+            type_results = [e] * len(commits)
+
     for i, commit in enumerate(commits, 1):
         print(
             f"{Colors.WHITE}[{i}/{len(commits)}] {commit.hash[:7]} - {commit.message[:50]}...{Colors.RESET}"
         )
 
         if ai_decides:
-            print(f"  {Colors.CYAN}Analizando tipo de versión...{Colors.RESET}")
-            diff = get_commit_diff(repo, commit.hash)
-            try:
-                version_type, reason = determine_version_type(commit.message, diff)
+            result = type_results[i - 1]
+            if not isinstance(result, BaseException):
+                version_type, reason = result
                 commit.version_type = version_type
                 print(
                     f"  {Colors.GREEN}→ {version_type.upper()}: {reason}{Colors.RESET}"
                 )
-            except Exception as e:
+            else:
+                e = result
                 error_str = str(e).lower()
                 if (
                     "401" in error_str
@@ -309,7 +375,23 @@ def auto_generate_all_with_ai(repo: git.Repo, commits: List[Commit]) -> None:
                 f"  {Colors.GREEN}→ Tipo seleccionado: {commit.version_type.upper()}{Colors.RESET}"
             )
 
-        ai_message = generate_ai_message(repo, commit)
+        pending.append(commit)
+        print()
+
+    batch_messages: List[Optional[str]] = [None] * len(pending)
+    if len(pending) > 1:
+        print(
+            f"{Colors.CYAN}Generando {len(pending)} mensajes con IA en una sola petición...{Colors.RESET}"
+        )
+        batch_messages = generate_ai_messages_batch(repo, pending, diffs)
+        print()
+
+    for commit, ai_message in zip(pending, batch_messages):
+        print(
+            f"{Colors.WHITE}{commit.hash[:7]} - {commit.message[:50]}...{Colors.RESET}"
+        )
+        if not ai_message:
+            ai_message = generate_ai_message(repo, commit)
 
         if ai_message:
             commit.custom_message = ai_message
@@ -810,7 +892,7 @@ def generate_ai_tags_one_by_one(repo: git.Repo, commits: List[Commit]) -> None:
                 return
 
             if use_message == "r":
-                ai_message = generate_ai_message(repo, commit)
+                ai_message = generate_ai_message(repo, commit, refresh=True)
                 if ai_message:
                     commit.custom_message = ai_message
                 wait_for_enter()
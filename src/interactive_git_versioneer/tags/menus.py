@@ -196,7 +196,8 @@ def show_commit_submenu(
                     )
 
             elif choice == "7":
-                ai_message = generate_ai_message(repo, commit)
+                # Se puede repetir para obtener otro mensaje: sin caché
+                ai_message = generate_ai_message(repo, commit, refresh=True)
                 if ai_message:
                     print()
                     print(f"{Colors.GREEN}Mensaje generado:{Colors.RESET}")
@@ -12,6 +12,7 @@ import git
 from .. import __version__
 from ..config import run_config_menu
 from ..core.git_ops import (
+    count_untagged_commits,
     get_commit_diff,
     get_git_repo,
     get_last_tag,
@@ -263,7 +264,7 @@ def run_tag_management_submenu(repo, untagged_commits, dry_run, push):
                         f"{Colors.WHITE}  Commit con etiqueta:{Colors.RESET} {Colors.GREEN}✓{Colors.RESET} al día"
                     )
                 else:
-                    untagged = len(get_untagged_commits(fresh_repo))
+                    untagged = count_untagged_commits(fresh_repo)
                     print(
                         f"{Colors.WHITE}  Commit:{Colors.RESET} {Colors.YELLOW}● {untagged} sin etiquetar{Colors.RESET}"
                     )
@@ -613,7 +614,7 @@ def run_interactive_tagger(dry_run: bool = False, push: bool = False) -> int:
         f"{Colors.CYAN}╔══════════════════════════════════════════════════════════╗{Colors.RESET}"
     )
     print(
-        f"{Colors.CYAN}║{Colors.RESET}  {Colors.BOLD}{Colors.WHITE}INTERACTIVE GIT VERSIONEER{Colors.RESET}                    {Colors.CYAN}v{__version__} ║{Colors.RESET}"
+        f"{Colors.CYAN}║{Colors.RESET}  {Colors.combine(Colors.BOLD, Colors.WHITE)}INTERACTIVE GIT VERSIONEER{Colors.RESET}                    {Colors.CYAN}v{__version__} ║{Colors.RESET}"
     )
     print(
         f"{Colors.CYAN}╚══════════════════════════════════════════════════════════╝{Colors.RESET}"
@@ -699,7 +700,7 @@ def run_auto_tagger(
     Returns:
         int: Código de salida (0 = éxito)
     """
-    from ..config import get_config_value
+    from ..config import get_config_values
 
     print("=" * 50)
     print("INTERACTIVE GIT TAGGER - MODO AUTOMÁTICO (CI/CD)")
@@ -712,8 +713,9 @@ def run_auto_tagger(
 
     repo = get_git_repo()
 
-    api_key = get_config_value("OPENAI.key")
-    base_url = get_config_value("OPENAI.baseURL")
+    settings = get_config_values(("OPENAI.key", "OPENAI.baseURL"))
+    api_key = settings["OPENAI.key"]
+    base_url = settings["OPENAI.baseURL"]
     use_ai = bool(api_key and base_url)
 
     if use_ai:
@@ -806,8 +808,9 @@ def run_auto_tagger(
     repo = get_git_repo()
 
     # Verificar configuración de IA
-    api_key = get_config_value("OPENAI.key")
-    base_url = get_config_value("OPENAI.baseURL")
+    settings = get_config_values(("OPENAI.key", "OPENAI.baseURL"))
+    api_key = settings["OPENAI.key"]
+    base_url = settings["OPENAI.baseURL"]
 
     if not api_key or not base_url:
         print("ERROR: Configuración de IA incompleta.")
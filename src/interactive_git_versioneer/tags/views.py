@@ -354,7 +354,7 @@ def show_local_tags(repo: git.Repo) -> None:
     items = []
     for tag in local_tags:
         tag_commit = tag.commit
-        message = tag_commit.message.split("\n")[0]
+        message = tag_commit.summary
         date = tag_commit.committed_datetime.strftime("%Y-%m-%d %H:%M")
         items.append((tag.name, tag_commit.hexsha, date, message))
 
@@ -440,11 +440,7 @@ def show_remote_tags(repo: git.Repo) -> None:
             for tag_name, commit_hash in sorted_tags:
                 try:
                     commit_obj = repo.commit(commit_hash)
-                    message = (
-                        commit_obj.message.split("\n")[0]
-                        if commit_obj.message
-                        else "Sin mensaje"
-                    )
+                    message = commit_obj.summary or "Sin mensaje"
                     date = commit_obj.committed_datetime.strftime("%Y-%m-%d %H:%M")
                     items.append((tag_name, commit_hash, date, message))
                 except Exception:
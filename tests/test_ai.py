@@ -0,0 +1,578 @@
+"""Tests for the AI adapter."""
+
+import asyncio
+import sqlite3
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from interactive_git_versioneer.core import ai
+from interactive_git_versioneer.core.ai import OpenAiCompatibleAdapter, _AiCache
+
+
+@pytest.fixture(autouse=True)
+def ai_cache(tmp_path, monkeypatch):
+    """Keeps every test on its own response cache instead of ~/.igv."""
+    cache = _AiCache(tmp_path / "ai_cache.sqlite")
+    monkeypatch.setattr(ai, "_AI_CACHE", cache)
+    return cache
+
+
+def _chunk(text):
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = text
+    return chunk
+
+
+def _response(content):
+    """Mock response usable both as a plain completion and as a stream."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.__iter__.return_value = iter([_chunk(c) for c in content])
+    return response
+
+
+def _adapter(*contents):
+    adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [_response(c) for c in contents]
+    adapter._get_client = lambda: client
+    return adapter, client
+
+
+class TestGenerateTagMessagesBatch:
+    ITEMS = [
+        ("feat: add login", "diff a", "minor"),
+        ("fix: crash", "diff b", "patch"),
+        ("docs: readme", "diff c", "patch"),
+    ]
+
+    @pytest.fixture(autouse=True)
+    def templates(self, monkeypatch):
+        """Default prompts regardless of the templates in ~/.igv."""
+        monkeypatch.setattr(ai, "load_prompt_tags_template", lambda: None)
+        monkeypatch.setattr(ai, "get_tag_detail_level", lambda: "detailed")
+
+    def test_single_request_for_all_commits(self):
+        adapter, client = _adapter("1: Add login\n2: Fix crash\n3. Update readme")
+
+        result = adapter.generate_tag_messages_batch(self.ITEMS)
+
+        assert result == ["Add login", "Fix crash", "Update readme"]
+        assert client.chat.completions.create.call_count == 1
+        kwargs = client.chat.completions.create.call_args.kwargs
+        assert kwargs["max_tokens"] == 300
+
+    def test_missing_entries_fall_back_to_single_requests(self):
+        adapter, client = _adapter("1: Add login\n3: Update readme", "Fix crash")
+
+        result = adapter.generate_tag_messages_batch(self.ITEMS)
+
+        assert result == ["Add login", "Fix crash", "Update readme"]
+        assert client.chat.completions.create.call_count == 2
+
+    def test_large_batches_are_split(self):
+        adapter, client = _adapter("1: Add a\n2: Add b", "1: Add c\n2: Add d", "Add e")
+        adapter.BATCH_SIZE = 2
+        items = [(f"feat: {c}", f"diff {c}", "minor") for c in "abcde"]
+
+        result = adapter.generate_tag_messages_batch(items)
+
+        assert result == ["Add a", "Add b", "Add c", "Add d", "Add e"]
+        calls = client.chat.completions.create.call_args_list
+        assert [call.kwargs["max_tokens"] for call in calls[:2]] == [200, 200]
+        assert "feat: c" in calls[1].kwargs["messages"][1]["content"]
+        assert "feat: a" not in calls[1].kwargs["messages"][1]["content"]
+
+    def test_failed_later_chunk_keeps_earlier_messages(self):
+        adapter, client = _adapter()
+        client.chat.completions.create.side_effect = [
+            _response("1: Add a\n2: Add b"),
+            RuntimeError("rate limited"),
+        ]
+        adapter.BATCH_SIZE = 2
+        items = [(f"feat: {c}", f"diff {c}", "minor") for c in "abcd"]
+
+        assert adapter.generate_tag_messages_batch(items) == [
+            "Add a",
+            "Add b",
+            None,
+            None,
+        ]
+
+    def test_failed_first_chunk_raises(self):
+        adapter, client = _adapter()
+        client.chat.completions.create.side_effect = RuntimeError("rate limited")
+
+        with pytest.raises(RuntimeError):
+            adapter.generate_tag_messages_batch(self.ITEMS)
+
+    def test_prompt_uses_tag_diff_limit_and_detail_level(self):
+        items = [(m, "x" * 5000, t) for m, _, t in self.ITEMS]
+
+        prompt = ai._build_batch_prompt(items, 72, "es", "comprehensive")
+
+        assert "Generate comprehensive detailed messages" in prompt
+        assert "x" * ai._TAG_DIFF_LIMIT + "\n```" in prompt
+        assert "x" * (ai._TAG_DIFF_LIMIT + 1) not in prompt
+
+    def test_custom_template_requests_each_commit(self, monkeypatch):
+        monkeypatch.setattr(
+            ai, "load_prompt_tags_template", lambda: "Mi plantilla {type}"
+        )
+        adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=[
+                _response("Add login"),
+                RuntimeError("rate limited"),
+                _response("Update readme"),
+            ]
+        )
+        client.close = AsyncMock()
+        adapter._new_async_client = lambda: client
+
+        result = adapter.generate_tag_messages_batch(self.ITEMS)
+
+        assert result == ["Add login", None, "Update readme"]
+        prompts = [
+            call.kwargs["messages"][1]["content"]
+            for call in client.chat.completions.create.call_args_list
+        ]
+        assert sorted(p.split("\n")[0] for p in prompts) == [
+            "Mi plantilla minor",
+            "Mi plantilla patch",
+            "Mi plantilla patch",
+        ]
+
+    def test_single_item_uses_regular_path(self):
+        adapter, client = _adapter("Add login")
+
+        assert adapter.generate_tag_messages_batch(self.ITEMS[:1]) == ["Add login"]
+
+
+class TestServiceReuse:
+    def setup_method(self):
+        ai.reset_ai_service_cache()
+
+    def teardown_method(self):
+        ai.reset_ai_service_cache()
+
+    def test_same_settings_share_adapter(self):
+        settings = {
+            "OPENAI.key": "k",
+            "OPENAI.baseURL": "https://api.groq.com/openai/v1",
+            "OPENAI.model": "m",
+        }
+        with patch.object(ai, "get_config_values", return_value=settings):
+            assert ai.get_ai_service() is ai.get_ai_service()
+
+    def test_changed_settings_build_new_adapter(self):
+        first = {"OPENAI.key": "k", "OPENAI.baseURL": "https://a", "OPENAI.model": "m"}
+        second = dict(first, **{"OPENAI.model": "other"})
+        with patch.object(ai, "get_config_values", side_effect=[first, second]):
+            assert ai.get_ai_service() is not ai.get_ai_service()
+
+    def test_explicit_settings_share_configured_adapter(self):
+        settings = {
+            "OPENAI.key": "k",
+            "OPENAI.baseURL": "https://a",
+            "OPENAI.model": "m",
+        }
+        with patch.object(ai, "get_config_values", return_value=settings):
+            configured = ai.get_ai_service()
+        assert ai.get_ai_service_for("k", "https://a", "m") is configured
+        assert ai.get_ai_service_for(None, "http://localhost:11434/v1", None)
+
+    def test_client_is_created_once(self):
+        adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+        with patch("openai.OpenAI") as openai_cls:
+            assert adapter._get_client() is adapter._get_client()
+        assert openai_cls.call_count == 1
+
+
+class TestParallelRequests:
+    def _async_client(self, side_effect):
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=side_effect)
+        client.close = AsyncMock()
+        return client
+
+    def test_classifies_all_items_and_keeps_order(self):
+        adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+        client = self._async_client(
+            [
+                _response("TYPE: minor\nREASON: nueva función"),
+                _response("TYPE: patch\nREASON: corrección"),
+            ]
+        )
+        with patch.object(adapter, "_new_async_client", return_value=client):
+            result = adapter.determine_version_types_parallel(
+                [("add x", "d1"), ("correct y", "d2")]
+            )
+
+        assert result == [("minor", "nueva función"), ("patch", "corrección")]
+        client.close.assert_awaited_once()
+
+    def test_failures_are_returned_in_place(self):
+        adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+        error = RuntimeError("rate limited")
+        client = self._async_client([_response("Add login"), error])
+        with patch.object(adapter, "_new_async_client", return_value=client):
+            result = adapter.generate_tag_messages_parallel(
+                [("feat: login", "d1", "minor"), ("fix: y", "d2", "patch")]
+            )
+
+        assert result == ["Add login", error]
+
+    def test_concurrency_is_bounded(self):
+        adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+        adapter.MAX_CONCURRENCY = 2
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _response("TYPE: patch\nREASON: x")
+
+        client = MagicMock()
+        client.chat.completions.create = create
+        client.close = AsyncMock()
+        with patch.object(adapter, "_new_async_client", return_value=client):
+            adapter.determine_version_types_parallel([("m", "d")] * 6)
+
+        assert peak == 2
+
+
+class TestResponseCache:
+    def test_repeated_request_is_served_from_cache(self):
+        adapter, client = _adapter("Add login")
+
+        first = adapter.generate_tag_message("feat: add login", "diff a", "minor")
+        second = adapter.generate_tag_message("feat: add login", "diff a", "minor")
+
+        assert first == second == "Add login"
+        assert client.chat.completions.create.call_count == 1
+
+    def test_different_diff_is_not_a_hit(self):
+        adapter, client = _adapter("Add login", "Add logout")
+
+        adapter.generate_tag_message("feat: auth", "diff a", "minor")
+        result = adapter.generate_tag_message("feat: auth", "diff b", "minor")
+
+        assert result == "Add logout"
+        assert client.chat.completions.create.call_count == 2
+
+    def test_refresh_makes_a_new_request(self):
+        adapter, client = _adapter("Add login", "Add sign-in form")
+
+        adapter.generate_tag_message("feat: add login", "diff a", "minor")
+        second = adapter.generate_tag_message(
+            "feat: add login", "diff a", "minor", refresh=True
+        )
+        third = adapter.generate_tag_message("feat: add login", "diff a", "minor")
+
+        assert second == third == "Add sign-in form"
+        assert client.chat.completions.create.call_count == 2
+
+    def test_regenerate_bypasses_cache(self, monkeypatch):
+        adapter, client = _adapter("Mensaje 0", "Mensaje 1")
+        monkeypatch.setattr(ai, "get_ai_service", lambda: adapter)
+
+        first = ai.generate_tag_message("feat: x", "diff", "minor")
+        second = ai.generate_tag_message("feat: x", "diff", "minor", refresh=True)
+
+        assert (first, second) == ("Mensaje 0", "Mensaje 1")
+        assert client.chat.completions.create.call_count == 2
+
+    def test_expired_entries_are_ignored(self, ai_cache):
+        ai_cache.put(b"key", "old")
+        ai_cache._connect().execute(
+            "UPDATE responses SET created_at = ?",
+            (int(time.time()) - _AiCache.TTL_SECONDS - 1,),
+        )
+
+        assert ai_cache.get(b"key") is None
+
+    def test_database_errors_behave_as_misses(self, ai_cache):
+        ai_cache._conn = MagicMock()
+        ai_cache._conn.execute.side_effect = sqlite3.OperationalError("locked")
+
+        ai_cache.put(b"key", "value")
+        assert ai_cache.get(b"key") is None
+
+
+class TestPromptTemplates:
+    def test_tag_prompt_fills_every_placeholder(self):
+        with patch.object(
+            ai, "load_prompt_tags_template", return_value=None
+        ), patch.object(ai, "get_tag_detail_level", return_value="concise"):
+            prompt = ai._build_prompt_from_template(
+                "feat: {braces} kept", "diff a", "minor", 72, "es", is_tag=True
+            )
+
+        assert "Maximum 72 characters" in prompt
+        assert "Original commit message: feat: {braces} kept" in prompt
+        assert "Format: minor" in prompt
+        assert "{" not in prompt.replace("{braces}", "")
+
+    def test_version_prompt_includes_commit(self):
+        request = ai._version_type_request("m", "fix: crash", "diff b")
+
+        prompt = request["messages"][1]["content"]
+        assert prompt.startswith("Classify this git commit")
+        assert "Commit message: fix: crash" in prompt
+        assert "diff b" in prompt
+
+
+class TestDiffTruncation:
+    def test_short_diff_is_sent_unchanged(self):
+        diff = "x" * 10
+        request = ai._version_type_request("m", "fix", diff)
+
+        assert f"```\n{diff}\n```" in request["messages"][1]["content"]
+
+    def test_long_diff_is_cut_to_limit(self):
+        diff = "a" * ai._VERSION_DIFF_LIMIT + "b" * 10
+        request = ai._version_type_request("m", "fix", diff)
+
+        prompt = request["messages"][1]["content"]
+        assert "a" * ai._VERSION_DIFF_LIMIT in prompt
+        assert "b" not in prompt.split("```")[1]
+
+
+class TestParseVersionType:
+    def test_reads_type_and_reason(self):
+        content = "TYPE: minor\nREASON: Nueva funcionalidad"
+
+        assert ai._parse_version_type(content) == ("minor", "Nueva funcionalidad")
+
+    def test_accepts_spanish_labels_in_any_case(self):
+        content = "  tipo: MAJOR\nrazón: Cambio incompatible  "
+
+        assert ai._parse_version_type(content) == ("major", "Cambio incompatible")
+
+    def test_invalid_type_falls_back_to_patch(self):
+        content = "TYPE: huge\nREASON: algo"
+
+        assert ai._parse_version_type(content) == ("patch", "algo")
+
+    def test_stops_after_both_fields(self):
+        content = "TYPE: minor\nREASON: primera\nTYPE: major\nREASON: segunda"
+
+        assert ai._parse_version_type(content) == ("minor", "primera")
+
+    def test_unknown_labels_are_ignored(self):
+        content = "Note: TYPE: major\nTYPE: patch\nREASON: arreglo"
+
+        assert ai._parse_version_type(content) == ("patch", "arreglo")
+
+    def test_missing_lines_use_defaults(self):
+        assert ai._parse_version_type("no idea") == ("patch", "Cambio menor")
+
+
+class TestStreamedTagMessage:
+    def test_stops_reading_after_first_line(self):
+        adapter, client = _adapter()
+        response = MagicMock()
+        chunks = [_chunk("Add "), _chunk("login\n"), _chunk("more")]
+        consumed = []
+
+        def _iter():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        response.__iter__.return_value = _iter()
+        client.chat.completions.create.side_effect = [response]
+
+        assert adapter.generate_tag_message("feat", "diff", "minor") == "Add login"
+        assert len(consumed) == 2
+        response.close.assert_called_once()
+        kwargs = client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["max_tokens"] == 40
+
+    def test_leading_blank_lines_are_skipped(self):
+        adapter, client = _adapter('\n\n"Fix crash"\nbody')
+
+        assert adapter.generate_tag_message("fix", "diff", "patch") == "Fix crash"
+
+
+class TestConventionalPrefilter:
+    def test_clear_prefixes_skip_the_request(self):
+        adapter, client = _adapter()
+
+        assert adapter.determine_version_type("feat(ui): add login", "d")[0] == "minor"
+        assert adapter.determine_version_type("fix: crash", "d")[0] == "patch"
+        assert adapter.determine_version_type("docs: readme", "d")[0] == "patch"
+        client.chat.completions.create.assert_not_called()
+
+    def test_reason_is_in_spanish(self):
+        adapter, _ = _adapter()
+
+        assert adapter.determine_version_type("feat(ui): add login", "d") == (
+            "minor",
+            "Commit convencional 'feat'",
+        )
+
+    def test_breaking_changes_are_major(self):
+        adapter, client = _adapter()
+
+        assert adapter.determine_version_type("feat!: drop py2", "d")[0] == "major"
+        assert (
+            adapter.determine_version_type("fix: x\n\nBREAKING CHANGE: y", "d")[0]
+            == "major"
+        )
+        client.chat.completions.create.assert_not_called()
+
+    def test_ambiguous_commits_ask_the_model(self):
+        adapter, client = _adapter(
+            "TYPE: minor\nREASON: mejora", "TYPE: patch\nREASON: limpieza"
+        )
+
+        assert adapter.determine_version_type("refactor: parser", "d1")[0] == "minor"
+        assert adapter.determine_version_type("update things", "d2")[0] == "patch"
+        assert client.chat.completions.create.call_count == 2
+
+    def test_parallel_only_sends_unresolved_commits(self):
+        adapter = OpenAiCompatibleAdapter(api_key="k", base_url="https://x", model="m")
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=[
+                _response("TYPE: minor\nREASON: a"),
+                _response("TYPE: patch\nREASON: b"),
+            ]
+        )
+        client.close = AsyncMock()
+        with patch.object(adapter, "_new_async_client", return_value=client):
+            result = adapter.determine_version_types_parallel(
+                [("update a", "d1"), ("fix: y", "d2"), ("tweak b", "d3")]
+            )
+
+        assert [r[0] for r in result] == ["minor", "patch", "patch"]
+        assert result[1] == ("patch", "Commit convencional 'fix'")
+        assert client.chat.completions.create.await_count == 2
+
+
+class TestIterModels:
+    SETTINGS = {"OPENAI.key": "k", "OPENAI.baseURL": "https://openrouter.ai/api/v1"}
+
+    def _models(self):
+        def model(model_id, prompt="0", completion="0"):
+            m = MagicMock(spec=["id", "owned_by", "model_extra"])
+            m.id = model_id
+            m.owned_by = "x"
+            m.model_extra = {
+                "pricing": {"prompt": prompt, "completion": completion},
+                "context_length": 8192,
+            }
+            return m
+
+        return [
+            model("zeta/paid", "0.1", "0.2"),
+            model("alpha/free"),
+            model("beta:free", "0.1", "0.1"),
+        ]
+
+    def _patched(self):
+        client = MagicMock()
+        client.models.list.return_value.data = self._models()
+        openai_module = MagicMock()
+        openai_module.OpenAI.return_value = client
+        return (
+            patch.object(ai, "get_config_values", return_value=self.SETTINGS),
+            patch.object(ai, "_openai", return_value=openai_module),
+        )
+
+    def test_list_is_sorted_by_id(self):
+        config, openai = self._patched()
+        with config, openai:
+            models = ai.list_available_models()
+
+        assert [m["id"] for m in models] == ["alpha/free", "beta:free", "zeta/paid"]
+        assert models[0] == {
+            "id": "alpha/free",
+            "context_window": 8192,
+            "owned_by": "x",
+            "is_free": True,
+        }
+
+    def test_free_only_skips_paid_models(self):
+        config, openai = self._patched()
+        with config, openai:
+            ids = [m["id"] for m in ai.iter_models(free_only=True)]
+
+        assert ids == ["alpha/free", "beta:free"]
+
+    def test_errors_yield_an_empty_list(self):
+        config, openai = self._patched()
+        with config, openai as openai_module:
+            openai_module.return_value.OpenAI.side_effect = RuntimeError("down")
+            assert ai.list_available_models() == []
+
+    def test_unconfigured_provider_yields_nothing(self):
+        with patch.object(
+            ai,
+            "get_config_values",
+            return_value={"OPENAI.key": None, "OPENAI.baseURL": None},
+        ):
+            assert list(ai.iter_models()) == []
+
+    def test_groq_uses_free_model_set(self):
+        models = []
+        for model_id in ("llama-3.1-8b-instant", "some-paid-model"):
+            m = MagicMock(spec=["id", "owned_by", "context_window"])
+            m.id = model_id
+            m.owned_by = "groq"
+            m.context_window = 131072
+            models.append(m)
+        client = MagicMock()
+        client.models.list.return_value.data = models
+        openai_module = MagicMock()
+        openai_module.OpenAI.return_value = client
+        settings = {
+            "OPENAI.key": "k",
+            "OPENAI.baseURL": "https://api.groq.com/openai/v1",
+        }
+
+        with patch.object(ai, "get_config_values", return_value=settings), patch.object(
+            ai, "_openai", return_value=openai_module
+        ):
+            result = ai.list_available_models()
+
+        assert [(m["id"], m["is_free"]) for m in result] == [
+            ("llama-3.1-8b-instant", True),
+            ("some-paid-model", False),
+        ]
+        assert result[0]["context_window"] == 131072
+
+
+class TestHttpClient:
+    def test_tuned_client_when_httpx_is_available(self, monkeypatch):
+        fake_httpx = MagicMock()
+        monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
+        monkeypatch.setattr(ai, "_HTTP2", True)
+
+        kwargs = ai._http_client_kwargs(use_async=True)
+
+        assert kwargs["http_client"] is fake_httpx.AsyncClient.return_value
+        client_kwargs = fake_httpx.AsyncClient.call_args.kwargs
+        assert client_kwargs["http2"] is True
+        assert client_kwargs["timeout"] is kwargs["timeout"]
+        fake_httpx.Limits.assert_called_once_with(
+            max_connections=32, max_keepalive_connections=32, keepalive_expiry=60.0
+        )
+
+    def test_openai_defaults_without_httpx(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "httpx", None)
+
+        assert ai._http_client_kwargs(use_async=False) == {}
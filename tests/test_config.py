@@ -15,6 +15,7 @@ def config_dir(tmp_path, monkeypatch):
     fake_path = tmp_path / "config.json"
     # Patch at module level to ensure all imports use the test path
     monkeypatch.setattr(config, "get_config_path", lambda: fake_path)
+    monkeypatch.setattr(config, "_CACHE", None)
     yield fake_path
 
 
@@ -30,6 +31,92 @@ class TestLoadConfig:
         config_dir.write_text("not valid json", encoding="utf-8")
         assert config.load_config() == {}
 
+    def test_load_config_invalid_utf8(self, config_dir):
+        config_dir.write_bytes(b"\xff\xfe\x00")
+        assert config.load_config() == {}
+
+    def test_load_config_propagates_permission_error(self, config_dir):
+        config_dir.write_text(json.dumps({"key": "value"}), encoding="utf-8")
+        with patch.object(
+            config.Path, "read_bytes", side_effect=PermissionError("denied")
+        ):
+            with pytest.raises(PermissionError):
+                config.load_config()
+
+
+class TestLoadConfigCache:
+    def test_repeated_load_skips_parse(self, config_dir):
+        config_dir.write_text(json.dumps({"key": "value"}), encoding="utf-8")
+        first = config.load_config()
+        with patch.object(config, "_parse_json") as mock_load:
+            assert config.load_config() == first
+        mock_load.assert_not_called()
+
+    def test_returned_dict_is_independent_of_cache(self, config_dir):
+        config.set_config_value("OPENAI.key", "k")
+        loaded = config.load_config()
+        loaded["OPENAI"]["key"] = "changed"
+        assert config.load_config() == {"OPENAI": {"key": "k"}}
+        assert config.get_config_value("OPENAI.key") == "k"
+
+    def test_caller_changes_after_save_do_not_reach_cache(self, config_dir):
+        data = {"OPENAI": {"key": "k"}}
+        config.save_config(data)
+        data["OPENAI"]["key"] = "changed"
+        assert config.load_config() == {"OPENAI": {"key": "k"}}
+        assert config.get_config_value("OPENAI.key") == "k"
+
+    def test_reloads_when_file_changes(self, config_dir):
+        config_dir.write_text(json.dumps({"key": "value"}), encoding="utf-8")
+        assert config.load_config() == {"key": "value"}
+        config_dir.write_text(json.dumps({"key": "other-value"}), encoding="utf-8")
+        assert config.load_config() == {"key": "other-value"}
+
+    def test_save_refreshes_cache(self, config_dir):
+        config.save_config({"hello": "world"})
+        with patch.object(config, "_parse_json") as mock_load:
+            assert config.load_config() == {"hello": "world"}
+        mock_load.assert_not_called()
+
+    def test_set_does_not_mutate_cached_dict(self, config_dir):
+        config.set_config_value("OPENAI.key", "old")
+        cached = config.load_config()
+        config.set_config_value("OPENAI.key", "new")
+        assert cached["OPENAI"]["key"] == "old"
+        assert config.get_config_value("OPENAI.key") == "new"
+
+
+class TestJsonBackends:
+    def test_roundtrip_without_orjson(self, config_dir, monkeypatch):
+        monkeypatch.setattr(config, "orjson", None)
+        config.save_config(
+            {"OPENAI": {"model": "llama-3.3-70b-versatile"}, "name": "ñandú"}
+        )
+        monkeypatch.setattr(config, "_CACHE", None)
+        assert config.load_config() == {
+            "OPENAI": {"model": "llama-3.3-70b-versatile"},
+            "name": "ñandú",
+        }
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_by_default_pretty_on_request(
+        self, config_dir, monkeypatch, use_orjson
+    ):
+        if not use_orjson:
+            monkeypatch.setattr(config, "orjson", None)
+        monkeypatch.delenv("IGV_PRETTY", raising=False)
+        config.save_config({"OPENAI": {"key": "k"}})
+        assert "\n" not in config_dir.read_text(encoding="utf-8")
+
+        monkeypatch.setenv("IGV_PRETTY", "1")
+        config.save_config({"OPENAI": {"key": "k"}})
+        assert "\n" in config_dir.read_text(encoding="utf-8")
+
+    def test_invalid_json_without_orjson(self, config_dir, monkeypatch):
+        monkeypatch.setattr(config, "orjson", None)
+        config_dir.write_text("not valid json", encoding="utf-8")
+        assert config.load_config() == {}
+
 
 class TestSaveConfig:
     def test_save_config_creates_file(self, config_dir):
@@ -43,6 +130,18 @@ class TestSaveConfig:
         config.save_config({"nested": True})
         assert nested.exists()
 
+    def test_save_config_leaves_no_temp_file(self, config_dir):
+        config.save_config({"hello": "world"})
+        assert [p.name for p in config_dir.parent.iterdir()] == ["config.json"]
+
+    def test_failed_save_keeps_previous_file(self, config_dir):
+        config.save_config({"hello": "world"})
+        with patch.object(config.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                config.save_config({"hello": "changed"})
+        assert json.loads(config_dir.read_text(encoding="utf-8")) == {"hello": "world"}
+        assert not config_dir.with_suffix(".json.tmp").exists()
+
 
 class TestSetAndGetConfigValue:
     def test_set_and_get_simple_key(self, config_dir):
@@ -58,6 +157,13 @@ class TestSetAndGetConfigValue:
         config.set_config_value("name", "new")
         assert config.get_config_value("name") == "new"
 
+    def test_set_same_value_skips_write(self, config_dir):
+        config.set_config_value("OPENAI.key", "same")
+        with patch.object(config, "save_config") as mock_save:
+            config.set_config_value("OPENAI.key", "same")
+            config.set_config_values({"OPENAI.key": "same"})
+        mock_save.assert_not_called()
+
     def test_get_missing_key_returns_none(self, config_dir):
         assert config.get_config_value("missing") is None
 
@@ -69,3 +175,98 @@ class TestSetAndGetConfigValue:
         """Getting a key that points to a dict (not a leaf) returns None."""
         config.set_config_value("SECTION.child", "val")
         assert config.get_config_value("SECTION") is None
+
+
+class TestBatchedSet:
+    def test_set_config_values_writes_once(self, config_dir):
+        with patch.object(config, "save_config", wraps=config.save_config) as spy:
+            config.set_config_values(
+                {"OPENAI.key": "k", "OPENAI.model": "m", "name": "igv"}
+            )
+        assert spy.call_count == 1
+        assert config.get_config_value("OPENAI.key") == "k"
+        assert config.get_config_value("OPENAI.model") == "m"
+        assert config.get_config_value("name") == "igv"
+
+    def test_editing_config_saves_on_exit(self, config_dir):
+        with config.editing_config() as cfg:
+            cfg["OPENAI"] = {"baseURL": "https://example.com/v1"}
+        assert config.get_config_value("OPENAI.baseURL") == "https://example.com/v1"
+
+    def test_editing_config_discards_on_error(self, config_dir):
+        config.set_config_value("name", "igv")
+        with pytest.raises(RuntimeError):
+            with config.editing_config() as cfg:
+                cfg["name"] = "changed"
+                raise RuntimeError("boom")
+        assert config.get_config_value("name") == "igv"
+
+
+class TestGetConfigValues:
+    def test_resolves_many_keys_with_one_load(self, config_dir):
+        config.set_config_values({"OPENAI.key": "k", "OPENAI.model": "m"})
+        with patch.object(config, "_load_cached", wraps=config._load_cached) as spy:
+            values = config.get_config_values(
+                ["OPENAI.key", "OPENAI.model", "OPENAI.baseURL", "OPENAI"]
+            )
+        assert spy.call_count == 1
+        assert values == {
+            "OPENAI.key": "k",
+            "OPENAI.model": "m",
+            "OPENAI.baseURL": None,
+            "OPENAI": None,
+        }
+
+    def test_lookup_does_not_walk_nested_dict(self, config_dir):
+        config.set_config_value("OPENAI.key", "k")
+        config.load_config()
+        with patch.object(config, "_flatten") as mock_flatten:
+            assert config.get_config_value("OPENAI.key") == "k"
+        mock_flatten.assert_not_called()
+
+    def test_keys_containing_dots_are_not_addressable(self, config_dir):
+        config_dir.write_text(json.dumps({"a.b": {"c": "x"}}), encoding="utf-8")
+        assert config.get_config_value("a.b.c") is None
+
+
+@pytest.fixture
+def igv_dir(tmp_path, monkeypatch):
+    """Redirect config.ini and the prompt templates to a temp directory."""
+    monkeypatch.setattr(config, "get_ini_config_path", lambda: tmp_path / "config.ini")
+    monkeypatch.setattr(
+        config, "get_prompt_tags_template_path", lambda: tmp_path / "prompt_tags.txt"
+    )
+    monkeypatch.setattr(config, "_FILE_CACHE", {})
+    yield tmp_path
+
+
+class TestFileCache:
+    def test_ini_lookups_parse_once(self, igv_dir):
+        (igv_dir / "config.ini").write_text("[TAGS]\ndetailLevel = concise\n")
+        with patch.object(config, "_parse_ini", wraps=config._parse_ini) as spy:
+            assert config.get_tag_detail_level() == "concise"
+            assert config.get_ini_value("TAGS", "detailLevel") == "concise"
+        assert spy.call_count == 1
+
+    def test_ini_change_is_picked_up(self, igv_dir):
+        ini = igv_dir / "config.ini"
+        ini.write_text("[TAGS]\ndetailLevel = concise\n")
+        assert config.get_tag_detail_level() == "concise"
+
+        ini.write_text("[TAGS]\ndetailLevel = comprehensive\n")
+        assert config.get_tag_detail_level() == "comprehensive"
+
+    def test_load_ini_config_returns_independent_parser(self, igv_dir):
+        (igv_dir / "config.ini").write_text("[TAGS]\ndetailLevel = concise\n")
+        config.get_tag_detail_level()
+
+        parser = config.load_ini_config()
+        parser.set("TAGS", "detailLevel", "detailed")
+
+        assert config.get_tag_detail_level() == "concise"
+
+    def test_template_created_after_first_read(self, igv_dir):
+        assert config.load_prompt_tags_template() is None
+
+        (igv_dir / "prompt_tags.txt").write_text("Max {maxLength}", encoding="utf-8")
+        assert config.load_prompt_tags_template() == "Max {maxLength}"
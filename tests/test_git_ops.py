@@ -1,17 +1,51 @@
 """Tests for the git_ops module."""
 
+import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
+import git
 import pytest
+from git import Repo
 
+from interactive_git_versioneer.core import git_ops
 from interactive_git_versioneer.core.git_ops import (
+    close_diff_batchers,
+    get_commit_diff,
     get_last_tag,
     get_last_version_number,
     get_next_version,
+    get_untagged_commits,
     parse_version,
 )
 
 
+@pytest.fixture
+def git_repo(tmp_path):
+    """Real repository with helpers to add commits and tags."""
+
+    def run(*args):
+        subprocess.run(
+            ["git", "-C", str(tmp_path), *args], check=True, capture_output=True
+        )
+
+    run("init", "-q")
+    run("config", "user.email", "dev@example.com")
+    run("config", "user.name", "Dev Ñ")
+
+    def commit(message, name="file.txt"):
+        (tmp_path / name).write_text(message, encoding="utf-8")
+        run("add", ".")
+        run("commit", "-q", "-m", message)
+
+    repo = Repo(tmp_path)
+    repo.run = run
+    repo.commit_file = commit
+    yield repo
+    close_diff_batchers()
+    repo.close()
+
+
 class TestParseVersion:
     def test_standard_version(self):
         assert parse_version("v1.2.3") == (1, 2, 3)
@@ -38,6 +72,10 @@ class TestParseVersion:
         # Solo toma los primeros 3
         assert parse_version("v1.2.3.4") == (1, 2, 3)
 
+    @pytest.mark.parametrize("tag", ["v1.2.3-rc1", "v1.+2.3", "v1. 2.3", "v1.2_0.3"])
+    def test_non_digit_components_return_zeros(self, tag):
+        assert parse_version(tag) == (0, 0, 0)
+
 
 def _make_tag(name):
     tag = MagicMock()
@@ -45,40 +83,52 @@ def _make_tag(name):
     return tag
 
 
+def _repo_with_tags(*names):
+    """Mock repo whose tags are visible through both git tag and repo.tags."""
+    repo = MagicMock()
+    repo.tags = [_make_tag(name) for name in names]
+    repo.git.tag.return_value = "\n".join(names)
+    return repo
+
+
 class TestGetLastTag:
     def test_returns_highest_version(self):
-        repo = MagicMock()
-        repo.tags = [_make_tag("v1.0.0"), _make_tag("v2.1.0"), _make_tag("v1.5.3")]
+        repo = _repo_with_tags("v1.0.0", "v2.1.0", "v1.5.3")
         assert get_last_tag(repo) == "v2.1.0"
 
     def test_no_tags_returns_none(self):
-        repo = MagicMock()
-        repo.tags = []
+        repo = _repo_with_tags()
         assert get_last_tag(repo) is None
 
     def test_single_tag(self):
-        repo = MagicMock()
-        repo.tags = [_make_tag("v0.1.0")]
+        repo = _repo_with_tags("v0.1.0")
         assert get_last_tag(repo) == "v0.1.0"
 
+    def test_version_order_not_git_order(self):
+        # git's v:refname sort puts the pre-release first; parse_version
+        # ranks it as 0.0.0
+        repo = _repo_with_tags("v2.0.0-rc1", "v1.9.0")
+        assert get_last_tag(repo) == "v1.9.0"
+
+    def test_falls_back_to_tag_objects_on_git_error(self):
+        repo = _repo_with_tags("v1.0.0", "v1.2.0")
+        repo.git.tag.side_effect = git.GitCommandError("tag", 1)
+        assert get_last_tag(repo) == "v1.2.0"
+
 
 class TestGetLastVersionNumber:
     def test_with_tags(self):
-        repo = MagicMock()
-        repo.tags = [_make_tag("v3.2.1")]
+        repo = _repo_with_tags("v3.2.1")
         assert get_last_version_number(repo) == (3, 2, 1)
 
     def test_no_tags(self):
-        repo = MagicMock()
-        repo.tags = []
+        repo = _repo_with_tags()
         assert get_last_version_number(repo) == (0, 0, 0)
 
 
 class TestGetNextVersion:
     def _repo_with_tag(self, tag_name):
-        repo = MagicMock()
-        repo.tags = [_make_tag(tag_name)]
-        return repo
+        return _repo_with_tags(tag_name)
 
     def test_patch_bump(self):
         repo = self._repo_with_tag("v1.2.3")
@@ -93,21 +143,214 @@ class TestGetNextVersion:
         assert get_next_version(repo, "major") == "v2.0.0"
 
     def test_first_patch_from_zero(self):
-        repo = MagicMock()
-        repo.tags = []
+        repo = _repo_with_tags()
         assert get_next_version(repo, "patch") == "v0.0.1"
 
     def test_first_minor_from_zero(self):
-        repo = MagicMock()
-        repo.tags = []
+        repo = _repo_with_tags()
         assert get_next_version(repo, "minor") == "v0.1.0"
 
     def test_first_major_from_zero(self):
-        repo = MagicMock()
-        repo.tags = []
+        repo = _repo_with_tags()
         assert get_next_version(repo, "major") == "v1.0.0"
 
     def test_invalid_version_type_raises(self):
         repo = self._repo_with_tag("v1.0.0")
         with pytest.raises(ValueError, match="Invalid version type"):
             get_next_version(repo, "invalid")
+
+
+class TestGetUntaggedCommits:
+    def test_commits_after_last_tag(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "v1.0.0")
+        git_repo.commit_file("fix: second")
+        git_repo.commit_file("docs: third")
+
+        commits = get_untagged_commits(git_repo)
+
+        assert [c.message for c in commits] == ["fix: second", "docs: third"]
+        head = git_repo.head.commit
+        newest = next(c for c in commits if c.hash == head.hexsha)
+        assert newest.author == "Dev Ñ"
+        assert newest.date == head.committed_datetime.strftime("%Y-%m-%d")
+        assert newest.datetime == head.committed_datetime.isoformat()
+
+    def test_without_tags_returns_all_commits(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: second")
+
+        assert len(get_untagged_commits(git_repo)) == 2
+
+    def test_keeps_full_message_body(self, git_repo):
+        git_repo.commit_file("feat: api\n\nBREAKING CHANGE: removed v1 endpoints")
+
+        (commit,) = get_untagged_commits(git_repo)
+
+        assert commit.message == "feat: api\n\nBREAKING CHANGE: removed v1 endpoints"
+
+    def test_message_may_contain_field_separator(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: odd \x1f separator")
+        git_repo.commit_file("docs: third")
+
+        commits = get_untagged_commits(git_repo)
+
+        assert [c.message for c in commits] == [
+            "feat: first",
+            "fix: odd \x1f separator",
+            "docs: third",
+        ]
+
+    def test_iter_yields_lazily(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: second")
+
+        commits = git_ops.iter_untagged_commits(git_repo)
+
+        assert next(commits).message == "feat: first"
+        commits.close()
+
+    @pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+    def test_iter_can_stop_before_git_log_finishes(self, git_repo):
+        # Far more output than a pipe buffer holds, so git is still writing
+        for i in range(31):
+            git_repo.commit_file(f"feat: change {i}\n\n" + "x" * 20_000)
+
+        commits = git_ops.iter_untagged_commits(git_repo)
+
+        assert next(commits).message.startswith("feat: change 0")
+        commits.close()
+
+        records = git_ops._iter_log_records(
+            git_repo, git_ops._LOG_FIELDS, "HEAD", git_ops._LOG_FORMAT
+        )
+        next(records)
+        records.close()
+
+    def test_iter_raises_git_errors(self, git_repo, monkeypatch):
+        git_repo.commit_file("feat: first")
+        monkeypatch.setattr(git_ops, "get_last_tag", lambda repo: "missing-tag")
+
+        with pytest.raises(git.GitCommandError):
+            list(git_ops.iter_untagged_commits(git_repo))
+
+    def test_count_matches_list(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "v1.0.0")
+        git_repo.commit_file("fix: second")
+        git_repo.commit_file("docs: third")
+
+        assert git_ops.count_untagged_commits(git_repo) == 2
+
+    def test_count_in_empty_repo_is_zero(self, git_repo):
+        assert git_ops.count_untagged_commits(git_repo) == 0
+
+
+class TestLastTagCache:
+    def test_repeated_calls_reuse_result(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "v1.0.0")
+
+        assert get_last_tag(git_repo) == "v1.0.0"
+        with patch("interactive_git_versioneer.core.git_ops._find_last_tag") as find:
+            assert get_last_tag(git_repo) == "v1.0.0"
+        find.assert_not_called()
+
+    def test_new_tag_invalidates(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "v1.0.0")
+        assert get_last_tag(git_repo) == "v1.0.0"
+
+        git_repo.commit_file("feat: second")
+        git_repo.create_tag("v1.1.0")
+
+        assert get_last_tag(git_repo) == "v1.1.0"
+
+    def test_deleted_and_packed_tags_invalidate(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "v1.0.0")
+        git_repo.run("tag", "v2.0.0")
+        assert get_last_tag(git_repo) == "v2.0.0"
+
+        git_repo.run("pack-refs", "--all")
+        git_repo.run("tag", "-d", "v2.0.0")
+
+        assert get_last_tag(git_repo) == "v1.0.0"
+
+    def test_nested_tag_invalidates(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "release/v1.0.0")
+        assert get_last_tag(git_repo) == "release/v1.0.0"
+
+        git_repo.run("tag", "release/v2.0.0")
+
+        assert get_last_tag(git_repo) == "release/v2.0.0"
+
+    def test_unchanged_directory_mtime_still_invalidates(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.run("tag", "v1.0.0")
+        assert get_last_tag(git_repo) == "v1.0.0"
+        tags_dir = os.path.join(git_repo.common_dir, "refs", "tags")
+        before = os.stat(tags_dir)
+
+        git_repo.run("tag", "v1.1.0")
+        # A filesystem with coarse timestamps reports the same mtime
+        os.utime(tags_dir, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        assert get_last_tag(git_repo) == "v1.1.0"
+
+
+class TestGetCommitDiff:
+    def test_matches_git_diff_and_reuses_process(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: second")
+        git_repo.commit_file("docs: third", name="README.md")
+        head, parent = git_repo.head.commit, git_repo.head.commit.parents[0]
+
+        assert get_commit_diff(git_repo, head.hexsha) == git_repo.git.diff(
+            parent.hexsha, head.hexsha
+        )
+        batcher = git_ops._DIFF_BATCHERS[git_repo.git_dir]
+        assert get_commit_diff(git_repo, parent.hexsha) == git_repo.git.diff(
+            parent.parents[0].hexsha, parent.hexsha
+        )
+        assert git_ops._DIFF_BATCHERS[git_repo.git_dir] is batcher
+
+    def test_root_commit_shows_added_files(self, git_repo):
+        git_repo.commit_file("feat: first")
+
+        diff = get_commit_diff(git_repo, git_repo.head.commit.hexsha)
+
+        assert diff.startswith("diff --git a/file.txt b/file.txt")
+        assert "+feat: first" in diff
+
+    def test_short_hash_is_accepted(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: second")
+
+        diff = get_commit_diff(git_repo, git_repo.head.commit.hexsha[:7])
+
+        assert "+fix: second" in diff
+
+    def test_dead_process_falls_back_and_restarts(self, git_repo):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: second")
+        sha = git_repo.head.commit.hexsha
+        expected = get_commit_diff(git_repo, sha)
+        git_ops._DIFF_BATCHERS[git_repo.git_dir]._proc.kill()
+        git_ops._DIFF_BATCHERS[git_repo.git_dir]._proc.wait()
+
+        assert get_commit_diff(git_repo, sha) == expected
+        assert git_repo.git_dir not in git_ops._DIFF_BATCHERS
+        assert get_commit_diff(git_repo, sha) == expected
+        assert git_repo.git_dir in git_ops._DIFF_BATCHERS
+
+    def test_fallback_runs_git_directly(self, git_repo, monkeypatch):
+        git_repo.commit_file("feat: first")
+        git_repo.commit_file("fix: second")
+        root, head = git_repo.head.commit.parents[0], git_repo.head.commit
+        expected = [get_commit_diff(git_repo, c.hexsha) for c in (root, head)]
+        monkeypatch.setattr(git_ops, "_batched_diff", lambda *args: None)
+
+        assert [get_commit_diff(git_repo, c.hexsha) for c in (root, head)] == expected
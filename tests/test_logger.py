@@ -0,0 +1,72 @@
+"""Tests for the debug logger."""
+
+import logging
+
+import pytest
+
+from interactive_git_versioneer.core import logger as logger_mod
+
+
+@pytest.fixture
+def log_home(tmp_path, monkeypatch):
+    """Points ~ at a temp dir and removes any handlers the test adds."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    logger_mod.get_logger.cache_clear()
+    base = logging.getLogger("interactive_git_versioneer")
+    handlers = list(base.handlers)
+    yield tmp_path
+    for handler in base.handlers[:]:
+        if handler not in handlers:
+            base.removeHandler(handler)
+            handler.close()
+    logger_mod.get_logger.cache_clear()
+
+
+class TestGetLogger:
+    def test_disabled_until_first_call(self, log_home):
+        assert not logger_mod.is_logging_enabled()
+
+    def test_returns_one_shared_instance(self, log_home, capsys):
+        base = logging.getLogger("interactive_git_versioneer")
+        before = len(base.handlers)
+
+        first = logger_mod.get_logger()
+        assert logger_mod.get_logger() is first
+        assert logger_mod.is_logging_enabled()
+        assert len(base.handlers) == before + 1
+        assert first.get_log_path().startswith(str(log_home / ".igv_logs"))
+
+
+class TestLazyFormatting:
+    def _read_log(self, logger):
+        for handler in logger.logger.handlers:
+            handler.flush()
+        with open(logger.get_log_path(), encoding="utf-8") as f:
+            return f.read()
+
+    def test_messages_are_formatted_and_truncated(self, log_home, capsys):
+        logger = logger_mod.get_logger()
+        logger.function_enter("run", rebuild=True)
+        logger.function_exit("run", return_value=False)
+        logger.dialog_shown("confirm", "x" * 150)
+        logger.user_input("p" * 80, "s")
+
+        text = self._read_log(logger)
+        assert ">>> ENTRANDO a run(rebuild=True)" in text
+        assert "<<< SALIENDO de run -> False" in text
+        assert "DIÁLOGO MOSTRADO [confirm]: " + "x" * 100 + "\n" in text
+        assert "INPUT: '" + "p" * 50 + "...' -> Respuesta: 's'" in text
+
+    def test_function_enter_skips_params_when_disabled(self, log_home, capsys):
+        logger = logger_mod.get_logger()
+        logger.logger.setLevel(logging.WARNING)
+        try:
+
+            class Exploding:
+                def __str__(self):
+                    raise AssertionError("params formatted while disabled")
+
+            logger.function_enter("run", value=Exploding())
+        finally:
+            logger.logger.setLevel(logging.DEBUG)
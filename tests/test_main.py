@@ -0,0 +1,15 @@
+"""Tests for the igv command-line entry point."""
+
+import subprocess
+import sys
+
+
+def test_import_does_not_load_gitpython():
+    code = (
+        "import sys, interactive_git_versioneer.main; "
+        "print('git' in sys.modules, 'interactive_git_versioneer.tags' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
@@ -0,0 +1,281 @@
+"""Tests for the config menu helpers."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+from interactive_git_versioneer.config import menu
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    menu._MODEL_CACHE.clear()
+    yield
+    menu._MODEL_CACHE.clear()
+
+
+@pytest.fixture
+def settings():
+    with patch.object(
+        menu,
+        "get_config_values",
+        return_value={
+            "OPENAI.baseURL": "https://api.groq.com/openai/v1",
+            "OPENAI.key": "k",
+        },
+    ):
+        yield
+
+
+class TestFetchModelsCached:
+    def test_second_call_uses_cache(self, settings):
+        models = [{"id": "llama"}]
+        with patch(
+            "interactive_git_versioneer.core.ai.list_available_models",
+            return_value=models,
+        ) as mock_list:
+            assert menu._fetch_models_cached() == models
+            assert menu._fetch_models_cached() == models
+        assert mock_list.call_count == 1
+
+    def test_refresh_bypasses_cache(self, settings):
+        with patch(
+            "interactive_git_versioneer.core.ai.list_available_models",
+            return_value=[{"id": "llama"}],
+        ) as mock_list:
+            menu._fetch_models_cached()
+            menu._fetch_models_cached(refresh=True)
+        assert mock_list.call_count == 2
+
+    def test_expired_entry_is_refetched(self, settings):
+        with patch(
+            "interactive_git_versioneer.core.ai.list_available_models",
+            return_value=[{"id": "llama"}],
+        ) as mock_list, patch.object(
+            menu.time, "monotonic", side_effect=[0.0, 301.0, 301.0]
+        ):
+            menu._fetch_models_cached()
+            menu._fetch_models_cached()
+        assert mock_list.call_count == 2
+
+    def test_empty_result_is_not_cached(self, settings):
+        with patch(
+            "interactive_git_versioneer.core.ai.list_available_models",
+            return_value=[],
+        ) as mock_list:
+            menu._fetch_models_cached()
+            menu._fetch_models_cached()
+        assert mock_list.call_count == 2
+
+
+class TestRenderModelPage:
+    MODELS = [
+        {"id": "llama", "context_window": 8192, "owned_by": "Meta", "is_free": True},
+        {"id": "gpt", "context_window": None, "owned_by": "", "is_free": None},
+    ]
+
+    def test_marks_current_model_and_nav(self):
+        text = menu._render_model_page(0, 2, 12, self.MODELS, "gpt")
+        assert "page 1/2" in text
+        gpt_row = next(
+            line for line in text.splitlines() if "gpt" in line and "2  " in line
+        )
+        assert "→" in gpt_row
+        assert "[n] Next" in text
+        assert "[p] Prev" not in text
+        assert "[r] Refresh" in text
+        assert text.endswith("\n")
+
+    def test_picker_renders_each_page_once(self, settings):
+        models = [
+            {"id": f"m{i}", "context_window": None, "owned_by": "", "is_free": None}
+            for i in range(15)
+        ]
+        with patch.object(
+            menu, "_fetch_models_cached", return_value=models
+        ), patch.object(menu, "get_config_value", return_value=None), patch.object(
+            menu, "clear_screen"
+        ), patch(
+            "builtins.input", side_effect=["n", "p", "n", "0"]
+        ), patch.object(
+            menu, "_render_model_page", wraps=menu._render_model_page
+        ) as render:
+            assert menu._select_model_interactive() is None
+        assert render.call_count == 2
+
+
+class TestPaint:
+    def test_writes_lines_in_one_call(self):
+        with patch.object(menu.sys, "stdout") as out:
+            menu._paint(["a", "", "b"])
+        out.write.assert_called_once_with("a\n\nb\n")
+        out.flush.assert_called_once()
+
+
+class TestDetectProvider:
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            (None, "Unknown"),
+            ("https://api.groq.com/openai/v1", "Groq"),
+            ("https://openrouter.ai/api/v1", "OpenRouter"),
+            ("https://api.openai.com/v1", "OpenAI"),
+            ("http://localhost:11434/v1", "Ollama"),
+            ("https://example.com/v1", "Custom"),
+        ],
+    )
+    def test_detects_provider(self, url, expected):
+        assert menu._detect_provider(url) == expected
+
+
+class TestAddAliasUnix:
+    def test_existing_command_skips_subprocess(self, capsys):
+        with patch.object(
+            menu.shutil, "which", return_value="/usr/local/bin/igv"
+        ), patch("subprocess.run") as run:
+            menu._add_alias_unix()
+        run.assert_not_called()
+        assert "/usr/local/bin/igv" in capsys.readouterr().out
+
+
+class TestShellRcAlias:
+    def test_missing_file_has_no_alias(self, tmp_path):
+        assert menu._rc_has_alias(tmp_path / ".bashrc") is False
+
+    def test_detects_alias_in_non_utf8_file(self, tmp_path):
+        rc = tmp_path / ".bashrc"
+        rc.write_bytes(b"# caf\xe9\n" + b"x" * 200000 + b'\nalias igv="igv"\n')
+        assert menu._rc_has_alias(rc) is True
+
+    def test_detects_alias_near_start_of_large_file(self, tmp_path):
+        rc = tmp_path / ".bashrc"
+        rc.write_bytes(b'alias igv="igv"\n' + b"x" * 100000)
+        assert menu._rc_has_alias(rc) is True
+
+    def test_detects_alias_across_tail_boundary(self, tmp_path):
+        rc = tmp_path / ".bashrc"
+        needle = b"alias igv="
+        # Place the needle so it straddles the start of the tail window
+        body = b"x" * 50000 + needle + b"y" * (menu._RC_TAIL_SIZE - 4)
+        rc.write_bytes(body)
+        assert menu._rc_has_alias(rc) is True
+
+    def test_large_file_without_alias(self, tmp_path):
+        rc = tmp_path / ".bashrc"
+        rc.write_bytes(b"alias ls='ls -G'\n" * 20000)
+        assert menu._rc_has_alias(rc) is False
+
+    def test_append_creates_and_extends_file(self, tmp_path):
+        rc = tmp_path / ".zshrc"
+        menu._append_to_rc(rc, "export A=1\n")
+        menu._append_to_rc(rc, 'alias igv="x"\n')
+        assert rc.read_text() == 'export A=1\nalias igv="x"\n'
+        assert menu._rc_has_alias(rc) is True
+
+
+class TestFindIgvExecutable:
+    def test_standard_path_hit_skips_directory_scans(self, tmp_path, monkeypatch):
+        exe = tmp_path / "python" / "Scripts" / "igv.exe"
+        exe.parent.mkdir(parents=True)
+        exe.touch()
+        (tmp_path / "home" / "AppData" / "Local" / "Packages").mkdir(parents=True)
+        monkeypatch.setattr(menu.sys, "executable", str(tmp_path / "python" / "py"))
+        monkeypatch.setattr(menu.Path, "home", lambda: tmp_path / "home")
+
+        with patch.object(menu.Path, "glob") as glob:
+            assert menu._find_igv_executable() == exe
+        glob.assert_not_called()
+
+    def test_user_scripts_location(self, tmp_path, monkeypatch):
+        exe = tmp_path / "AppData" / "Roaming" / "Python" / "Python311"
+        exe = exe / "Scripts" / "igv.exe"
+        exe.parent.mkdir(parents=True)
+        exe.touch()
+        monkeypatch.setattr(menu.sys, "executable", str(tmp_path / "py"))
+        monkeypatch.setattr(menu.Path, "home", lambda: tmp_path)
+
+        assert menu._find_igv_executable() == exe
+
+    def test_microsoft_store_location(self, tmp_path, monkeypatch):
+        pkg = tmp_path / "AppData" / "Local" / "Packages"
+        (pkg / "Microsoft.WindowsTerminal").mkdir(parents=True)
+        exe = pkg / "PythonSoftwareFoundation.Python.3.11_qbz5n2kfra8p0"
+        exe = exe / "LocalCache" / "local-packages" / "Python311" / "Scripts"
+        exe.mkdir(parents=True)
+        exe = exe / "igv.exe"
+        exe.touch()
+        monkeypatch.setattr(menu.sys, "executable", str(tmp_path / "py"))
+        monkeypatch.setattr(menu.Path, "home", lambda: tmp_path)
+
+        assert menu._find_igv_executable() == exe
+
+    def test_not_found(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(menu.sys, "executable", str(tmp_path / "py"))
+        monkeypatch.setattr(menu.Path, "home", lambda: tmp_path)
+
+        assert menu._find_igv_executable() is None
+
+
+class TestWriteStatus:
+    def test_writes_bytes_to_buffer(self):
+        with patch.object(menu.sys, "stdout") as out:
+            out.encoding = "utf-8"
+            menu._write_status("Fetching…")
+        out.buffer.write.assert_called_once_with(
+            menu.Colors.CYAN_B + "Fetching…".encode("utf-8") + menu.Colors.RESET_B
+        )
+        out.buffer.flush.assert_called_once()
+
+    def test_falls_back_to_text_stream(self):
+        with patch.object(menu.sys, "stdout", io.StringIO()) as out:
+            menu._write_status("Fetching")
+        assert out.getvalue() == f"{menu.Colors.CYAN}Fetching{menu.Colors.RESET}"
+
+
+class TestCreatePowershellFunction:
+    @pytest.fixture
+    def profile(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(menu.Path, "home", lambda: tmp_path)
+        return (
+            tmp_path / "Documents" / "PowerShell" / "Microsoft.PowerShell_profile.ps1"
+        )
+
+    def test_appends_function_to_new_profile(self, profile):
+        menu._create_powershell_function()
+        assert "function igv" in profile.read_text(encoding="utf-8")
+
+    def test_existing_function_is_not_added_twice(self, profile):
+        profile.parent.mkdir(parents=True)
+        profile.write_text("Set-Alias ll ls\nfunction igv { }\n", encoding="utf-8")
+        menu._create_powershell_function()
+        assert profile.read_text(encoding="utf-8").count("function igv") == 1
+
+
+class TestSelectModelKeys:
+    MODELS = [
+        {"id": f"m{i}", "context_window": None, "owned_by": "", "is_free": None}
+        for i in range(15)
+    ]
+
+    def _run(self, keys):
+        with patch.object(
+            menu, "_fetch_models_cached", return_value=self.MODELS
+        ), patch.object(menu, "get_config_value", return_value=None), patch.object(
+            menu, "clear_screen"
+        ), patch(
+            "builtins.input", side_effect=keys
+        ):
+            return menu._select_model_interactive()
+
+    def test_number_selects_row_on_current_page(self):
+        assert self._run(["n", "n", "2"]) == "m11"
+
+    def test_prev_on_first_page_stays(self):
+        assert self._run(["p", "1"]) == "m0"
+
+    def test_manual_entry(self):
+        assert self._run(["m", "custom-model"]) == "custom-model"
+
+    def test_empty_input_cancels(self):
+        assert self._run([""]) is None
@@ -1,5 +1,9 @@
 """Tests for the models module."""
 
+import sys
+
+import pytest
+
 from interactive_git_versioneer.core.models import Commit
 
 
@@ -49,3 +53,11 @@ class TestCommit:
         assert commit.version_type == "minor"
         assert commit.processed is True
         assert commit.custom_message == "Updated message"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_commit_has_no_instance_dict(self):
+        commit = Commit(hash="abc", message="m", author="a", date="2024-01-15")
+
+        assert not hasattr(commit, "__dict__")
+        with pytest.raises(AttributeError):
+            commit.unknown = 1
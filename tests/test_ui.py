@@ -0,0 +1,172 @@
+"""Tests for the terminal UI helpers."""
+
+import pytest
+
+from interactive_git_versioneer.core import ui
+from interactive_git_versioneer.core.ui import Colors
+
+
+@pytest.fixture
+def colors_on():
+    enabled = Colors.RESET != ""
+    ui.set_colors_enabled(True)
+    yield
+    ui.set_colors_enabled(enabled)
+
+
+@pytest.fixture
+def colors_off():
+    enabled = Colors.RESET != ""
+    ui.set_colors_enabled(False)
+    yield
+    ui.set_colors_enabled(enabled)
+
+
+class TestColorsCombine:
+    def test_merges_color_constants(self, colors_on):
+        assert Colors.combine(Colors.BOLD, Colors.WHITE) == "\033[1;97m"
+
+    def test_accepts_raw_parameters(self):
+        assert Colors.combine("47", "30") == "\033[47;30m"
+
+    def test_disabled_colors_combine_to_nothing(self, colors_off):
+        assert Colors.combine(Colors.BOLD, Colors.WHITE) == ""
+
+
+class TestColorMode:
+    def test_disabled_blanks_text_and_bytes(self, colors_off):
+        assert Colors.CYAN == ""
+        assert Colors.RESET_B == b""
+
+    def test_enabled_restores_codes(self, colors_on):
+        assert Colors.CYAN == "\033[96m"
+        assert Colors.CYAN_B == b"\033[96m"
+
+    @pytest.mark.parametrize(
+        "env,isatty,expected",
+        [
+            ({}, True, True),
+            ({}, False, False),
+            ({"NO_COLOR": "1"}, True, False),
+            ({"FORCE_COLOR": "1"}, False, True),
+        ],
+    )
+    def test_detection(self, monkeypatch, env, isatty, expected):
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.setattr(ui.sys.stdout, "isatty", lambda: isatty)
+        assert ui._colors_enabled() is expected
+
+
+class TestClearScreen:
+    def test_writes_escape_sequence_without_subprocess(self, monkeypatch, capsys):
+        monkeypatch.setattr(ui.platform, "system", lambda: "Linux")
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(ui.os, "system", lambda cmd: pytest.fail("spawned " + cmd))
+            ui.clear_screen()
+
+        assert capsys.readouterr().out == "\033[H\033[2J\033[3J"
+
+    def test_windows_without_ansi_uses_cls(self, monkeypatch, capsys):
+        calls = []
+        monkeypatch.setattr(ui.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(ui, "_windows_vt_enabled", None)
+        monkeypatch.setattr(ui, "_enable_windows_vt", lambda: False)
+        monkeypatch.setattr(ui.os, "system", calls.append)
+
+        ui.clear_screen()
+        ui.clear_screen()
+
+        assert calls == ["cls", "cls"]
+        assert capsys.readouterr().out == ""
+
+    def test_windows_with_ansi_checks_console_once(self, monkeypatch, capsys):
+        checks = []
+        monkeypatch.setattr(ui.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(ui, "_windows_vt_enabled", None)
+        monkeypatch.setattr(ui, "_enable_windows_vt", lambda: checks.append(1) or True)
+
+        ui.clear_screen()
+        ui.clear_screen()
+
+        assert checks == [1]
+        assert capsys.readouterr().out == "\033[H\033[2J\033[3J" * 2
+
+
+class _FakeMsvcrt:
+    """Stand-in for msvcrt that hands out a fixed sequence of key presses."""
+
+    def __init__(self, keys):
+        self._keys = iter(keys)
+
+    def getwch(self):
+        return next(self._keys)
+
+    def kbhit(self):
+        raise AssertionError("input must block on getwch(), not poll kbhit()")
+
+
+class TestWindowsInput:
+    def test_wait_blocks_on_getwch(self, monkeypatch, capsys):
+        monkeypatch.setattr(ui, "msvcrt", _FakeMsvcrt("z\r"), raising=False)
+        assert ui._wait_windows() == "continue"
+
+    def test_get_input_reads_line(self, monkeypatch, capsys):
+        keys = ["a", "b", "x", "\x08", "\r"]
+        monkeypatch.setattr(ui, "msvcrt", _FakeMsvcrt(keys), raising=False)
+        assert ui._get_input_windows() == "ab"
+
+    def test_get_input_ctrl_c_interrupts(self, monkeypatch, capsys):
+        monkeypatch.setattr(ui, "msvcrt", _FakeMsvcrt("a\x03"), raising=False)
+        with pytest.raises(KeyboardInterrupt):
+            ui._get_input_windows()
+
+
+class TestMenuShow:
+    @pytest.fixture
+    def menu(self, monkeypatch):
+        monkeypatch.setattr(ui, "clear_screen", lambda: None)
+        monkeypatch.setattr(ui, "get_menu_input", lambda prompt: "1")
+        menu = ui.Menu("Título", width=10)
+        menu.add_item("1", "Uno", lambda: None)
+        menu.add_item("2", "Dos", lambda: None)
+        return menu
+
+    def test_layout(self, menu, colors_off, capsys):
+        menu.set_status_callback(lambda: print("estado"))
+        menu.set_footer_callback(lambda: "pie")
+
+        assert menu.show() == "1"
+        border = "═" * 10
+        expected = [
+            "",
+            border,
+            "  Título  ",
+            border,
+            "",
+            "estado",
+            "",
+            "1. Uno",
+            "2. Dos",
+            "",
+            "[Supr/Esc: Volver | q+Enter: Salir]",
+            "pie",
+            border,
+            "",
+            "",
+        ]
+        assert capsys.readouterr().out == "\n".join(expected)
+
+    def test_header_built_once(self, menu, colors_off, capsys):
+        menu.show()
+        frame = menu._frame_cache
+        menu.show()
+        assert menu._frame_cache is frame
+
+    def test_header_follows_color_mode(self, menu, colors_off, capsys):
+        menu.show()
+        ui.set_colors_enabled(True)
+        menu.show()
+        assert Colors.CYAN in menu._frame()[0]
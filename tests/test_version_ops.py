@@ -0,0 +1,288 @@
+"""Tests for the pyproject/CHANGELOG version helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from interactive_git_versioneer.core import version_ops
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A fake repository whose working_dir is an empty temp directory."""
+    return SimpleNamespace(working_dir=str(tmp_path), root=tmp_path)
+
+
+class TestIsValidSemver:
+    @pytest.mark.parametrize(
+        "version", ["1.0.0", "0.0.1", "10.20.30", "1.2.3-alpha.1", "1.2.3-rc.1+build.2"]
+    )
+    def test_valid(self, version):
+        assert version_ops.is_valid_semver(version)
+
+    @pytest.mark.parametrize(
+        "version",
+        ["", "1.2", "v1.2.3", "01.2.3", "1.2.3-", "1.2.3-01", "1.2.3\n", "١.٢.٣"],
+    )
+    def test_invalid(self, version):
+        assert not version_ops.is_valid_semver(version)
+
+    def test_long_prerelease_is_rejected(self):
+        assert not version_ops.is_valid_semver("1.0.0-" + "a." * 50000 + "!")
+
+
+class TestVersionTuple:
+    @pytest.mark.parametrize(
+        "version, expected",
+        [
+            ("1.2.3", (1, 2, 3)),
+            ("10.0.1", (10, 0, 1)),
+            ("1.2.3-alpha.1", (1, 2, 3)),
+            ("v1.2.3", (0, 0, 0)),
+            ("1.2", (0, 0, 0)),
+            ("", (0, 0, 0)),
+        ],
+    )
+    def test_parses(self, version, expected):
+        assert version_ops.version_tuple(version) == expected
+
+    def test_orders_numerically(self):
+        assert version_ops.version_tuple("1.10.0") > version_ops.version_tuple("1.9.9")
+
+
+@pytest.mark.parametrize(
+    "version, expected",
+    [("v1.2.3", "1.2.3"), ("1.2.3", "1.2.3"), ("vv1.0.0", "v1.0.0")],
+)
+def test_strip_v_removes_single_prefix(version, expected):
+    assert version_ops._strip_v(version) == expected
+
+
+class TestChangelogVersions:
+    def test_lists_versions_newest_first_without_unreleased(self, project):
+        (project.root / "CHANGELOG.md").write_text(
+            "# Changelog\n\n## [Unreleased]\n\n## [v1.1.0] - 2024-01-02\n\n"
+            "## [1.0.0] - 2024-01-01\n",
+            encoding="utf-8",
+        )
+
+        assert version_ops.get_changelog_versions(project) == ["v1.1.0", "1.0.0"]
+        assert version_ops.get_last_changelog_version(project) == "1.1.0"
+
+    def test_only_level_two_headings_count(self, project):
+        (project.root / "CHANGELOG.md").write_text(
+            "##[2.0.0]\n### [not-a-version]\n- see ## [1.5.0]\n## [1.0.0]\n",
+            encoding="utf-8",
+        )
+
+        assert version_ops.get_changelog_versions(project) == ["2.0.0", "1.0.0"]
+
+    def test_parse_is_cached_until_file_changes(self, project):
+        changelog = project.root / "CHANGELOG.md"
+        changelog.write_text("## [1.0.0]\n", encoding="utf-8")
+        version_ops.get_changelog_versions(project)
+        misses = version_ops._parse_changelog.cache_info().misses
+
+        assert version_ops.get_last_changelog_version(project) == "1.0.0"
+        assert version_ops._parse_changelog.cache_info().misses == misses
+
+        changelog.write_text("## [1.1.0]\n\n## [1.0.0]\n", encoding="utf-8")
+        assert version_ops.get_changelog_versions(project) == ["1.1.0", "1.0.0"]
+
+    def test_missing_changelog(self, project):
+        assert version_ops.get_changelog_versions(project) == []
+        assert version_ops.get_last_changelog_version(project) is None
+
+
+class TestPyprojectVersion:
+    def test_reads_and_updates_version(self, project):
+        pyproject = project.root / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nname = "demo"\nversion = "1.0.0"\n\n'
+            '[tool.demo]\ntarget-version = "py37"\n',
+            encoding="utf-8",
+        )
+
+        assert version_ops.get_current_version(project.root) == "1.0.0"
+        assert version_ops.update_version_in_pyproject(project.root, "1.1.0")
+        assert version_ops.get_current_version(project.root) == "1.1.0"
+        assert 'target-version = "py37"' in pyproject.read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[project]\nname = 'demo'\nversion = '1.2.3'\n",
+            '[tool.other]\nversion = "9.9"\n\n[project]\nversion = "1.2.3"\n',
+            '[tool.poetry]\nname = "demo"\nversion = "1.2.3"\n',
+            'version = "1.2.3"\nnot toml [\n',
+        ],
+        ids=["single-quotes", "project-table", "poetry", "invalid-toml"],
+    )
+    def test_reads_version(self, project, content):
+        (project.root / "pyproject.toml").write_text(content, encoding="utf-8")
+
+        assert version_ops.get_current_version(project.root) == "1.2.3"
+
+    def test_update_only_rewrites_first_version_line(self, project):
+        pyproject = project.root / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nversion = "1.0.0"  # bump\n\n[tool.other]\nversion = "3.11"\n',
+            encoding="utf-8",
+        )
+
+        assert version_ops.update_version_in_pyproject(project.root, "2.0.0")
+        assert pyproject.read_text(encoding="utf-8") == (
+            '[project]\nversion = "2.0.0"  # bump\n\n[tool.other]\nversion = "3.11"\n'
+        )
+        assert [p.name for p in project.root.iterdir()] == ["pyproject.toml"]
+
+    @pytest.mark.parametrize(
+        "before, after",
+        [
+            (
+                '[tool.other]\nversion = "3.11"\n\n[project]\nversion = "1.0.0"\n',
+                '[tool.other]\nversion = "3.11"\n\n[project]\nversion = "2.0.0"\n',
+            ),
+            (
+                '[project]\nname = "x"\ndynamic = ["version"]\n\n'
+                '[tool.poetry]\nversion = "1.0.0"\n',
+                '[project]\nname = "x"\ndynamic = ["version"]\n\n'
+                '[tool.poetry]\nversion = "2.0.0"\n',
+            ),
+            ('version = "1.0.0"\n', 'version = "2.0.0"\n'),
+        ],
+        ids=["after-other-table", "poetry", "no-tables"],
+    )
+    def test_update_targets_version_table(self, project, before, after):
+        pyproject = project.root / "pyproject.toml"
+        pyproject.write_text(before, encoding="utf-8")
+
+        assert version_ops.update_version_in_pyproject(project.root, "2.0.0")
+        assert pyproject.read_text(encoding="utf-8") == after
+        assert version_ops.get_current_version(project.root) == "2.0.0"
+
+    def test_update_keeps_single_quotes(self, project):
+        pyproject = project.root / "pyproject.toml"
+        pyproject.write_text("[project]\nversion='1.0.0'\n", encoding="utf-8")
+
+        assert version_ops.get_current_version(project.root) == "1.0.0"
+        assert version_ops.update_version_in_pyproject(project.root, "1.1.0")
+        assert pyproject.read_text(encoding="utf-8") == "[project]\nversion='1.1.0'\n"
+        assert version_ops.get_current_version(project.root) == "1.1.0"
+
+    def test_update_without_version_line_leaves_file_untouched(self, project):
+        pyproject = project.root / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "demo"\n', encoding="utf-8")
+        mtime = pyproject.stat().st_mtime_ns
+
+        assert not version_ops.update_version_in_pyproject(project.root, "2.0.0")
+        assert pyproject.stat().st_mtime_ns == mtime
+
+    def test_current_version_is_cached_until_file_changes(self, project, monkeypatch):
+        pyproject = project.root / "pyproject.toml"
+        pyproject.write_text('[project]\nversion = "1.0.0"\n', encoding="utf-8")
+        calls = []
+        real = version_ops._read_toml_version
+        monkeypatch.setattr(
+            version_ops,
+            "_read_toml_version",
+            lambda path: calls.append(path) or real(path),
+        )
+
+        assert version_ops.get_current_version(project.root) == "1.0.0"
+        assert version_ops.get_current_version(project.root) == "1.0.0"
+        assert len(calls) == 1
+
+        pyproject.write_text('[project]\nversion = "10.0.0"\n', encoding="utf-8")
+        assert version_ops.get_current_version(project.root) == "10.0.0"
+        assert len(calls) == 2
+
+    def test_missing_pyproject(self, project, capsys):
+        assert version_ops.get_current_version(project.root) is None
+        assert not version_ops.update_version_in_pyproject(project.root, "1.1.0")
+
+
+class TestSuggestedVersion:
+    def test_prefers_changelog_without_querying_tags(self, project, monkeypatch):
+        (project.root / "CHANGELOG.md").write_text("## [v1.4.0]\n", encoding="utf-8")
+
+        def fail(repo):
+            raise AssertionError("tags queried although the changelog has a version")
+
+        monkeypatch.setattr(version_ops, "get_last_tag", fail)
+
+        assert version_ops.get_suggested_version(project, "1.0.0") == "1.4.0"
+
+    @pytest.mark.parametrize("tag, expected", [("v2.1.0", "2.1.0"), (None, "0.0.1")])
+    def test_falls_back_to_last_tag(self, project, monkeypatch, tag, expected):
+        monkeypatch.setattr(version_ops, "get_last_tag", lambda repo: tag)
+
+        assert version_ops.get_suggested_version(project, "1.0.0") == expected
+
+
+class TestActionUpdateProjectVersion:
+    @pytest.fixture
+    def run_action(self, project, monkeypatch, capsys):
+        """Runs the action with scripted answers and returns (result, output)."""
+        monkeypatch.setattr(version_ops, "clear_screen", lambda: None)
+        monkeypatch.setattr(version_ops, "wait_for_enter", lambda: None)
+        monkeypatch.setattr(version_ops, "get_last_tag", lambda repo: "v1.1.0")
+        (project.root / "pyproject.toml").write_text(
+            '[project]\nversion = "1.0.0"\n', encoding="utf-8"
+        )
+        (project.root / "CHANGELOG.md").write_text(
+            "## [Unreleased]\n\n## [v1.2.0]\n\n## [v1.1.0]\n", encoding="utf-8"
+        )
+
+        def run(*answers):
+            replies = iter(answers)
+            monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+            result = version_ops.action_update_project_version(project)
+            return result, capsys.readouterr().out
+
+        return run
+
+    def test_accepting_suggestion_updates_pyproject(self, project, run_action):
+        result, out = run_action("")
+
+        assert result is False
+        assert version_ops.get_current_version(project.root) == "1.2.0"
+        assert "Último changelog: 1.2.0 (2 versiones registradas)" in out
+        assert "Último tag: 1.1.0" in out
+        assert "pyproject.toml (1.0.0) está atrasado del CHANGELOG (1.2.0)" in out
+        assert "CHANGELOG (1.2.0) adelantado del último tag (1.1.0)" in out
+        assert "Versión sugerida: " in out
+
+    def test_invalid_then_cancel(self, project, run_action):
+        result, out = run_action("1.2", "c")
+
+        assert result is False
+        assert "no es un formato SemVer válido" in out
+        assert "Actualización de versión cancelada." in out
+        assert version_ops.get_current_version(project.root) == "1.0.0"
+
+    def test_version_ahead_of_changelog_needs_override(self, project, run_action):
+        result, out = run_action("2.0.0", "n")
+
+        assert "La versión 2.0.0 NO está en el CHANGELOG" in out
+        assert version_ops.get_current_version(project.root) == "1.0.0"
+
+    def test_suggestion_is_validated_once(self, project, run_action, monkeypatch):
+        calls = []
+        real = version_ops.is_valid_semver
+
+        def counting(version):
+            calls.append(version)
+            return real(version)
+
+        monkeypatch.setattr(version_ops, "is_valid_semver", counting)
+        run_action("1.2", "")
+
+        assert calls == ["1.2.0", "1.2"]
+        assert version_ops.get_current_version(project.root) == "1.2.0"
+
+    def test_older_version_missing_from_changelog_warns(self, project, run_action):
+        result, out = run_action("0.9.0", "n")
+
+        assert "Advertencia: La versión 0.9.0 no está en el CHANGELOG" in out
+        assert version_ops.get_current_version(project.root) == "1.0.0"